@@ -0,0 +1,220 @@
+"""
+Classroom Replay
+Replays many students' click scripts in one process and records memory, CPU and rerun latency
+
+Each simulated student is an AppTest session driven from its own thread, so
+every student's session state lives in this one process and the memory figures
+are what a single container would hold for a class that size. AppTest swaps a
+process-wide mock runtime in for each run, though, so only one rerun runs at a
+time: this is not a load or concurrency test, and its latencies say nothing
+about how the server copes with simultaneous clicks. "Rerun" latency is one
+rerun on its own; "queued" latency adds the wait for the reruns in line ahead
+of it.
+
+Usage (from the repository root):
+    python benchmarks/load_test.py --sessions 30
+    python benchmarks/load_test.py --sessions 60 --rounds 2 --think 1.0 --json load.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import warnings
+
+from run_benchmarks import percentile
+from scenarios import SCENARIOS, BenchSession
+
+# What a typical student does in one round, in order
+CLASSROOM_SCRIPT = [
+    "open_every_tab",
+    "arithmetic_sweep",
+    "grade_sweep",
+    "string_index_map",
+    "append_50_list_items",
+    "while_loop_100",
+]
+
+# AppTest installs a global mock Runtime for the duration of each run, so runs take turns
+_app_lock = threading.Lock()
+
+class LoadSession(BenchSession):
+    """BenchSession that waits its turn for the app lock and records the time including the wait"""
+
+    def __init__(self):
+        self.queued = []
+        super().__init__()
+
+    def run(self, widget=None):
+        start = time.perf_counter()
+        with _app_lock:
+            super().run(widget)
+        self.queued.append((time.perf_counter() - start) * 1000)
+
+def rss_mb():
+    """Resident memory of this process in MB"""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Not Linux: fall back to the peak (kilobytes on Linux/BSD, bytes on macOS)
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+class ResourceMonitor(threading.Thread):
+    """Samples CPU usage and RSS of this process until stopped"""
+
+    def __init__(self, interval=0.5):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        last_wall = time.perf_counter()
+        last_cpu = sum(os.times()[:2])
+        while not self.stopped.wait(self.interval):
+            wall = time.perf_counter()
+            cpu = sum(os.times()[:2])
+            self.samples.append({
+                'cpu_pct': (cpu - last_cpu) / (wall - last_wall) * 100,
+                'rss_mb': rss_mb()
+            })
+            last_wall, last_cpu = wall, cpu
+
+def latency_summary(values):
+    """p50/p95/p99/max of a list of latencies in ms"""
+    if not values:
+        return {'p50': None, 'p95': None, 'p99': None, 'max': None}
+    return {
+        'p50': round(percentile(values, 50), 1),
+        'p95': round(percentile(values, 95), 1),
+        'p99': round(percentile(values, 99), 1),
+        'max': round(max(values), 1),
+    }
+
+def student(index, script, rounds, think, results, start_gate):
+    """One simulated student: replays the click script with think time between steps"""
+    rng = random.Random(index)
+    start_gate.wait()
+    record = {'timings': [], 'queued': [], 'errors': 0}
+    try:
+        session = LoadSession()
+        for _ in range(rounds):
+            for name in script:
+                time.sleep(rng.uniform(0, 2 * think))
+                try:
+                    SCENARIOS[name](session)
+                except Exception:
+                    record['errors'] += 1
+        # The first run is the initial page load
+        record['timings'] = session.timings[1:]
+        record['queued'] = session.queued[1:]
+        record['page_load_ms'] = session.queued[0]
+    except Exception:
+        record['errors'] += 1
+    results[index] = record
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a classroom of sessions in one process, one rerun at a time")
+    parser.add_argument("--sessions", type=int, default=30, help="simulated students (default: 30)")
+    parser.add_argument("--rounds", type=int, default=1, help="times each student repeats the script")
+    parser.add_argument("--think", type=float, default=0.5,
+                        help="average pause between scenarios in seconds (default: 0.5)")
+    parser.add_argument("--ramp", type=float, default=5.0,
+                        help="spread session starts over this many seconds (default: 5)")
+    parser.add_argument("--script", default=",".join(CLASSROOM_SCRIPT),
+                        help="comma-separated scenario names each student replays")
+    parser.add_argument("--json", help="also write the summary to this file")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+
+    script = [name.strip() for name in args.script.split(",") if name.strip()]
+    unknown = [name for name in script if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    # Import every concept module first so the per-session figure excludes them
+    SCENARIOS["open_every_tab"](LoadSession())
+    idle_rss = rss_mb()
+    monitor = ResourceMonitor()
+    monitor.start()
+
+    results = [None] * args.sessions
+    threads = []
+    started = time.perf_counter()
+    for index in range(args.sessions):
+        gate = threading.Event()
+        thread = threading.Thread(target=student,
+                                  args=(index, script, args.rounds, args.think, results, gate))
+        thread.start()
+        threads.append((thread, gate))
+
+    for thread, gate in threads:
+        gate.set()
+        time.sleep(args.ramp / max(args.sessions, 1))
+
+    for thread, _ in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    monitor.stopped.set()
+    monitor.join()
+
+    timings = [t for record in results for t in record['timings']]
+    queued = [t for record in results for t in record['queued']]
+    page_loads = [record['page_load_ms'] for record in results if 'page_load_ms' in record]
+    samples = monitor.samples or [{'cpu_pct': 0.0, 'rss_mb': rss_mb()}]
+    peak_rss = max(sample['rss_mb'] for sample in samples)
+
+    summary = {
+        'sessions': args.sessions,
+        'rounds': args.rounds,
+        'script': script,
+        'elapsed_s': round(elapsed, 1),
+        'reruns': len(timings),
+        'reruns_per_s': round(len(timings) / elapsed, 1),
+        'errors': sum(record['errors'] for record in results),
+        'rerun_ms': latency_summary(timings),
+        'queued_ms': latency_summary(queued),
+        'page_load_p95_ms': round(percentile(page_loads, 95), 1) if page_loads else None,
+        'cpu_pct': {
+            'mean': round(sum(s['cpu_pct'] for s in samples) / len(samples), 1),
+            'peak': round(max(s['cpu_pct'] for s in samples), 1),
+        },
+        'rss_mb': {
+            'idle': round(idle_rss, 1),
+            'peak': round(peak_rss, 1),
+            'per_session': round((peak_rss - idle_rss) / args.sessions, 2),
+        },
+    }
+
+    print(f"Replayed {args.sessions} sessions x {args.rounds} round(s) in {summary['elapsed_s']}s, "
+          f"{summary['reruns']} reruns one at a time ({summary['reruns_per_s']}/s), {summary['errors']} errors")
+    for kind in ('rerun', 'queued'):
+        latency = summary[f'{kind}_ms']
+        print(f"{kind.capitalize():8} latency ms: p50 {latency['p50']}  p95 {latency['p95']}  "
+              f"p99 {latency['p99']}  max {latency['max']}")
+    print(f"Page load p95 ms: {summary['page_load_p95_ms']}")
+    print(f"CPU %: mean {summary['cpu_pct']['mean']}  peak {summary['cpu_pct']['peak']}")
+    print(f"RSS MB: idle {summary['rss_mb']['idle']}  peak {summary['rss_mb']['peak']}  "
+          f"per session {summary['rss_mb']['per_session']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+
+    return 1 if summary['errors'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
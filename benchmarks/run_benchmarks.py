@@ -0,0 +1,124 @@
+"""
+Rerun Latency Benchmarks
+Replays every scenario headlessly and compares p50/p95 latency and element counts to a baseline
+
+Usage (from the repository root, no browser or network needed):
+    python benchmarks/run_benchmarks.py                   # compare against baselines.json
+    python benchmarks/run_benchmarks.py --update-baseline # record new baselines
+    python benchmarks/run_benchmarks.py --only lists      # scenarios whose name contains "lists"
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import warnings
+
+import streamlit
+
+from scenarios import SCENARIOS, BenchSession
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def run_scenario(scenario, repeat):
+    """Run a scenario in `repeat` fresh sessions and summarize its rerun latencies"""
+    timings = []
+    elements = 0
+    for _ in range(repeat):
+        session = BenchSession()
+        scenario(session)
+        # The first run is the initial page load, not an interaction
+        timings.extend(session.timings[1:])
+        elements = max(elements, session.element_count())
+
+    return {
+        'reruns': len(timings),
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'max_ms': round(max(timings), 2),
+        'elements': elements
+    }
+
+def load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as f:
+        return json.load(f).get('scenarios', {})
+
+def save_baselines(results):
+    data = {
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'machine': platform.machine(),
+        'scenarios': results
+    }
+    with open(BASELINE_PATH, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def compare(result, baseline, tolerance):
+    """Return a list of regressions of result against its baseline"""
+    problems = []
+    for metric in ('p95_ms', 'elements'):
+        limit = baseline[metric] * (1 + tolerance)
+        if result[metric] > limit:
+            problems.append(f"{metric} {result[metric]} > {baseline[metric]} (+{tolerance:.0%})")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless rerun-latency benchmarks for app.py")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="fresh sessions per scenario (default: 3)")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown or growth over the baseline (default: 0.25)")
+    parser.add_argument("--only", default="",
+                        help="run only scenarios whose name contains this text")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write the results to baselines.json instead of comparing")
+    args = parser.parse_args()
+
+    # AppTest logs a warning per rerun when run outside `streamlit run`
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+
+    baselines = load_baselines()
+    results = {}
+    regressions = 0
+
+    print(f"{'scenario':24} {'reruns':>6} {'p50 ms':>8} {'p95 ms':>8} {'elements':>9}  vs baseline")
+    for name, scenario in SCENARIOS.items():
+        if args.only not in name:
+            continue
+
+        result = run_scenario(scenario, args.repeat)
+        results[name] = result
+
+        if args.update_baseline:
+            status = "recorded"
+        elif name not in baselines:
+            status = "no baseline"
+        else:
+            problems = compare(result, baselines[name], args.tolerance)
+            regressions += bool(problems)
+            status = "REGRESSION: " + "; ".join(problems) if problems else "ok"
+
+        print(f"{name:24} {result['reruns']:>6} {result['p50_ms']:>8} {result['p95_ms']:>8} "
+              f"{result['elements']:>9}  {status}")
+
+    if args.update_baseline:
+        save_baselines({**baselines, **results})
+        print(f"\nBaselines written to {BASELINE_PATH}")
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Benchmark Scenarios
+Scripted classroom interactions replayed against app.py through Streamlit's AppTest
+"""
+
+import os
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "app.py")
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import visualizations  # noqa: E402  (needs REPO_ROOT on sys.path)
+
+class BenchSession:
+    """One simulated browser session that times every rerun it triggers"""
+
+    def __init__(self, timeout=60):
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.timings = []
+        self.run()
+
+    def run(self, widget=None):
+        """Rerun the app (after changing widget, if given) and record the latency"""
+        start = time.perf_counter()
+        (widget or self.at).run()
+        self.timings.append((time.perf_counter() - start) * 1000)
+        if self.at.exception:
+            raise RuntimeError(self.at.exception[0].value)
+
+    def widget(self, kind, key=None, label=None):
+        """Find a widget by key, or by label for widgets that have no key"""
+        if key is not None:
+            return getattr(self.at, kind)(key=key)
+        for found in getattr(self.at, kind):
+            if found.label == label:
+                return found
+        raise LookupError(f"No {kind} labelled {label!r}")
+
+    def open(self, concept):
+        self.run(self.at.radio(key="active_concept").set_value(concept))
+
+    def set(self, kind, value, key=None, label=None):
+        self.run(self.widget(kind, key, label).set_value(value))
+
+    def click(self, key=None, label=None):
+        self.run(self.widget("button", key, label).click())
+
+    def element_count(self):
+        """Leaf elements currently on the page"""
+        return _count_elements(self.at._tree)
+
+def _count_elements(node):
+    if isinstance(node, Block):
+        return sum(_count_elements(child) for child in node.children.values())
+    return 1
+
+# ============================================
+# SCENARIOS
+# ============================================
+
+def open_every_tab(session):
+    """Visit all sixteen concepts in navigation order"""
+    for concept in visualizations.CONCEPTS:
+        session.open(concept)
+
+def add_20_variables(session):
+    session.open("variables_memory")
+    for i in range(20):
+        session.widget("text_input", label="Variable Name").set_value(f"var_{i}")
+        session.widget("text_input", label="Value").set_value(str(i * 7))
+        session.click(label="💾 Save")
+
+def append_50_list_items(session):
+    session.open("lists")
+    for i in range(50):
+        session.set("text_input", f"item{i}", key="append_item")
+        session.click(label="➕ Append")
+
+def while_loop_100(session):
+    session.open("loops")
+    session.set("radio", "Count Up", key="while_example")
+    session.set("number_input", 0, key="cu_start")
+    session.set("number_input", 100, key="cu_target")
+    session.click(key="run_while_up")
+
+def for_range_100(session):
+    session.open("loops")
+    session.set("radio", "Range", key="for_type")
+    session.set("number_input", 0, key="range_start")
+    session.set("number_input", 100, key="range_end")
+    session.click(key="run_for_range")
+
+def string_index_map(session):
+    session.open("strings")
+    session.set("text_input", "The quick brown fox jumps over the lazy dog", key="text_for_index")
+    session.click(key="access_char_btn")
+
+def arithmetic_sweep(session):
+    session.open("operators")
+    for operator in ["+", "-", "*", "/", "//", "%", "**"]:
+        session.set("selectbox", operator, key="arith_op")
+
+def grade_sweep(session):
+    session.open("conditionals")
+    for score in [55, 65, 75, 85, 95]:
+        session.set("slider", score, key="grade_score")
+        session.click(key="calc_grade_btn")
+
+# Name -> scenario, in the order they are run and reported
+SCENARIOS = {
+    "open_every_tab": open_every_tab,
+    "add_20_variables": add_20_variables,
+    "append_50_list_items": append_50_list_items,
+    "while_loop_100": while_loop_100,
+    "for_range_100": for_range_100,
+    "string_index_map": string_index_map,
+    "arithmetic_sweep": arithmetic_sweep,
+    "grade_sweep": grade_sweep,
+}
@@ -0,0 +1,61 @@
+// Scroll buttons for the concept navigation strip.
+// Loaded once per page into the main document (see app.py); a MutationObserver
+// re-attaches the buttons whenever Streamlit re-renders the strip.
+(function () {
+    if (window.__tabScrollerInstalled) {
+        return;
+    }
+    window.__tabScrollerInstalled = true;
+
+    const STRIP_SELECTOR = '.st-key-active_concept div[role="radiogroup"]';
+    const SCROLL_AMOUNT = 300;
+
+    function scrollTabs(tabList, direction) {
+        const amount = direction === 'left' ? -SCROLL_AMOUNT : SCROLL_AMOUNT;
+        tabList.scrollBy({ left: amount, behavior: 'smooth' });
+    }
+
+    function makeButton(id, label, tabList, direction) {
+        const button = document.createElement('button');
+        button.id = id;
+        button.type = 'button';
+        button.innerHTML = label;
+        button.onclick = () => scrollTabs(tabList, direction);
+        return button;
+    }
+
+    function attachButtons() {
+        const tabList = document.querySelector(STRIP_SELECTOR);
+        if (!tabList) {
+            return;
+        }
+
+        const container = tabList.parentElement;
+        if (container.querySelector('#tab-scroll-left')) {
+            return;
+        }
+
+        // Buttons from an earlier render of the strip are stale
+        document.querySelectorAll('#tab-scroll-left, #tab-scroll-right').forEach((el) => el.remove());
+
+        container.style.position = 'relative';
+        container.appendChild(makeButton('tab-scroll-left', '◀', tabList, 'left'));
+        container.appendChild(makeButton('tab-scroll-right', '▶', tabList, 'right'));
+    }
+
+    // Batch DOM mutations into at most one check per animation frame
+    let pending = false;
+    const observer = new MutationObserver(() => {
+        if (pending) {
+            return;
+        }
+        pending = true;
+        window.requestAnimationFrame(() => {
+            pending = false;
+            attachButtons();
+        });
+    });
+
+    observer.observe(document.body, { childList: true, subtree: true });
+    attachButtons();
+})();
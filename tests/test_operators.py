@@ -0,0 +1,37 @@
+"""
+Operators Tests
+Clicks through the operators page with Streamlit's AppTest
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+def _button(at, label):
+    return next(button for button in at.button if button.label == label)
+
+def _operators_page():
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    at.radio(key="active_concept").set_value("operators").run()
+    return at
+
+def test_reset_to_10():
+    at = _operators_page()
+    at.selectbox(key="assign_op").set_value("+=").run()
+    _button(at, "✅ Apply").click().run()
+    assert not at.exception
+    assert at.session_state["assign_var"] == 13
+
+    _button(at, "🔄 Reset to 10").click().run()
+    assert not at.exception
+    assert at.session_state["assign_var"] == 10
+
+def test_apply_shows_no_error():
+    at = _operators_page()
+    _button(at, "✅ Apply").click().run()
+    assert not at.exception
+    assert at.session_state["assign_var"] == 3
+    assert not [error.value for error in at.error if error.value.startswith("Error:")]
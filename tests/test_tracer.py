@@ -0,0 +1,35 @@
+"""
+Tracer Tests
+Snippets the tracer must refuse before running them
+"""
+
+import pytest
+
+from visualizations.core import tracer
+
+ESCAPES = [
+    "g = (x for x in [])\ng.gi_frame.f_back.f_back.f_globals['sys'].modules['os']",
+    "g = (x for x in [])\nframe = g.gi_frame",
+    "g = (x for x in [])\ncode = g.gi_code.co_consts",
+    "def f():\n    pass\nf.co_code",
+    "try:\n    1 / 0\nexcept ZeroDivisionError as error:\n    t = error.tb_frame",
+    "async def f():\n    pass\nf().cr_frame.f_locals",
+    "async def f():\n    yield\nf().ag_frame.f_builtins",
+    "frame = None\nframe.f_globals",
+    "import os",
+    "x = ().__class__",
+]
+
+@pytest.mark.parametrize("source", ESCAPES)
+def test_refuses_escapes(source):
+    with pytest.raises(tracer.UnsafeCode):
+        tracer.check_source(source)
+
+@pytest.mark.parametrize("source", ESCAPES)
+def test_trace_runs_nothing_it_refuses(source):
+    with pytest.raises(tracer.UnsafeCode):
+        tracer.trace(source)
+
+def test_allows_ordinary_attributes():
+    trace = tracer.trace("words = []\nfor word in 'a b'.split():\n    words.append(word.upper())")
+    assert trace.final_variables()['words'] == "['A', 'B']"
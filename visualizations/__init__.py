@@ -3,3 +3,54 @@ Visualizations package for Python Concepts Visualizer
 Contains interactive visualizations for teaching Python concepts to kids
 """
 
+import importlib
+
+# Registry of concept modules in navigation order.
+# Modules are only imported the first time their concept is opened.
+CONCEPTS = {}
+
+
+def register(name, title, icon, entry_point="show"):
+    """Register a concept module (name is relative to this package)"""
+    CONCEPTS[name] = {
+        'name': name,
+        'title': title,
+        'icon': icon,
+        'entry_point': entry_point
+    }
+
+
+def concept_label(name):
+    """Label shown in the navigation strip for a concept"""
+    concept = CONCEPTS[name]
+    return f"{concept['icon']} {concept['title']}"
+
+
+def get_entry_point(name):
+    """Import a concept module on demand and return its entry-point function"""
+    module = importlib.import_module(f"{__name__}.{name}")
+    return getattr(module, CONCEPTS[name]['entry_point'])
+
+
+def prewarm(names=None):
+    """Import concept modules ahead of time so the first open of each is fast"""
+    for name in names or list(CONCEPTS):
+        get_entry_point(name)
+
+
+register("python_intro", "Introduction", "🐍")
+register("variables_memory", "Variables & Memory", "📦", "show_variables_visualization")
+register("print_input", "Print & Input", "💬")
+register("data_types", "Data Types", "🔢")
+register("operators", "Operators", "➕")
+register("conditionals", "Conditionals", "🔀")
+register("functions", "Functions", "🔧")
+register("function_scope", "Function Scope", "🔄", "show_function_scope_visualization")
+register("class_instances", "Classes & Instances", "🏛️", "show_class_instances_visualization")
+register("self_concept", "Understanding 'self'", "🎯", "show_self_concept_visualization")
+register("strings", "Strings", "📝")
+register("lists", "Lists", "📚")
+register("tuples_sets", "Tuples & Sets", "🎁")
+register("dictionaries", "Dictionaries", "📖")
+register("loops", "Loops", "🔁")
+register("exceptions", "Try-Except", "🛡️")
@@ -4,11 +4,28 @@ Shows how classes are blueprints and instances have their own memory
 """
 
 import streamlit as st
-import random
 
-def generate_instance_id():
-    """Generate a unique instance ID"""
-    return f"Instance_{random.randint(1000, 9999)}"
+from visualizations.core.cards import banner_card, card, instance_card
+from visualizations.core.memory_model import MemoryModel, format_address
+from visualizations.core.session_limits import LRU, manage, touch
+
+class Account:
+    """The blueprint shown on this tab - every instance created here is a real object"""
+    bank_name = "MyBank"
+
+    def __init__(self, number, name):
+        self.accNumber = number
+        self.name = name
+        self.balance = 0
+
+def _forget_instance(instance_id):
+    """Drop an evicted instance's object along with its entry"""
+    st.session_state.instance_memory.unbind(instance_id)
+
+# Per-student session state kept in check by the session manager
+manage('instances', cap=100, evict=LRU, on_evict=_forget_instance)
+manage('instance_memory')
+manage('instance_counter')
 
 def show_class_instances_visualization():
     """Main function to display the class & instances visualization"""
@@ -19,6 +36,9 @@ def show_class_instances_visualization():
     # Initialize session state
     if 'instances' not in st.session_state:
         st.session_state.instances = {}
+    if 'instance_memory' not in st.session_state:
+        # var_name -> the Account object it refers to
+        st.session_state.instance_memory = MemoryModel()
     if 'instance_counter' not in st.session_state:
         st.session_state.instance_counter = 1
     
@@ -74,11 +94,9 @@ class Account:
         
         if create_btn and acc_name:
             instance_id = f"ac{st.session_state.instance_counter}"
+            st.session_state.instance_memory.bind(instance_id, Account(acc_number, acc_name))
             st.session_state.instances[instance_id] = {
                 'var_name': instance_id,
-                'accNumber': acc_number,
-                'name': acc_name,
-                'balance': 0,
                 'created_order': st.session_state.instance_counter
             }
             st.session_state.instance_counter += 1
@@ -101,12 +119,14 @@ class Account:
                 modify_btn = st.form_submit_button("💸 Execute", use_container_width=True)
             
             if modify_btn and selected_instance:
+                account = st.session_state.instance_memory.value(selected_instance)
+                touch(st.session_state.instances, selected_instance)
                 if operation == "Deposit":
-                    st.session_state.instances[selected_instance]['balance'] += amount
+                    account.balance += amount
                     st.success(f"✅ Deposited ${amount} to {selected_instance}")
                 else:
-                    if st.session_state.instances[selected_instance]['balance'] >= amount:
-                        st.session_state.instances[selected_instance]['balance'] -= amount
+                    if account.balance >= amount:
+                        account.balance -= amount
                         st.success(f"✅ Withdrew ${amount} from {selected_instance}")
                     else:
                         st.error("❌ Insufficient balance!")
@@ -116,6 +136,7 @@ class Account:
         if st.session_state.instances:
             if st.button("🗑️ Clear All Instances", use_container_width=True):
                 st.session_state.instances = {}
+                st.session_state.instance_memory.clear()
                 st.session_state.instance_counter = 1
                 st.rerun()
     
@@ -135,20 +156,7 @@ class Account:
         else:
             # Show class variable (shared)
             st.markdown("#### 🌍 Class Variable (Shared by All)")
-            st.markdown("""
-            <div style="
-                background: linear-gradient(135deg, #9C27B0 0%, #7B1FA2 100%);
-                color: white;
-                padding: 1rem;
-                border-radius: 8px;
-                margin-bottom: 1.5rem;
-                text-align: center;
-                font-size: 1.2rem;
-                font-weight: bold;
-            ">
-                bank_name = "MyBank"
-            </div>
-            """, unsafe_allow_html=True)
+            card(banner_card(f'bank_name = "MyBank"  📍 {format_address(id(Account.bank_name))}', '#9C27B0'))
             
             st.markdown("#### 📦 Instance Memory Spaces")
             st.write(f"**Total instances created:** {len(st.session_state.instances)}")
@@ -156,27 +164,25 @@ class Account:
             # Display each instance
             for instance_id, instance_data in st.session_state.instances.items():
                 # Create a unique colored box for each instance
-                colors = ['green', 'blue', 'orange', 'red', 'violet', 'rainbow']
+                colors = ['#4CAF50', '#2196F3', '#FF9800', '#F44336', '#9C27B0', '#E91E63']
                 color = colors[instance_data['created_order'] % len(colors)]
+                account = st.session_state.instance_memory.value(instance_id)
                 
-                # Use Streamlit's container with custom styling
                 with st.container():
-                    st.markdown(f"**::{color}[{instance_data['var_name']} = Account(...)]**")
-                    col1, col2 = st.columns([1, 2])
-                    with col1:
-                        st.write("**accNumber:**")
-                        st.write("**name:**")
-                        st.write("**balance:**")
-                    with col2:
-                        st.write(f"{instance_data['accNumber']}")
-                        st.write(f'"{instance_data["name"]}"')
-                        st.write(f"${instance_data['balance']}")
+                    card(instance_card(f"{instance_data['var_name']} = Account(...)", [
+                        ("📍 Memory", st.session_state.instance_memory.address(instance_id)),
+                        ("accNumber", account.accNumber),
+                        ("name", f'"{account.name}"'),
+                        ("balance", f"${account.balance}"),
+                        ("bank_name", f"shared - {format_address(id(Account.bank_name))}")
+                    ], color))
                 
                     # Add delete button
                     col_del1, col_del2 = st.columns([1, 3])
                     with col_del1:
                         if st.button(f"🗑️ Delete", key=f"del_{instance_id}"):
                             del st.session_state.instances[instance_id]
+                            st.session_state.instance_memory.unbind(instance_id)
                             st.rerun()
                     
                     st.divider()
@@ -190,14 +196,16 @@ class Account:
                          "        self.name = name", "        self.balance = 0", ""]
             code_lines.append("# Creating instances")
             
-            for instance_id, instance_data in st.session_state.instances.items():
-                code_lines.append(f"{instance_data['var_name']} = Account({instance_data['accNumber']}, '{instance_data['name']}')")
+            accounts = {instance_id: st.session_state.instance_memory.value(instance_id)
+                        for instance_id in st.session_state.instances}
+            for instance_id, account in accounts.items():
+                code_lines.append(f"{instance_id} = Account({account.accNumber}, '{account.name}')")
             
-            if any(inst['balance'] != 0 for inst in st.session_state.instances.values()):
+            if any(account.balance != 0 for account in accounts.values()):
                 code_lines.append("\n# Modifying instances")
-                for instance_id, instance_data in st.session_state.instances.items():
-                    if instance_data['balance'] > 0:
-                        code_lines.append(f"# {instance_data['var_name']}.balance = {instance_data['balance']}")
+                for instance_id, account in accounts.items():
+                    if account.balance > 0:
+                        code_lines.append(f"# {instance_id}.balance = {account.balance}")
             
             st.code("\n".join(code_lines), language="python")
     
@@ -211,11 +219,11 @@ class Account:
         
         with col_cmp1:
             st.markdown("**Instance 1**")
-            inst1 = st.session_state.instances[instance_list[0]]
-            st.write(f"🏷️ {inst1['var_name']}")
-            st.write(f"🔢 Account: {inst1['accNumber']}")
-            st.write(f"👤 Name: {inst1['name']}")
-            st.write(f"💰 Balance: ${inst1['balance']}")
+            inst1 = st.session_state.instance_memory.value(instance_list[0])
+            st.write(f"🏷️ {instance_list[0]}")
+            st.write(f"🔢 Account: {inst1.accNumber}")
+            st.write(f"👤 Name: {inst1.name}")
+            st.write(f"💰 Balance: ${inst1.balance}")
         
         with col_cmp2:
             st.markdown("**vs**")
@@ -227,11 +235,11 @@ class Account:
         
         with col_cmp3:
             st.markdown("**Instance 2**")
-            inst2 = st.session_state.instances[instance_list[1]]
-            st.write(f"🏷️ {inst2['var_name']}")
-            st.write(f"🔢 Account: {inst2['accNumber']}")
-            st.write(f"👤 Name: {inst2['name']}")
-            st.write(f"💰 Balance: ${inst2['balance']}")
+            inst2 = st.session_state.instance_memory.value(instance_list[1])
+            st.write(f"🏷️ {instance_list[1]}")
+            st.write(f"🔢 Account: {inst2.accNumber}")
+            st.write(f"👤 Name: {inst2.name}")
+            st.write(f"💰 Balance: ${inst2.balance}")
         
         st.success("✅ Each instance has its own separate memory! Changes to one don't affect the other.")
     
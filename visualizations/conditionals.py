@@ -1,5 +1,764 @@
+import time
+
 import streamlit as st
 
+from visualizations.core.fragments import panel
+
+# Scores the batch grader reads from a paste or upload
+MAX_BULK_SCORES = 100_000
+
+# The grade calculator's elif chain as a decision table: first cut-off the score reaches wins
+GRADE_CUTOFFS = [(90, "A"), (80, "B"), (70, "C"), (60, "D")]
+FAIL_GRADE = "F"
+GRADE_NAMES = [grade for _, grade in GRADE_CUTOFFS] + [FAIL_GRADE]
+
+@panel
+def simple_if_panel():
+    """Try-it panel: run a simple if statement"""
+    st.markdown("#### 🎮 Try It: Simple If")
+
+    col_if1, col_if2, col_if3 = st.columns([2, 1, 2])
+
+    with col_if1:
+        if_value = st.number_input("Enter a number:", value=15, key="simple_if_value")
+
+    with col_if2:
+        if_operator = st.selectbox("Operator:", [">", "<", ">=", "<=", "==", "!="], key="simple_if_op")
+
+    with col_if3:
+        if_compare = st.number_input("Compare to:", value=10, key="simple_if_compare")
+
+    if st.button("▶️ Run If Statement", key="run_simple_if"):
+        # Evaluate condition
+        if if_operator == ">":
+            condition_result = if_value > if_compare
+            condition_text = f"{if_value} > {if_compare}"
+        elif if_operator == "<":
+            condition_result = if_value < if_compare
+            condition_text = f"{if_value} < {if_compare}"
+        elif if_operator == ">=":
+            condition_result = if_value >= if_compare
+            condition_text = f"{if_value} >= {if_compare}"
+        elif if_operator == "<=":
+            condition_result = if_value <= if_compare
+            condition_text = f"{if_value} <= {if_compare}"
+        elif if_operator == "==":
+            condition_result = if_value == if_compare
+            condition_text = f"{if_value} == {if_compare}"
+        else:  # !=
+            condition_result = if_value != if_compare
+            condition_text = f"{if_value} != {if_compare}"
+
+        # Show the code
+        st.code(f"""if {condition_text}:
+    print("Condition is True!")
+    print("This code runs!")""", language="python")
+
+        st.markdown("---")
+
+        # Visual flow
+        col_flow1, col_flow2, col_flow3 = st.columns([1, 1, 2])
+
+        with col_flow1:
+            st.markdown("**Condition:**")
+            st.code(condition_text)
+
+        with col_flow2:
+            st.markdown("**Result:**")
+            if condition_result:
+                st.markdown("### :green[True] ✅")
+            else:
+                st.markdown("### :red[False] ❌")
+
+        with col_flow3:
+            st.markdown("**Execution:**")
+            if condition_result:
+                st.success("✅ Condition is True - Code inside 'if' runs!")
+                st.info("Output: Condition is True!\nOutput: This code runs!")
+            else:
+                st.warning("⚠️ Condition is False - Code inside 'if' is skipped!")
+                st.caption("No output")
+
+@panel
+def age_check_panel():
+    """Try-it panel: age check example"""
+    st.markdown("#### 📊 Real Example: Age Check")
+
+    age_input = st.number_input("Enter age:", value=16, min_value=0, max_value=120, key="age_simple_if")
+
+    if st.button("🎂 Check Age", key="check_age_simple"):
+        st.code(f"""age = {int(age_input)}
+
+if age >= 18:
+    print("You are an adult!")
+    print("You can vote!")""", language="python")
+
+        if age_input >= 18:
+            st.success("✅ Condition is True (age >= 18)")
+            st.info("Output: You are an adult!\nOutput: You can vote!")
+        else:
+            st.warning("⚠️ Condition is False (age < 18)")
+            st.caption("No output - if block is skipped")
+
+@panel
+def even_odd_panel():
+    """Try-it panel: even or odd with if-else"""
+    st.markdown("#### 🎮 Interactive If-Else")
+
+    col_ifelse1, col_ifelse2 = st.columns(2)
+
+    with col_ifelse1:
+        number_check = st.number_input("Enter a number:", value=7, key="ifelse_number")
+
+    with col_ifelse2:
+        st.write("")
+        st.write("")
+        check_btn = st.button("🔍 Check Even or Odd", key="check_even_odd", use_container_width=True)
+
+    if check_btn:
+        is_even = number_check % 2 == 0
+
+        st.code(f"""number = {int(number_check)}
+
+if number % 2 == 0:
+    print("The number is EVEN")
+else:
+    print("The number is ODD")""", language="python")
+
+        st.markdown("---")
+        st.markdown("#### 🎯 Execution Flow:")
+
+        # Visual flowchart
+        col_flow1, col_flow2 = st.columns(2)
+
+        with col_flow1:
+            st.markdown("**If Branch (condition: number % 2 == 0)**")
+            if is_even:
+                st.success("✅ **THIS PATH EXECUTED**")
+                st.code("print('The number is EVEN')")
+            else:
+                st.markdown("⚪ *Skipped*")
+                st.code("# Not executed")
+
+        with col_flow2:
+            st.markdown("**Else Branch (condition is False)**")
+            if not is_even:
+                st.success("✅ **THIS PATH EXECUTED**")
+                st.code("print('The number is ODD')")
+            else:
+                st.markdown("⚪ *Skipped*")
+                st.code("# Not executed")
+
+        st.markdown("---")
+
+        if is_even:
+            st.info(f"**Result:** {int(number_check)} % 2 = 0 → EVEN")
+            st.success(f"Output: The number is EVEN")
+        else:
+            st.info(f"**Result:** {int(number_check)} % 2 = 1 → ODD")
+            st.success(f"Output: The number is ODD")
+
+@panel
+def temperature_panel():
+    """Try-it panel: temperature example"""
+    st.markdown("#### 🌡️ Temperature Example")
+
+    temp = st.slider("Temperature (°C):", min_value=-20, max_value=45, value=25, key="temp_slider")
+
+    if st.button("🌡️ Check Temperature", key="check_temp_btn"):
+        st.code(f"""temperature = {temp}
+
+if temperature >= 25:
+    print("It's HOT! 🔥")
+    print("Drink water!")
+else:
+    print("It's COLD! ❄️")
+    print("Wear a jacket!")""", language="python")
+
+        if temp >= 25:
+            st.success(f"✅ Condition True: {temp}°C >= 25°C")
+            st.info("Output: It's HOT! 🔥\nOutput: Drink water!")
+        else:
+            st.warning(f"❌ Condition False: {temp}°C < 25°C")
+            st.info("Output: It's COLD! ❄️\nOutput: Wear a jacket!")
+
+@panel
+def grade_calculator():
+    """Try-it panel: if-elif-else grade calculator"""
+    st.markdown("#### 📝 Grade Calculator")
+
+    score = st.slider("Enter score (0-100):", min_value=0, max_value=100, value=85, key="grade_score")
+
+    if st.button("📊 Calculate Grade", key="calc_grade_btn"):
+        # Determine grade
+        if score >= 90:
+            grade = "A"
+            message = "Excellent! 🌟"
+            color = "green"
+        elif score >= 80:
+            grade = "B"
+            message = "Great job! 👍"
+            color = "blue"
+        elif score >= 70:
+            grade = "C"
+            message = "Good work! 👌"
+            color = "orange"
+        elif score >= 60:
+            grade = "D"
+            message = "Needs improvement 📚"
+            color = "red"
+        else:
+            grade = "F"
+            message = "Study harder! 📖"
+            color = "red"
+
+        st.code(f"""score = {score}
+
+if score >= 90:
+    grade = "A"
+    print("Excellent! 🌟")
+elif score >= 80:
+    grade = "B"
+    print("Great job! 👍")
+elif score >= 70:
+    grade = "C"
+    print("Good work! 👌")
+elif score >= 60:
+    grade = "D"
+    print("Needs improvement 📚")
+else:
+    grade = "F"
+    print("Study harder! 📖")
+    
+print(f"Your grade: {{grade}}")""", language="python")
+
+        st.markdown("---")
+        st.markdown("#### 🔍 Condition Check Order:")
+
+        # Show which conditions were checked
+        conditions = [
+            ("score >= 90", score >= 90, "A"),
+            ("score >= 80", score >= 80, "B"),
+            ("score >= 70", score >= 70, "C"),
+            ("score >= 60", score >= 60, "D"),
+            ("else", True, "F")
+        ]
+
+        found = False
+        for cond_text, cond_result, grade_val in conditions:
+            col_cond1, col_cond2, col_cond3 = st.columns([2, 1, 2])
+
+            with col_cond1:
+                st.code(cond_text)
+
+            with col_cond2:
+                if not found and cond_result:
+                    st.markdown("### :green[True] ✅")
+                elif not found:
+                    st.markdown("### :red[False] ❌")
+                else:
+                    st.markdown("⚪ *Skipped*")
+
+            with col_cond3:
+                if not found and cond_result:
+                    st.success(f"✅ **EXECUTED** → Grade: {grade_val}")
+                    found = True
+                elif not found:
+                    st.caption("Continue to next condition...")
+                else:
+                    st.caption("Not checked (already found True)")
+
+        st.markdown("---")
+        st.markdown(f"### Final Result: Grade {grade} - {message}")
+
+def grade_for(score):
+    """The grade calculator's elif chain for one score"""
+    if score >= 90:
+        return "A"
+    elif score >= 80:
+        return "B"
+    elif score >= 70:
+        return "C"
+    elif score >= 60:
+        return "D"
+    else:
+        return "F"
+
+def grades_select(scores):
+    """grade_for() on a whole array at once: np.select picks the first condition that holds"""
+    import numpy as np
+
+    return np.select([scores >= cutoff for cutoff, _ in GRADE_CUTOFFS],
+                     [grade for _, grade in GRADE_CUTOFFS], default=FAIL_GRADE)
+
+def grades_cut(scores):
+    """grade_for() on a whole array at once: pd.cut puts each score in a bin between cut-offs"""
+    import numpy as np
+    import pandas as pd
+
+    cutoffs = sorted(cutoff for cutoff, _ in GRADE_CUTOFFS)
+    # right=False makes each bin include its lower edge, like >=
+    return pd.cut(scores, [-np.inf] + cutoffs + [np.inf], right=False, labels=GRADE_NAMES[::-1])
+
+def sample_scores(count, seed=0):
+    """count random whole-number scores from 0 to 100, bunched around 72 like a real class"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    return pd.Series(np.clip(np.round(rng.normal(72, 15, count)), 0, 100))
+
+def read_scores_csv(upload):
+    """Every column of numbers in a CSV file, by name - the first row is a header if it isn't numbers"""
+    import pandas as pd
+
+    try:
+        table = pd.read_csv(upload, header=None, dtype=str, keep_default_na=False)
+    except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError):
+        return {}
+    if table.empty:
+        return {}
+    first = pd.to_numeric(table.iloc[0], errors="coerce")
+    if first.isna().all():
+        names, table = table.iloc[0].tolist(), table.iloc[1:]
+    else:
+        names = [f"column {i + 1}" for i in range(table.shape[1])]
+    columns = {}
+    for name, column in zip(names, table.columns):
+        numbers = pd.to_numeric(table[column], errors="coerce")
+        if numbers.notna().any():
+            columns[name] = numbers.reset_index(drop=True)
+    return columns
+
+@panel
+def batch_grade_panel():
+    """Try-it panel: grade thousands of scores, one by one and all at once"""
+    source = st.radio("Scores from:", ["🎲 Random class", "✍️ Paste", "📁 Upload CSV"],
+                      horizontal=True, key="grade_bulk_source")
+
+    if source == "🎲 Random class":
+        count = st.number_input("How many students?", min_value=10, max_value=MAX_BULK_SCORES,
+                                value=50_000, step=5000, key="grade_bulk_count")
+    elif source == "✍️ Paste":
+        text = st.text_area("One score per line:", value="95\n85\n75\n65\n55\n89.5\n90",
+                            height=150, key="grade_bulk_paste")
+    else:
+        upload = st.file_uploader("A .csv file with a column of scores, e.g. name,score",
+                                  type=["csv"], key="grade_bulk_upload")
+        if upload is None:
+            st.info("👆 Upload a file to grade every score in it")
+            return
+        # pandas takes about half a second to import, so only a real upload waits for it
+        columns = read_scores_csv(upload)
+        if not columns:
+            st.error("❌ That file has no column of numbers.")
+            return
+        column = st.selectbox("Scores column:", list(columns), key="grade_bulk_column")
+
+    # Grading runs three ways on purpose, so only do it when asked
+    if not st.button("⚡ Grade Everyone", key="grade_bulk_btn"):
+        return
+
+    import numpy as np
+    import pandas as pd
+
+    if source == "🎲 Random class":
+        scores = sample_scores(int(count))
+    elif source == "✍️ Paste":
+        lines = [line for line in text.splitlines() if line.strip()]
+        scores = pd.to_numeric(pd.Series(lines, dtype=object), errors="coerce")
+    else:
+        scores = columns[column]
+
+    # Blank or non-number cells (and inf) can't be graded
+    usable = np.isfinite(scores.astype(float))
+    if not usable.all():
+        st.warning(f"⏭️ Skipped {(~usable).sum():,} entries that aren't numbers.")
+        scores = scores[usable].reset_index(drop=True)
+    if len(scores) > MAX_BULK_SCORES:
+        st.warning(f"✂️ Only the first {MAX_BULK_SCORES:,} of {len(scores):,} scores are graded.")
+        scores = scores[:MAX_BULK_SCORES]
+    if scores.empty:
+        st.info("There are no scores to grade.")
+        return
+
+    values = scores.to_numpy(dtype=float)
+
+    # The same chain three ways: a Python loop, then two whole-array versions
+    start = time.perf_counter()
+    one_by_one = [grade_for(score) for score in values.tolist()]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    selected = grades_select(values)
+    select_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    binned = grades_cut(values)
+    cut_seconds = time.perf_counter() - start
+
+    st.markdown(f"#### ⏱️ {len(values):,} Scores: Loop vs Vectorized")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🐢 One at a time", f"{loop_seconds * 1000:,.1f} ms")
+        st.code("[grade_for(s) for s in scores]", language="python")
+    with col2:
+        speedup = loop_seconds / max(select_seconds, 1e-9)
+        st.metric("⚡ np.select", f"{select_seconds * 1000:,.1f} ms",
+                  f"{speedup:,.1f}× faster" if speedup >= 1 else "the loop wins", delta_color="off")
+        st.code('np.select([scores >= 90, scores >= 80, ...],\n          ["A", "B", ...], default="F")',
+                language="python")
+    with col3:
+        speedup = loop_seconds / max(cut_seconds, 1e-9)
+        st.metric("⚡ pd.cut", f"{cut_seconds * 1000:,.1f} ms",
+                  f"{speedup:,.1f}× faster" if speedup >= 1 else "the loop wins", delta_color="off")
+        st.code('pd.cut(scores, [-inf, 60, 70, 80, 90, inf],\n       right=False, labels=["F", ..., "A"])',
+                language="python")
+
+    if one_by_one == selected.tolist() == binned.astype(str).tolist():
+        st.success("✅ All three ways give every student the same grade")
+    else:
+        st.error("❌ The three ways disagree")
+    st.caption("The loop runs the elif chain in Python once per score. np.select checks each condition "
+               "against every score at once - earlier conditions win, just like elif - and pd.cut "
+               "sorts every score into a bin between the cut-offs. Both run in compiled code, so "
+               "the gap grows with the number of scores.")
+
+    counts = pd.Series(one_by_one).value_counts().reindex(GRADE_NAMES, fill_value=0)
+    col_counts, col_chart = st.columns([1, 2])
+    with col_counts:
+        st.markdown("#### 🧮 Grade Distribution")
+        st.dataframe(pd.DataFrame({'grade': GRADE_NAMES, 'students': counts.to_numpy(),
+                                   'share': (counts / len(values)).map("{:.1%}".format).to_numpy()}),
+                     hide_index=True)
+        st.metric("Class average", f"{values.mean():.1f}")
+    with col_chart:
+        st.markdown("#### 📊 Histogram")
+        st.bar_chart(counts)
+
+@panel
+def ticket_price_panel():
+    """Try-it panel: ticket price calculator"""
+    st.markdown("#### 🎟️ Ticket Price Calculator")
+
+    age_ticket = st.number_input("Enter age:", value=25, min_value=0, max_value=120, key="ticket_age")
+
+    if st.button("💰 Calculate Price", key="calc_price_btn"):
+        if age_ticket < 5:
+            price = 0
+            category = "Free (Under 5)"
+        elif age_ticket < 18:
+            price = 10
+            category = "Child (5-17)"
+        elif age_ticket < 65:
+            price = 20
+            category = "Adult (18-64)"
+        else:
+            price = 15
+            category = "Senior (65+)"
+
+        st.code(f"""age = {int(age_ticket)}
+
+if age < 5:
+    price = 0
+    print("Free (Under 5)")
+elif age < 18:
+    price = 10
+    print("Child (5-17)")
+elif age < 65:
+    price = 20
+    print("Adult (18-64)")
+else:
+    price = 15
+    print("Senior (65+)")
+    
+print(f"Ticket price: ${{price}}")""", language="python")
+
+        st.success(f"🎫 Category: {category}")
+        st.info(f"💵 Ticket Price: ${price}")
+
+@panel
+def game_access_panel():
+    """Try-it panel: nested game access checker"""
+    st.markdown("#### 🎮 Game Access Checker")
+
+    col_nest1, col_nest2 = st.columns(2)
+
+    with col_nest1:
+        age_game = st.number_input("Your age:", value=16, min_value=0, max_value=120, key="game_age")
+
+    with col_nest2:
+        has_permission = st.checkbox("Have parent permission?", value=True, key="has_permission")
+
+    if st.button("🎮 Check Game Access", key="check_game_access"):
+        st.code(f"""age = {int(age_game)}
+has_permission = {has_permission}
+
+if age >= 13:
+    if has_permission:
+        print("✅ You can play the game!")
+        print("Have fun!")
+    else:
+        print("⚠️ You need parent permission")
+        print("Ask your parents!")
+else:
+    print("❌ Sorry, you're too young")
+    print("Minimum age is 13")""", language="python")
+
+        st.markdown("---")
+        st.markdown("#### 🔍 Decision Flow:")
+
+        # First condition
+        st.markdown("**Step 1: Check age >= 13**")
+        if age_game >= 13:
+            st.success(f"✅ True ({int(age_game)} >= 13)")
+
+            # Second condition (nested)
+            st.markdown("**Step 2: Check parent permission**")
+            if has_permission:
+                st.success("✅ True (has permission)")
+                st.markdown("---")
+                st.success("🎉 **RESULT:** You can play the game!\nHave fun!")
+            else:
+                st.error("❌ False (no permission)")
+                st.markdown("---")
+                st.warning("⚠️ **RESULT:** You need parent permission\nAsk your parents!")
+        else:
+            st.error(f"❌ False ({int(age_game)} < 13)")
+            st.caption("Step 2 is skipped")
+            st.markdown("---")
+            st.error("❌ **RESULT:** Sorry, you're too young\nMinimum age is 13")
+
+@panel
+def real_world_examples():
+    """Try-it panel: password, BMI, greeting and number examples"""
+    example_cat = st.selectbox("Choose example:", 
+                               ["Password Validator", "BMI Calculator", "Time of Day Greeter", "Number Classifier"],
+                               key="example_category_cond")
+
+    if example_cat == "Password Validator":
+        st.markdown("#### 🔐 Password Strength Checker")
+
+        password = st.text_input("Enter password:", value="MyPass123", type="password", key="password_validator")
+
+        if st.button("✅ Validate Password", key="validate_pass_btn"):
+            length = len(password)
+            has_digit = any(char.isdigit() for char in password)
+            has_upper = any(char.isupper() for char in password)
+            has_lower = any(char.islower() for char in password)
+
+            st.code(f"""password = "{password}"
+
+# Check conditions
+length = len(password)  # {length}
+has_digit = any(char.isdigit() for char in password)  # {has_digit}
+has_upper = any(char.isupper() for char in password)  # {has_upper}
+has_lower = any(char.islower() for char in password)  # {has_lower}
+
+if length < 6:
+    strength = "Too Short"
+elif length < 8:
+    strength = "Weak"
+elif has_digit and has_upper and has_lower:
+    strength = "Strong"
+elif has_digit or has_upper:
+    strength = "Medium"
+else:
+    strength = "Weak"
+    
+print(f"Password strength: {{strength}}")""", language="python")
+
+            # Determine strength
+            if length < 6:
+                strength = "Too Short"
+                color = "red"
+                icon = "❌"
+            elif length < 8:
+                strength = "Weak"
+                color = "orange"
+                icon = "⚠️"
+            elif has_digit and has_upper and has_lower:
+                strength = "Strong"
+                color = "green"
+                icon = "✅"
+            elif has_digit or has_upper:
+                strength = "Medium"
+                color = "blue"
+                icon = "🔵"
+            else:
+                strength = "Weak"
+                color = "orange"
+                icon = "⚠️"
+
+            st.markdown(f"### {icon} Password Strength: {strength}")
+
+            # Show checks
+            col_check1, col_check2, col_check3, col_check4 = st.columns(4)
+            with col_check1:
+                if length >= 8:
+                    st.success(f"✅ Length: {length}")
+                else:
+                    st.error(f"❌ Length: {length}")
+            with col_check2:
+                if has_digit:
+                    st.success("✅ Has digit")
+                else:
+                    st.error("❌ No digit")
+            with col_check3:
+                if has_upper:
+                    st.success("✅ Has uppercase")
+                else:
+                    st.error("❌ No uppercase")
+            with col_check4:
+                if has_lower:
+                    st.success("✅ Has lowercase")
+                else:
+                    st.error("❌ No lowercase")
+
+    elif example_cat == "BMI Calculator":
+        st.markdown("#### ⚖️ BMI Calculator with Categories")
+
+        col_bmi1, col_bmi2 = st.columns(2)
+        with col_bmi1:
+            weight = st.number_input("Weight (kg):", value=70.0, min_value=1.0, key="bmi_weight")
+        with col_bmi2:
+            height = st.number_input("Height (m):", value=1.75, min_value=0.1, key="bmi_height")
+
+        if st.button("📊 Calculate BMI", key="calc_bmi_btn"):
+            bmi = weight / (height ** 2)
+
+            if bmi < 18.5:
+                category = "Underweight"
+                advice = "Consider eating more nutritious foods"
+            elif bmi < 25:
+                category = "Normal weight"
+                advice = "Great! Keep it up!"
+            elif bmi < 30:
+                category = "Overweight"
+                advice = "Consider more exercise and balanced diet"
+            else:
+                category = "Obese"
+                advice = "Consult with a healthcare provider"
+
+            st.code(f"""weight = {weight}
+height = {height}
+bmi = weight / (height ** 2)  # {bmi:.2f}
+
+if bmi < 18.5:
+    category = "Underweight"
+elif bmi < 25:
+    category = "Normal weight"
+elif bmi < 30:
+    category = "Overweight"
+else:
+    category = "Obese"
+    
+print(f"BMI: {{bmi:.2f}}")
+print(f"Category: {{category}}")""", language="python")
+
+            st.metric("Your BMI", f"{bmi:.2f}")
+            st.info(f"**Category:** {category}")
+            st.success(f"**Advice:** {advice}")
+
+    elif example_cat == "Time of Day Greeter":
+        st.markdown("#### 👋 Time-Based Greeting")
+
+        hour = st.slider("Hour (0-23):", min_value=0, max_value=23, value=14, key="hour_slider")
+
+        if st.button("👋 Get Greeting", key="get_greeting_btn"):
+            if hour < 6:
+                greeting = "Good night"
+                icon = "🌙"
+                advice = "Time to sleep!"
+            elif hour < 12:
+                greeting = "Good morning"
+                icon = "🌅"
+                advice = "Have a great day ahead!"
+            elif hour < 17:
+                greeting = "Good afternoon"
+                icon = "☀️"
+                advice = "Keep up the good work!"
+            elif hour < 21:
+                greeting = "Good evening"
+                icon = "🌆"
+                advice = "Time to relax!"
+            else:
+                greeting = "Good night"
+                icon = "🌙"
+                advice = "Time to rest!"
+
+            st.code(f"""hour = {hour}
+
+if hour < 6:
+    greeting = "Good night 🌙"
+elif hour < 12:
+    greeting = "Good morning 🌅"
+elif hour < 17:
+    greeting = "Good afternoon ☀️"
+elif hour < 21:
+    greeting = "Good evening 🌆"
+else:
+    greeting = "Good night 🌙"
+    
+print(greeting)""", language="python")
+
+            st.markdown(f"## {icon} {greeting}!")
+            st.info(advice)
+
+    elif example_cat == "Number Classifier":
+        st.markdown("#### 🔢 Number Classifier")
+
+        num_classify = st.number_input("Enter a number:", value=0, key="num_classify")
+
+        if st.button("🔍 Classify Number", key="classify_num_btn"):
+            classifications = []
+
+            # Check multiple properties
+            if num_classify == 0:
+                classifications.append("Zero")
+            elif num_classify > 0:
+                classifications.append("Positive")
+            else:
+                classifications.append("Negative")
+
+            if num_classify % 2 == 0:
+                classifications.append("Even")
+            else:
+                classifications.append("Odd")
+
+            if num_classify % 5 == 0:
+                classifications.append("Divisible by 5")
+
+            if num_classify % 10 == 0:
+                classifications.append("Divisible by 10")
+
+            st.code(f"""number = {int(num_classify)}
+
+# Check sign
+if number == 0:
+    print("Zero")
+elif number > 0:
+    print("Positive")
+else:
+    print("Negative")
+
+# Check even/odd
+if number % 2 == 0:
+    print("Even")
+else:
+    print("Odd")
+
+# Check divisibility
+if number % 5 == 0:
+    print("Divisible by 5")
+    
+if number % 10 == 0:
+    print("Divisible by 10")""", language="python")
+
+            st.markdown("### 📊 Classifications:")
+            for classification in classifications:
+                st.success(f"✅ {classification}")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">🔀 Conditional Statements (If-Elif-Else)</h2>', unsafe_allow_html=True)
     st.write("Learn how to make decisions in your code!")
@@ -53,88 +812,10 @@ def show():
         """)
         
         st.markdown("---")
-        st.markdown("#### 🎮 Try It: Simple If")
-        
-        col_if1, col_if2, col_if3 = st.columns([2, 1, 2])
-        
-        with col_if1:
-            if_value = st.number_input("Enter a number:", value=15, key="simple_if_value")
-        
-        with col_if2:
-            if_operator = st.selectbox("Operator:", [">", "<", ">=", "<=", "==", "!="], key="simple_if_op")
-        
-        with col_if3:
-            if_compare = st.number_input("Compare to:", value=10, key="simple_if_compare")
-        
-        if st.button("▶️ Run If Statement", key="run_simple_if"):
-            # Evaluate condition
-            if if_operator == ">":
-                condition_result = if_value > if_compare
-                condition_text = f"{if_value} > {if_compare}"
-            elif if_operator == "<":
-                condition_result = if_value < if_compare
-                condition_text = f"{if_value} < {if_compare}"
-            elif if_operator == ">=":
-                condition_result = if_value >= if_compare
-                condition_text = f"{if_value} >= {if_compare}"
-            elif if_operator == "<=":
-                condition_result = if_value <= if_compare
-                condition_text = f"{if_value} <= {if_compare}"
-            elif if_operator == "==":
-                condition_result = if_value == if_compare
-                condition_text = f"{if_value} == {if_compare}"
-            else:  # !=
-                condition_result = if_value != if_compare
-                condition_text = f"{if_value} != {if_compare}"
-            
-            # Show the code
-            st.code(f"""if {condition_text}:
-    print("Condition is True!")
-    print("This code runs!")""", language="python")
-            
-            st.markdown("---")
-            
-            # Visual flow
-            col_flow1, col_flow2, col_flow3 = st.columns([1, 1, 2])
-            
-            with col_flow1:
-                st.markdown("**Condition:**")
-                st.code(condition_text)
-            
-            with col_flow2:
-                st.markdown("**Result:**")
-                if condition_result:
-                    st.markdown("### :green[True] ✅")
-                else:
-                    st.markdown("### :red[False] ❌")
-            
-            with col_flow3:
-                st.markdown("**Execution:**")
-                if condition_result:
-                    st.success("✅ Condition is True - Code inside 'if' runs!")
-                    st.info("Output: Condition is True!\nOutput: This code runs!")
-                else:
-                    st.warning("⚠️ Condition is False - Code inside 'if' is skipped!")
-                    st.caption("No output")
+        simple_if_panel()
         
         st.markdown("---")
-        st.markdown("#### 📊 Real Example: Age Check")
-        
-        age_input = st.number_input("Enter age:", value=16, min_value=0, max_value=120, key="age_simple_if")
-        
-        if st.button("🎂 Check Age", key="check_age_simple"):
-            st.code(f"""age = {int(age_input)}
-
-if age >= 18:
-    print("You are an adult!")
-    print("You can vote!")""", language="python")
-            
-            if age_input >= 18:
-                st.success("✅ Condition is True (age >= 18)")
-                st.info("Output: You are an adult!\nOutput: You can vote!")
-            else:
-                st.warning("⚠️ Condition is False (age < 18)")
-                st.caption("No output - if block is skipped")
+        age_check_panel()
     
     # ============================================
     # TAB 2: IF-ELSE
@@ -161,82 +842,10 @@ if age >= 18:
         """)
         
         st.markdown("---")
-        st.markdown("#### 🎮 Interactive If-Else")
-        
-        col_ifelse1, col_ifelse2 = st.columns(2)
-        
-        with col_ifelse1:
-            number_check = st.number_input("Enter a number:", value=7, key="ifelse_number")
-        
-        with col_ifelse2:
-            st.write("")
-            st.write("")
-            check_btn = st.button("🔍 Check Even or Odd", key="check_even_odd", use_container_width=True)
-        
-        if check_btn:
-            is_even = number_check % 2 == 0
-            
-            st.code(f"""number = {int(number_check)}
-
-if number % 2 == 0:
-    print("The number is EVEN")
-else:
-    print("The number is ODD")""", language="python")
-            
-            st.markdown("---")
-            st.markdown("#### 🎯 Execution Flow:")
-            
-            # Visual flowchart
-            col_flow1, col_flow2 = st.columns(2)
-            
-            with col_flow1:
-                st.markdown("**If Branch (condition: number % 2 == 0)**")
-                if is_even:
-                    st.success("✅ **THIS PATH EXECUTED**")
-                    st.code("print('The number is EVEN')")
-                else:
-                    st.markdown("⚪ *Skipped*")
-                    st.code("# Not executed")
-            
-            with col_flow2:
-                st.markdown("**Else Branch (condition is False)**")
-                if not is_even:
-                    st.success("✅ **THIS PATH EXECUTED**")
-                    st.code("print('The number is ODD')")
-                else:
-                    st.markdown("⚪ *Skipped*")
-                    st.code("# Not executed")
-            
-            st.markdown("---")
-            
-            if is_even:
-                st.info(f"**Result:** {int(number_check)} % 2 = 0 → EVEN")
-                st.success(f"Output: The number is EVEN")
-            else:
-                st.info(f"**Result:** {int(number_check)} % 2 = 1 → ODD")
-                st.success(f"Output: The number is ODD")
+        even_odd_panel()
         
         st.markdown("---")
-        st.markdown("#### 🌡️ Temperature Example")
-        
-        temp = st.slider("Temperature (°C):", min_value=-20, max_value=45, value=25, key="temp_slider")
-        
-        if st.button("🌡️ Check Temperature", key="check_temp_btn"):
-            st.code(f"""temperature = {temp}
-
-if temperature >= 25:
-    print("It's HOT! 🔥")
-    print("Drink water!")
-else:
-    print("It's COLD! ❄️")
-    print("Wear a jacket!")""", language="python")
-            
-            if temp >= 25:
-                st.success(f"✅ Condition True: {temp}°C >= 25°C")
-                st.info("Output: It's HOT! 🔥\nOutput: Drink water!")
-            else:
-                st.warning(f"❌ Condition False: {temp}°C < 25°C")
-                st.info("Output: It's COLD! ❄️\nOutput: Wear a jacket!")
+        temperature_panel()
     
     # ============================================
     # TAB 3: IF-ELIF-ELSE
@@ -266,130 +875,17 @@ else:
         """)
         
         st.markdown("---")
-        st.markdown("#### 📝 Grade Calculator")
+        grade_calculator()
         
-        score = st.slider("Enter score (0-100):", min_value=0, max_value=100, value=85, key="grade_score")
+        # Batch grading
+        st.markdown("---")
+        st.markdown("#### 📦 Batch Mode - Grade a Whole Class")
+        st.write("Run the same elif chain on thousands of scores and see how numpy and pandas do it all at once!")
         
-        if st.button("📊 Calculate Grade", key="calc_grade_btn"):
-            # Determine grade
-            if score >= 90:
-                grade = "A"
-                message = "Excellent! 🌟"
-                color = "green"
-            elif score >= 80:
-                grade = "B"
-                message = "Great job! 👍"
-                color = "blue"
-            elif score >= 70:
-                grade = "C"
-                message = "Good work! 👌"
-                color = "orange"
-            elif score >= 60:
-                grade = "D"
-                message = "Needs improvement 📚"
-                color = "red"
-            else:
-                grade = "F"
-                message = "Study harder! 📖"
-                color = "red"
-            
-            st.code(f"""score = {score}
-
-if score >= 90:
-    grade = "A"
-    print("Excellent! 🌟")
-elif score >= 80:
-    grade = "B"
-    print("Great job! 👍")
-elif score >= 70:
-    grade = "C"
-    print("Good work! 👌")
-elif score >= 60:
-    grade = "D"
-    print("Needs improvement 📚")
-else:
-    grade = "F"
-    print("Study harder! 📖")
-    
-print(f"Your grade: {{grade}}")""", language="python")
-            
-            st.markdown("---")
-            st.markdown("#### 🔍 Condition Check Order:")
-            
-            # Show which conditions were checked
-            conditions = [
-                ("score >= 90", score >= 90, "A"),
-                ("score >= 80", score >= 80, "B"),
-                ("score >= 70", score >= 70, "C"),
-                ("score >= 60", score >= 60, "D"),
-                ("else", True, "F")
-            ]
-            
-            found = False
-            for cond_text, cond_result, grade_val in conditions:
-                col_cond1, col_cond2, col_cond3 = st.columns([2, 1, 2])
-                
-                with col_cond1:
-                    st.code(cond_text)
-                
-                with col_cond2:
-                    if not found and cond_result:
-                        st.markdown("### :green[True] ✅")
-                    elif not found:
-                        st.markdown("### :red[False] ❌")
-                    else:
-                        st.markdown("⚪ *Skipped*")
-                
-                with col_cond3:
-                    if not found and cond_result:
-                        st.success(f"✅ **EXECUTED** → Grade: {grade_val}")
-                        found = True
-                    elif not found:
-                        st.caption("Continue to next condition...")
-                    else:
-                        st.caption("Not checked (already found True)")
-            
-            st.markdown("---")
-            st.markdown(f"### Final Result: Grade {grade} - {message}")
+        batch_grade_panel()
         
         st.markdown("---")
-        st.markdown("#### 🎟️ Ticket Price Calculator")
-        
-        age_ticket = st.number_input("Enter age:", value=25, min_value=0, max_value=120, key="ticket_age")
-        
-        if st.button("💰 Calculate Price", key="calc_price_btn"):
-            if age_ticket < 5:
-                price = 0
-                category = "Free (Under 5)"
-            elif age_ticket < 18:
-                price = 10
-                category = "Child (5-17)"
-            elif age_ticket < 65:
-                price = 20
-                category = "Adult (18-64)"
-            else:
-                price = 15
-                category = "Senior (65+)"
-            
-            st.code(f"""age = {int(age_ticket)}
-
-if age < 5:
-    price = 0
-    print("Free (Under 5)")
-elif age < 18:
-    price = 10
-    print("Child (5-17)")
-elif age < 65:
-    price = 20
-    print("Adult (18-64)")
-else:
-    price = 15
-    print("Senior (65+)")
-    
-print(f"Ticket price: ${{price}}")""", language="python")
-            
-            st.success(f"🎫 Category: {category}")
-            st.info(f"💵 Ticket Price: ${price}")
+        ticket_price_panel()
     
     # ============================================
     # TAB 4: NESTED CONDITIONS
@@ -420,54 +916,7 @@ print(f"Ticket price: ${{price}}")""", language="python")
         """)
         
         st.markdown("---")
-        st.markdown("#### 🎮 Game Access Checker")
-        
-        col_nest1, col_nest2 = st.columns(2)
-        
-        with col_nest1:
-            age_game = st.number_input("Your age:", value=16, min_value=0, max_value=120, key="game_age")
-        
-        with col_nest2:
-            has_permission = st.checkbox("Have parent permission?", value=True, key="has_permission")
-        
-        if st.button("🎮 Check Game Access", key="check_game_access"):
-            st.code(f"""age = {int(age_game)}
-has_permission = {has_permission}
-
-if age >= 13:
-    if has_permission:
-        print("✅ You can play the game!")
-        print("Have fun!")
-    else:
-        print("⚠️ You need parent permission")
-        print("Ask your parents!")
-else:
-    print("❌ Sorry, you're too young")
-    print("Minimum age is 13")""", language="python")
-            
-            st.markdown("---")
-            st.markdown("#### 🔍 Decision Flow:")
-            
-            # First condition
-            st.markdown("**Step 1: Check age >= 13**")
-            if age_game >= 13:
-                st.success(f"✅ True ({int(age_game)} >= 13)")
-                
-                # Second condition (nested)
-                st.markdown("**Step 2: Check parent permission**")
-                if has_permission:
-                    st.success("✅ True (has permission)")
-                    st.markdown("---")
-                    st.success("🎉 **RESULT:** You can play the game!\nHave fun!")
-                else:
-                    st.error("❌ False (no permission)")
-                    st.markdown("---")
-                    st.warning("⚠️ **RESULT:** You need parent permission\nAsk your parents!")
-            else:
-                st.error(f"❌ False ({int(age_game)} < 13)")
-                st.caption("Step 2 is skipped")
-                st.markdown("---")
-                st.error("❌ **RESULT:** Sorry, you're too young\nMinimum age is 13")
+        game_access_panel()
         
         st.markdown("---")
         st.markdown("#### 💡 Alternative: Using 'and' Operator")
@@ -495,232 +944,7 @@ else:
     with cond_tabs[4]:
         st.markdown("### 💡 Real-World Examples")
         
-        example_cat = st.selectbox("Choose example:", 
-                                   ["Password Validator", "BMI Calculator", "Time of Day Greeter", "Number Classifier"],
-                                   key="example_category_cond")
-        
-        if example_cat == "Password Validator":
-            st.markdown("#### 🔐 Password Strength Checker")
-            
-            password = st.text_input("Enter password:", value="MyPass123", type="password", key="password_validator")
-            
-            if st.button("✅ Validate Password", key="validate_pass_btn"):
-                length = len(password)
-                has_digit = any(char.isdigit() for char in password)
-                has_upper = any(char.isupper() for char in password)
-                has_lower = any(char.islower() for char in password)
-                
-                st.code(f"""password = "{password}"
-
-# Check conditions
-length = len(password)  # {length}
-has_digit = any(char.isdigit() for char in password)  # {has_digit}
-has_upper = any(char.isupper() for char in password)  # {has_upper}
-has_lower = any(char.islower() for char in password)  # {has_lower}
-
-if length < 6:
-    strength = "Too Short"
-elif length < 8:
-    strength = "Weak"
-elif has_digit and has_upper and has_lower:
-    strength = "Strong"
-elif has_digit or has_upper:
-    strength = "Medium"
-else:
-    strength = "Weak"
-    
-print(f"Password strength: {{strength}}")""", language="python")
-                
-                # Determine strength
-                if length < 6:
-                    strength = "Too Short"
-                    color = "red"
-                    icon = "❌"
-                elif length < 8:
-                    strength = "Weak"
-                    color = "orange"
-                    icon = "⚠️"
-                elif has_digit and has_upper and has_lower:
-                    strength = "Strong"
-                    color = "green"
-                    icon = "✅"
-                elif has_digit or has_upper:
-                    strength = "Medium"
-                    color = "blue"
-                    icon = "🔵"
-                else:
-                    strength = "Weak"
-                    color = "orange"
-                    icon = "⚠️"
-                
-                st.markdown(f"### {icon} Password Strength: {strength}")
-                
-                # Show checks
-                col_check1, col_check2, col_check3, col_check4 = st.columns(4)
-                with col_check1:
-                    if length >= 8:
-                        st.success(f"✅ Length: {length}")
-                    else:
-                        st.error(f"❌ Length: {length}")
-                with col_check2:
-                    if has_digit:
-                        st.success("✅ Has digit")
-                    else:
-                        st.error("❌ No digit")
-                with col_check3:
-                    if has_upper:
-                        st.success("✅ Has uppercase")
-                    else:
-                        st.error("❌ No uppercase")
-                with col_check4:
-                    if has_lower:
-                        st.success("✅ Has lowercase")
-                    else:
-                        st.error("❌ No lowercase")
-        
-        elif example_cat == "BMI Calculator":
-            st.markdown("#### ⚖️ BMI Calculator with Categories")
-            
-            col_bmi1, col_bmi2 = st.columns(2)
-            with col_bmi1:
-                weight = st.number_input("Weight (kg):", value=70.0, min_value=1.0, key="bmi_weight")
-            with col_bmi2:
-                height = st.number_input("Height (m):", value=1.75, min_value=0.1, key="bmi_height")
-            
-            if st.button("📊 Calculate BMI", key="calc_bmi_btn"):
-                bmi = weight / (height ** 2)
-                
-                if bmi < 18.5:
-                    category = "Underweight"
-                    advice = "Consider eating more nutritious foods"
-                elif bmi < 25:
-                    category = "Normal weight"
-                    advice = "Great! Keep it up!"
-                elif bmi < 30:
-                    category = "Overweight"
-                    advice = "Consider more exercise and balanced diet"
-                else:
-                    category = "Obese"
-                    advice = "Consult with a healthcare provider"
-                
-                st.code(f"""weight = {weight}
-height = {height}
-bmi = weight / (height ** 2)  # {bmi:.2f}
-
-if bmi < 18.5:
-    category = "Underweight"
-elif bmi < 25:
-    category = "Normal weight"
-elif bmi < 30:
-    category = "Overweight"
-else:
-    category = "Obese"
-    
-print(f"BMI: {{bmi:.2f}}")
-print(f"Category: {{category}}")""", language="python")
-                
-                st.metric("Your BMI", f"{bmi:.2f}")
-                st.info(f"**Category:** {category}")
-                st.success(f"**Advice:** {advice}")
-        
-        elif example_cat == "Time of Day Greeter":
-            st.markdown("#### 👋 Time-Based Greeting")
-            
-            hour = st.slider("Hour (0-23):", min_value=0, max_value=23, value=14, key="hour_slider")
-            
-            if st.button("👋 Get Greeting", key="get_greeting_btn"):
-                if hour < 6:
-                    greeting = "Good night"
-                    icon = "🌙"
-                    advice = "Time to sleep!"
-                elif hour < 12:
-                    greeting = "Good morning"
-                    icon = "🌅"
-                    advice = "Have a great day ahead!"
-                elif hour < 17:
-                    greeting = "Good afternoon"
-                    icon = "☀️"
-                    advice = "Keep up the good work!"
-                elif hour < 21:
-                    greeting = "Good evening"
-                    icon = "🌆"
-                    advice = "Time to relax!"
-                else:
-                    greeting = "Good night"
-                    icon = "🌙"
-                    advice = "Time to rest!"
-                
-                st.code(f"""hour = {hour}
-
-if hour < 6:
-    greeting = "Good night 🌙"
-elif hour < 12:
-    greeting = "Good morning 🌅"
-elif hour < 17:
-    greeting = "Good afternoon ☀️"
-elif hour < 21:
-    greeting = "Good evening 🌆"
-else:
-    greeting = "Good night 🌙"
-    
-print(greeting)""", language="python")
-                
-                st.markdown(f"## {icon} {greeting}!")
-                st.info(advice)
-        
-        elif example_cat == "Number Classifier":
-            st.markdown("#### 🔢 Number Classifier")
-            
-            num_classify = st.number_input("Enter a number:", value=0, key="num_classify")
-            
-            if st.button("🔍 Classify Number", key="classify_num_btn"):
-                classifications = []
-                
-                # Check multiple properties
-                if num_classify == 0:
-                    classifications.append("Zero")
-                elif num_classify > 0:
-                    classifications.append("Positive")
-                else:
-                    classifications.append("Negative")
-                
-                if num_classify % 2 == 0:
-                    classifications.append("Even")
-                else:
-                    classifications.append("Odd")
-                
-                if num_classify % 5 == 0:
-                    classifications.append("Divisible by 5")
-                
-                if num_classify % 10 == 0:
-                    classifications.append("Divisible by 10")
-                
-                st.code(f"""number = {int(num_classify)}
-
-# Check sign
-if number == 0:
-    print("Zero")
-elif number > 0:
-    print("Positive")
-else:
-    print("Negative")
-
-# Check even/odd
-if number % 2 == 0:
-    print("Even")
-else:
-    print("Odd")
-
-# Check divisibility
-if number % 5 == 0:
-    print("Divisible by 5")
-    
-if number % 10 == 0:
-    print("Divisible by 10")""", language="python")
-                
-                st.markdown("### 📊 Classifications:")
-                for classification in classifications:
-                    st.success(f"✅ {classification}")
+        real_world_examples()
     
     # Key takeaways
     st.markdown("---")
@@ -0,0 +1,3 @@
+"""
+Shared building blocks used by the concept visualizations
+"""
@@ -0,0 +1,161 @@
+"""
+Cards
+Class-based HTML cards shared by the memory and collection views
+
+Every card is a template filled in once per (value, type, colour) and cached, so
+a rerun that shows the same values again does no string building at all. Cards
+whose text runs past MAX_CACHED_LENGTH are built every time instead: the cache is
+shared by every session, and one huge value shouldn't stay pinned in it. The
+styling lives in static/styles.css; a card only carries its colour, as the
+--card-color custom property.
+"""
+
+import functools
+import html
+
+import streamlit as st
+
+# One colour per Python type, so an int looks the same on every tab
+TYPE_COLORS = {
+    'int': '#4CAF50',
+    'float': '#2196F3',
+    'str': '#FF9800',
+    'bool': '#9C27B0'
+}
+DEFAULT_COLOR = '#757575'
+
+# Rendered cards kept per card kind, shared by every session
+CACHE_SIZE = 4096
+
+# Cards with more text than this, all fields together, are never cached
+MAX_CACHED_LENGTH = 256
+
+_MEMORY = (
+    "<div class='card memory-card' style='--card-color:{color}'><div>"
+    "<div class='card-address'>📍 Memory: <code>{address}</code></div>"
+    "<div class='card-name'>{name}</div>"
+    "<div class='card-value'>= {value}</div>{shared}</div>"
+    "<div class='card-pill'>{type_name}</div></div>"
+)
+_SHARED = "<div class='card-shared'>🔗 Same object as: {names}</div>"
+_ITEM = (
+    "<div class='card item-card' style='--card-color:{color}'>"
+    "<div class='card-label'>{label}</div>"
+    "<div class='card-value'>{value}</div>"
+    "<div class='card-type'>({type_name})</div></div>"
+)
+_BUBBLE = "<div class='card bubble-card' style='--card-color:{color}'>{value}</div>"
+_SCOPE = (
+    "<div class='card scope-card{local}' style='--card-color:{color}'>{badge}"
+    "<div class='card-line'><span class='card-name'>{name}</span>"
+    "<span class='card-value'>{value}</span></div></div>"
+)
+_BADGE = "<div class='card-badge'>{badge}</div>"
+_BANNER = "<div class='card banner-card' style='--card-color:{color}'>{text}</div>"
+_INSTANCE = (
+    "<div class='card instance-card' style='--card-color:{color}'>"
+    "<div class='card-name'>{title}</div>{fields}</div>"
+)
+_FIELD = "<div class='card-field'><b>{label}:</b> {value}</div>"
+
+def _length(args):
+    """Characters of text in a card's arguments, counting inside tuples of fields"""
+    return sum(len(arg) if isinstance(arg, str) else _length(arg) if isinstance(arg, tuple) else 0
+               for arg in args)
+
+def _cached(func):
+    """lru_cache func, but build cards with more than MAX_CACHED_LENGTH characters uncached"""
+    cached = functools.lru_cache(maxsize=CACHE_SIZE)(func)
+
+    @functools.wraps(func)
+    def build(*args):
+        if _length(args) > MAX_CACHED_LENGTH:
+            return func(*args)
+        return cached(*args)
+
+    build.cache_info = cached.cache_info
+    build.cache_clear = cached.cache_clear
+    return build
+
+def _text(value):
+    """Escape a value for a card; newlines become <br> so they can't end the HTML block"""
+    return html.escape(str(value)).replace("\n", "<br>")
+
+def type_color(value):
+    """Card colour for a value's type"""
+    return TYPE_COLORS.get(type(value).__name__, DEFAULT_COLOR)
+
+@_cached
+def _memory_card(name, value, type_name, color, address, shared):
+    return _MEMORY.format(name=_text(name), value=_text(value), type_name=type_name,
+                          color=color, address=address,
+                          shared=_SHARED.format(names=_text(", ".join(shared))) if shared else "")
+
+def memory_card(name, value, type_name, color, address, shared=()):
+    """Variable box: name, value, type pill, memory address and any names sharing the object"""
+    return _memory_card(name, str(value), type_name, color, address, tuple(shared))
+
+@_cached
+def _item_card(label, value, type_name, color):
+    return _ITEM.format(label=_text(label), value=_text(value), type_name=type_name, color=color)
+
+def item_card(label, value, color=None):
+    """Collection item: a label (index, KEY, ...), the value and its type"""
+    return _item_card(label, str(value), type(value).__name__, color or type_color(value))
+
+@_cached
+def _bubble_card(value, color):
+    return _BUBBLE.format(value=_text(value), color=color)
+
+def bubble_card(value, color):
+    """Round card for a set member - sets have no index to show"""
+    return _bubble_card(str(value), color)
+
+@_cached
+def _scope_card(name, value, color, badge, local):
+    return _SCOPE.format(name=_text(name), value=_text(value), color=color,
+                         badge=_BADGE.format(badge=badge) if badge else "",
+                         local=" local" if local else "")
+
+def scope_card(name, value, color, badge=None, local=False):
+    """One name = value line of a namespace; local cards sit inside a function frame"""
+    return _scope_card(name, str(value), color, badge, local)
+
+@_cached
+def banner_card(text, color):
+    """Full-width coloured strip for a single highlighted fact"""
+    return _BANNER.format(text=_text(text), color=color)
+
+@_cached
+def _instance_card(title, fields, color):
+    rows = "".join(_FIELD.format(label=_text(label), value=_text(value)) for label, value in fields)
+    return _INSTANCE.format(title=_text(title), fields=rows, color=color)
+
+def instance_card(title, fields, color):
+    """Object box: a title and its attribute: value lines, given as (label, value) pairs"""
+    return _instance_card(title, tuple((label, str(value)) for label, value in fields), color)
+
+def card(html_card):
+    """Render one card as its own element"""
+    st.markdown(html_card, unsafe_allow_html=True)
+
+def card_stack(cards):
+    """Render cards one above the other as a single element"""
+    st.markdown(f"<div>{''.join(cards)}</div>", unsafe_allow_html=True)
+
+def card_row(cards):
+    """Render cards side by side, wrapping onto new lines, as a single element"""
+    st.markdown(f"<div class='card-row'>{''.join(cards)}</div>", unsafe_allow_html=True)
+
+def card_pairs(pairs):
+    """Render (left, right) cards joined by an arrow, one pair per line, as a single element"""
+    rows = "".join(
+        f"<div class='card-pair'>{left}<div class='card-arrow'>→</div>{right}</div>"
+        for left, right in pairs
+    )
+    st.markdown(f"<div>{rows}</div>", unsafe_allow_html=True)
+
+def card_frame(title, cards):
+    """Render cards inside a dashed frame (e.g. a function's local namespace)"""
+    st.markdown(f"<div class='card-frame'><div class='card-frame-title'>{title}</div>"
+                f"{''.join(cards)}</div>", unsafe_allow_html=True)
@@ -0,0 +1,48 @@
+"""
+Character Strips
+Draws a string's characters with their indexes as a single element per row
+"""
+
+import html
+import os
+
+import streamlit as st
+
+# Cells drawn per strip; longer strings show their start and end around a gap
+MAX_CELLS = max(2, int(os.environ.get("VISUALIZER_MAX_CELLS", "120")))
+
+def _cell(index, char, included=None):
+    css = ""
+    mark = ""
+    if included is not None:
+        css = " included" if included else " excluded"
+        mark = f"<div class='char-mark'>{'✓' if included else '✗'}</div>"
+    return (f"<div class='char-cell{css}'><div class='char-index'>{index}</div>"
+            f"<div class='char-value'>{html.escape(char)}</div>{mark}</div>")
+
+def strip_html(text, variant="positive", included=None):
+    """HTML for one wrapping row of character cells
+
+    variant "positive" or "negative" picks the index labels and colours. Pass a
+    set of indexes as included to tick the characters a slice keeps instead.
+    """
+    length = len(text)
+    shown = range(length)
+    hidden = 0
+    if length > MAX_CELLS:
+        edge = MAX_CELLS // 2
+        shown = list(range(edge)) + list(range(length - edge, length))
+        hidden = length - 2 * edge
+
+    cells = []
+    for i in shown:
+        if hidden and i == length - MAX_CELLS // 2:
+            cells.append(f"<div class='char-gap'>⋯ {hidden:,} more ⋯</div>")
+        label = i - length if variant == "negative" else i
+        cells.append(_cell(label, text[i], None if included is None else i in included))
+
+    return f"<div class='char-strip {variant}'>{''.join(cells)}</div>"
+
+def char_strip(text, variant="positive", included=None):
+    """Render strip_html() as one markdown element"""
+    st.markdown(strip_html(text, variant, included), unsafe_allow_html=True)
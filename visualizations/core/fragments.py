@@ -0,0 +1,62 @@
+"""
+Fragment Panels
+Lets each interactive "Try it" panel rerun on its own instead of rerunning the whole app
+"""
+
+import functools
+import os
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from visualizations.core import persistence, session_limits
+from visualizations.core.profiler import profiled_panel
+
+# Set VISUALIZER_FRAGMENTS=0 to run panels as part of the full script again
+FRAGMENTS_ENABLED = os.environ.get("VISUALIZER_FRAGMENTS", "1") != "0"
+
+def panel(func):
+    """Run a panel function as an st.fragment so its widgets only rerun that panel
+
+    Panels that change state shown elsewhere on the page should still call
+    st.rerun(), which reruns the full app; use rerun_panel() otherwise.
+    """
+    func = profiled_panel(func)
+    if FRAGMENTS_ENABLED and hasattr(st, "fragment"):
+        return st.fragment(_session_run(func))
+    return func
+
+def _session_run(func):
+    """A fragment rerun skips app.py, so do its session bookkeeping here too
+
+    That is unpacking an idle-compacted session first, and capping and
+    saving what the panel changed last. A panel running as part of the full
+    app leaves the capping and saving to the end of the script.
+    """
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        session_limits.start_run(full=False)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if _fragment_run():
+                session_limits.enforce()
+                persistence.save()
+            session_limits.end_run()
+    return run
+
+def _fragment_run():
+    """True while Streamlit reruns fragments on their own rather than the full app"""
+    ctx = get_script_run_ctx()
+    return ctx is not None and bool(getattr(ctx, "fragment_ids_this_run", None))
+
+def rerun_panel():
+    """Rerun only the current panel, or the whole app when this run isn't a fragment rerun
+
+    Streamlit refuses a fragment-scoped rerun during a full-app run - which is
+    how panels run on page load, under AppTest, and when Streamlit merges a
+    fragment rerun into a pending full rerun.
+    """
+    if FRAGMENTS_ENABLED and hasattr(st, "fragment") and _fragment_run():
+        st.rerun(scope="fragment")
+    st.rerun()
@@ -0,0 +1,85 @@
+"""
+Iteration Rendering
+Shows long loops as the first and last few iterations plus one page of the middle
+"""
+
+import math
+import os
+
+import streamlit as st
+
+# Most iteration rows drawn for a single loop run (head + one middle page + tail)
+ITERATION_BUDGET = max(3, int(os.environ.get("VISUALIZER_ITERATION_BUDGET", "30")))
+
+# Largest value a number_input can hold in the browser
+MAX_SAFE_INTEGER = 2 ** 53 - 1
+
+def sequence_length(sequence):
+    """len() that also works for ranges too long for a C ssize_t"""
+    try:
+        return len(sequence)
+    except OverflowError:
+        # Only ranges get here - everything else is already in memory
+        start, stop, step = sequence.start, sequence.stop, sequence.step
+        if step > 0:
+            return max(0, (stop - start + step - 1) // step)
+        return max(0, (start - stop - step - 1) // -step)
+
+def run_button(label, key, params):
+    """Button whose run stays on screen across reruns (e.g. while paging)
+
+    Returns the params saved by the last click, or None before the first click.
+    """
+    if st.button(label, key=key):
+        st.session_state[f"{key}_params"] = params
+        st.session_state[f"{key}_page"] = 1
+    return st.session_state.get(f"{key}_params")
+
+def _gap(count):
+    st.markdown(
+        f"<div style='text-align: center; color: #888; padding: 6px 0;'>"
+        f"⋮ {count:,} more iteration{'s' if count != 1 else ''} ⋮</div>",
+        unsafe_allow_html=True
+    )
+
+def render_iterations(key, sequence, render_row, budget=None):
+    """Render render_row(number, item) for the first and last iterations and a paged middle
+
+    sequence only needs len() and indexing (a range, list or str), so huge
+    ranges are never turned into lists. Returns the total number of iterations.
+    """
+    budget = budget or ITERATION_BUDGET
+    total = sequence_length(sequence)
+
+    if total <= budget:
+        for number in range(total):
+            render_row(number + 1, sequence[number])
+        return total
+
+    edge = budget // 3
+    page_size = budget - 2 * edge
+    middle = total - 2 * edge
+    pages = min(math.ceil(middle / page_size), MAX_SAFE_INTEGER)
+
+    for number in range(edge):
+        render_row(number + 1, sequence[number])
+
+    st.info(f"🔎 This loop runs **{total:,}** times - showing the first {edge}, "
+            f"the last {edge}, and one page of {page_size} from the middle.")
+    page = st.number_input(f"Middle page (1-{pages:,})", min_value=1, max_value=pages,
+                           step=1, key=f"{key}_page")
+
+    first = edge + (int(page) - 1) * page_size
+    last = min(first + page_size, total - edge)
+
+    if first > edge:
+        _gap(first - edge)
+    for number in range(first, last):
+        render_row(number + 1, sequence[number])
+    if last < total - edge:
+        _gap(total - edge - last)
+
+    for number in range(total - edge, total):
+        render_row(number + 1, sequence[number])
+
+    return total
@@ -0,0 +1,92 @@
+"""
+List History
+Undo/redo timeline for a list that stores each edit instead of a copy of the list
+
+Every change is recorded as one splice - lst[start:start + len(old)] = new -
+together with the items it replaced. An append, pop or edit costs a step of one
+or two items however long the list is, and the items are shared with the list,
+never copied. Whole-list changes (sort, reverse, clear) keep the items before
+and after.
+"""
+
+import os
+
+# Steps kept, and items held across all steps, before the oldest steps are dropped
+MAX_STEPS = max(1, int(os.environ.get("VISUALIZER_LIST_HISTORY", "50")))
+MAX_ITEMS = 2000
+
+class ListHistory:
+    """The steps that led to a list, and how many of them are applied"""
+
+    def __init__(self, max_steps=MAX_STEPS, max_items=MAX_ITEMS):
+        self.max_steps = max_steps
+        self.max_items = max_items
+        self.steps = []      # (label, start, old items, new items)
+        self.position = 0    # steps[:position] are applied
+        self.items = 0       # items held by all steps together
+        self.length = None   # len() the list should have at this position
+
+    def __len__(self):
+        return len(self.steps)
+
+    def clear(self):
+        self.steps = []
+        self.position = 0
+        self.items = 0
+
+    def sync(self, lst):
+        """Start over if lst was changed without going through splice() (e.g. trimmed to its cap)"""
+        if self.length is not None and len(lst) != self.length:
+            self.clear()
+        self.length = len(lst)
+
+    def splice(self, lst, label, start, stop, new):
+        """lst[start:stop] = new as one step; any undone steps are dropped"""
+        old = tuple(lst[start:stop])
+        new = tuple(new)
+        lst[start:stop] = new
+
+        for _, _, undone_old, undone_new in self.steps[self.position:]:
+            self.items -= len(undone_old) + len(undone_new)
+        del self.steps[self.position:]
+        self.steps.append((label, start, old, new))
+        self.items += len(old) + len(new)
+        self.position = len(self.steps)
+        self.length = len(lst)
+
+        # Always keep the newest step, even if it is bigger than the budget
+        while len(self.steps) > 1 and (len(self.steps) > self.max_steps or self.items > self.max_items):
+            _, _, dropped_old, dropped_new = self.steps.pop(0)
+            self.items -= len(dropped_old) + len(dropped_new)
+            self.position -= 1
+
+    def undo(self, lst):
+        """Put back what the last applied step replaced - returns its label, or None"""
+        if self.position == 0:
+            return None
+        label, start, old, new = self.steps[self.position - 1]
+        lst[start:start + len(new)] = old
+        self.position -= 1
+        self.length = len(lst)
+        return label
+
+    def redo(self, lst):
+        """Apply the next undone step again - returns its label, or None"""
+        if self.position == len(self.steps):
+            return None
+        label, start, old, new = self.steps[self.position]
+        lst[start:start + len(old)] = new
+        self.position += 1
+        self.length = len(lst)
+        return label
+
+    def seek(self, lst, position):
+        """Undo or redo until position steps are applied"""
+        while self.position > position:
+            self.undo(lst)
+        while self.position < position:
+            self.redo(lst)
+
+    def label(self, position):
+        """Timeline label for the list as it is after position steps"""
+        return "⏮ start" if position == 0 else f"{position}: {self.steps[position - 1][0]}"
@@ -0,0 +1,124 @@
+"""
+Memory Model
+Names bound to real Python objects, addressed by id() the way CPython does it
+
+The model keeps a reference to every object a name is bound to, so an id()
+stays unique for as long as something refers to it - exactly the guarantee
+CPython gives. Two names bound to the same object share one address, which is
+how aliasing, small-int caching and string interning become visible.
+"""
+
+import html
+import sys
+
+# Above this many names the reference diagram gets too dense to read
+DIAGRAM_LIMIT = 40
+
+def as_python_would(value):
+    """Share objects the way CPython shares literals in a program
+
+    Small ints (-5..256), True/False and None are already singletons. Strings
+    that look like identifiers are interned by the compiler, so intern them too.
+    """
+    if isinstance(value, str) and value.isidentifier():
+        return sys.intern(value)
+    return value
+
+def format_address(address):
+    return f"0x{address:x}"
+
+def _quote(text):
+    """A DOT double-quoted string"""
+    return '"' + str(text).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+class MemoryModel:
+    """A namespace (name -> object) plus an index of object -> names"""
+
+    def __init__(self):
+        self.objects = {}    # id -> object, which also keeps the id from being reused
+        self.names = {}      # name -> id
+        self.referrers = {}  # id -> names bound to it, so "who shares this?" is one lookup
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getstate__(self):
+        # ids are only valid in this process, so pickle each object once plus
+        # the names bound to it - pickle itself doesn't keep ints shared
+        return [(obj, sorted(self.referrers[address])) for address, obj in self.objects.items()]
+
+    def __setstate__(self, objects):
+        self.__init__()
+        for obj, names in objects:
+            for name in names:
+                self.bind(name, obj)
+
+    def bind(self, name, value):
+        """name = value - returns the id of the object name now refers to"""
+        value = as_python_would(value)
+        self.unbind(name)
+        address = id(value)
+        self.objects.setdefault(address, value)
+        self.names[name] = address
+        self.referrers.setdefault(address, set()).add(name)
+        return address
+
+    def alias(self, name, other):
+        """name = other - bind name to the object other refers to, not a copy"""
+        return self.bind(name, self.value(other))
+
+    def unbind(self, name):
+        """del name - the object is dropped once no name refers to it"""
+        address = self.names.pop(name, None)
+        if address is None:
+            return
+        sharers = self.referrers[address]
+        sharers.discard(name)
+        if not sharers:
+            del self.referrers[address]
+            del self.objects[address]
+
+    def clear(self):
+        self.objects.clear()
+        self.names.clear()
+        self.referrers.clear()
+
+    def value(self, name):
+        return self.objects[self.names[name]]
+
+    def address(self, name):
+        return format_address(self.names[name])
+
+    def shared_with(self, name):
+        """Other names bound to the same object, sorted"""
+        return sorted(self.referrers[self.names[name]] - {name})
+
+    def to_dot(self):
+        """Graphviz DOT source: one node per name, one per object, an arrow per binding"""
+        lines = [
+            "digraph memory {",
+            "  rankdir=LR; bgcolor=transparent;",
+            "  node [fontname=Helvetica, fontsize=11];",
+            "  subgraph cluster_names { label=\"Names\"; style=dashed; color=\"#2196F3\";",
+        ]
+        for name in self.names:
+            lines.append(f"    {_quote('n_' + name)} [label={_quote(name)}, shape=box, "
+                         f"style=\"rounded,filled\", fillcolor=\"#E3F2FD\"];")
+        lines.append("  }")
+        lines.append("  subgraph cluster_objects { label=\"Objects\"; style=dashed; color=\"#4CAF50\";")
+        for address, obj in self.objects.items():
+            text = repr(obj)
+            if len(text) > 24:
+                text = text[:21] + "..."
+            label = (f"<<b>{html.escape(type(obj).__name__)}</b><br/>{html.escape(text, quote=False)}"
+                     f"<br/><font point-size=\"9\">{format_address(address)}</font>>")
+            lines.append(f"    o_{address} [label={label}, shape=box, style=filled, "
+                         f"fillcolor=\"#E8F5E9\"];")
+        lines.append("  }")
+        for name, address in self.names.items():
+            lines.append(f"  {_quote('n_' + name)} -> o_{address};")
+        lines.append("}")
+        return "\n".join(lines)
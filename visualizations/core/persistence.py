@@ -0,0 +1,174 @@
+"""
+Persistence
+Saves each student's session state to SQLite so it survives server restarts
+
+A session is identified by a token in the page URL (?session=...), so a browser
+that reconnects after a restart - or a student who refreshes the page - gets
+their lists, dicts, accounts and variables back. save() pickles the keys under
+session_limits management at the end of a run - the script's, or a panel
+fragment's when only that panel reran - but only when they changed, and hands
+the bytes to a background writer. The writer waits FLUSH_INTERVAL seconds
+to collect more, compresses them and writes the whole batch in one transaction,
+so a rerun never waits on disk.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import pickle
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+
+import streamlit as st
+
+from visualizations.core import session_limits
+
+PERSIST_ENABLED = os.environ.get("VISUALIZER_PERSIST", "1") != "0"
+# Put this on a volume that outlives the container
+DB_PATH = os.environ.get("VISUALIZER_STATE_DB", "session_state.db")
+# Snapshots not updated for this many days are deleted when the writer starts
+KEEP_DAYS = int(os.environ.get("VISUALIZER_STATE_KEEP_DAYS", "7"))
+FLUSH_INTERVAL = 2
+
+TOKEN_PARAM = "session"
+STATE_KEY = "_persistence"
+
+_LOGGER = logging.getLogger(__name__)
+
+# token -> pickled snapshot not yet committed, latest wins
+_pending = {}
+_lock = threading.Lock()
+_wake = threading.Event()
+_writer = None
+
+def _connect():
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS snapshots "
+                 "(token TEXT PRIMARY KEY, data BLOB NOT NULL, saved REAL NOT NULL)")
+    return conn
+
+def _token():
+    """This page's token from the URL, creating one on the first visit"""
+    token = st.query_params.get(TOKEN_PARAM, "")
+    if not (0 < len(token) <= 64 and token.replace("-", "").replace("_", "").isalnum()):
+        token = secrets.token_urlsafe(12)
+        st.query_params[TOKEN_PARAM] = token
+    return token
+
+def _load(token):
+    """The latest snapshot for a token as a dict, or {} - a pending one beats the database"""
+    with _lock:
+        data = _pending.get(token)
+    if data is None:
+        conn = _connect()
+        try:
+            row = conn.execute("SELECT data FROM snapshots WHERE token = ?", (token,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return {}
+        data = zlib.decompress(row[0])
+    return pickle.loads(data)
+
+def restore():
+    """Call at the top of the script: brings back a saved session on its first run"""
+    if not PERSIST_ENABLED or STATE_KEY in st.session_state:
+        return
+
+    token = _token()
+    try:
+        values = _load(token)
+    except Exception:
+        # e.g. a snapshot from a release whose classes have since changed
+        _LOGGER.exception("Could not restore session %s", token)
+        values = {}
+    for key, value in values.items():
+        st.session_state[key] = value
+    st.session_state[STATE_KEY] = {
+        'token': token,
+        # Restored keys are saved again even before their module is imported
+        'keys': set(values),
+        'digest': None
+    }
+
+def save():
+    """Call at the end of the script: queues a snapshot if the managed state changed"""
+    info = st.session_state.get(STATE_KEY)
+    if not PERSIST_ENABLED or info is None:
+        return
+
+    keys = sorted(info['keys'].union(session_limits.managed_keys()))
+    values = {key: st.session_state[key] for key in keys if key in st.session_state}
+    try:
+        data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        _LOGGER.exception("Could not snapshot session %s", info['token'])
+        return
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if digest == info['digest']:
+        return
+    info['digest'] = digest
+    info['keys'].update(values)
+
+    with _lock:
+        _pending[info['token']] = data
+    _start_writer()
+    _wake.set()
+
+def _flush(conn):
+    """Write every pending snapshot in one transaction"""
+    with _lock:
+        batch = dict(_pending)
+    if not batch:
+        return
+    now = time.time()
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO snapshots (token, data, saved) VALUES (?, ?, ?)",
+                         [(token, zlib.compress(data), now) for token, data in batch.items()])
+    with _lock:
+        # Keep anything saved again while this batch was being written
+        for token, data in batch.items():
+            if _pending.get(token) is data:
+                del _pending[token]
+
+def _writer_loop():
+    conn = _connect()
+    with conn:
+        conn.execute("DELETE FROM snapshots WHERE saved < ?", (time.time() - KEEP_DAYS * 86400,))
+    while True:
+        _wake.wait()
+        # Let a burst of reruns settle into one write
+        time.sleep(FLUSH_INTERVAL)
+        _wake.clear()
+        try:
+            _flush(conn)
+        except Exception:
+            _LOGGER.exception("Could not write session snapshots")
+
+def _start_writer():
+    global _writer
+    if _writer is not None:
+        return
+    with _lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name="session-writer", daemon=True)
+            _writer.start()
+
+@atexit.register
+def _flush_at_exit():
+    """Write what the writer hasn't yet, so a restart loses nothing"""
+    if not _pending:
+        return
+    try:
+        conn = _connect()
+        try:
+            _flush(conn)
+        finally:
+            conn.close()
+    except Exception:
+        _LOGGER.exception("Could not write session snapshots on exit")
@@ -0,0 +1,146 @@
+"""
+Render Profiler
+Opt-in timing of concept entry points and panels: wall time, elements and bytes sent
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Set VISUALIZER_PROFILE=1 to record every entry-point and panel run
+PROFILE_ENABLED = os.environ.get("VISUALIZER_PROFILE", "0") == "1"
+PROFILE_LOG = os.environ.get("VISUALIZER_PROFILE_LOG", "profile_log.jsonl")
+
+# How many of a session's latest runs the admin panel keeps
+RECENT_RUNS = 25
+
+# Per-tab totals shared by every session in this server process
+_tab_stats = {}
+_lock = threading.Lock()
+
+# Each session runs its script on its own thread; tracks profiled calls in progress
+_active = threading.local()
+
+def _start_counting(ctx, record):
+    """Wrap the session's message queue so every ForwardMsg is counted in record"""
+    original = ctx._enqueue
+
+    def enqueue(msg):
+        record['messages'] += 1
+        record['bytes'] += msg.ByteSize()
+        if msg.WhichOneof('type') == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+            record['elements'] += 1
+        original(msg)
+
+    ctx._enqueue = enqueue
+    return original
+
+def _save(record):
+    """Add a finished run to the per-tab totals and the JSON-lines log"""
+    with _lock:
+        with open(PROFILE_LOG, "a") as log:
+            log.write(json.dumps(record) + "\n")
+
+        # Panels inside a full render are already part of that render's numbers
+        if record['nested']:
+            return
+
+        kind = "full" if record['scope'] == "show" else "fragment"
+        stats = _tab_stats.setdefault((record['tab'], kind), {
+            'tab': record['tab'],
+            'kind': kind,
+            'runs': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'elements': 0,
+            'bytes': 0
+        })
+        stats['runs'] += 1
+        stats['total_ms'] += record['wall_ms']
+        stats['max_ms'] = max(stats['max_ms'], record['wall_ms'])
+        stats['elements'] += record['elements']
+        stats['bytes'] += record['bytes']
+
+def profiled(tab, func, scope="show"):
+    """Return func wrapped so each call is timed and its output counted"""
+    if not PROFILE_ENABLED:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return func(*args, **kwargs)
+
+        record = {
+            'ts': time.time(),
+            'session': ctx.session_id,
+            'tab': tab,
+            'scope': scope,
+            'nested': getattr(_active, 'depth', 0) > 0,
+            'wall_ms': 0.0,
+            'elements': 0,
+            'messages': 0,
+            'bytes': 0
+        }
+        original = _start_counting(ctx, record)
+        _active.depth = getattr(_active, 'depth', 0) + 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record['wall_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            _active.depth -= 1
+            ctx._enqueue = original
+            _save(record)
+
+            runs = st.session_state.setdefault('profile_runs', [])
+            runs.append(record)
+            del runs[:-RECENT_RUNS]
+
+    return wrapper
+
+def profiled_panel(func):
+    """Profile a panel function under its module's tab name"""
+    return profiled(func.__module__.rsplit(".", 1)[-1], func, scope=func.__name__)
+
+def tab_summary():
+    """Per-tab averages for full reruns and fragment reruns, slowest first"""
+    with _lock:
+        rows = [{
+            'tab': stats['tab'],
+            'kind': stats['kind'],
+            'runs': stats['runs'],
+            'avg_ms': round(stats['total_ms'] / stats['runs'], 2),
+            'max_ms': stats['max_ms'],
+            'avg_elements': round(stats['elements'] / stats['runs'], 1),
+            'avg_kb': round(stats['bytes'] / stats['runs'] / 1024, 1)
+        } for stats in _tab_stats.values()]
+    return sorted(rows, key=lambda row: row['avg_ms'], reverse=True)
+
+def show_admin_panel():
+    """Hidden sidebar panel with render stats - open the app with ?admin=1"""
+    if not PROFILE_ENABLED or st.query_params.get("admin") != "1":
+        return
+
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### ⏱️ Render Profile")
+        st.caption(f"Full log: `{PROFILE_LOG}`")
+
+        st.markdown("**Per tab (all sessions)**")
+        st.caption("full = whole-page rerun of the tab, fragment = one panel on its own")
+        st.dataframe(tab_summary(), hide_index=True)
+
+        st.markdown("**Recent runs (this session)**")
+        recent = [
+            {key: run[key] for key in ('tab', 'scope', 'wall_ms', 'elements', 'bytes')}
+            for run in reversed(st.session_state.get('profile_runs', []))
+            if not run['nested']
+        ]
+        st.dataframe(recent, hide_index=True)
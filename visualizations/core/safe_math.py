@@ -0,0 +1,124 @@
+"""
+Safe Math
+Estimates how big an arithmetic result will be before computing it
+
+A student can type 99999 ** 99999 into any calculator panel. Python would
+happily spend seconds building a ~500,000-digit int (and minutes more turning it
+into text) on the shared server thread, and a running big-int operation cannot
+be interrupted. So evaluate() works out the size first with logarithms and only
+computes results of at most MAX_DIGITS digits, which keeps every operation well
+under a millisecond. Anything bigger raises ResultTooLarge with a cheap preview:
+the leading digits (from the logarithm) and the trailing digits (modular
+arithmetic), which is all a reader can take in anyway.
+"""
+
+import math
+import operator
+import os
+
+# Biggest result that is actually computed. Python 3.11+ refuses to print ints
+# over 4300 digits, so this also keeps every computed result printable.
+MAX_DIGITS = int(os.environ.get("VISUALIZER_MAX_DIGITS", "4000"))
+
+# Digits kept at each end when a long number is shown abbreviated
+EDGE_DIGITS = 12
+
+OPERATIONS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": operator.mod,
+    "**": operator.pow,
+}
+
+class ResultTooLarge(ArithmeticError):
+    """Raised instead of computing a result with more than MAX_DIGITS digits"""
+
+    def __init__(self, digits, preview):
+        super().__init__(f"The result would have about {digits:,} digits")
+        self.digits = digits
+        self.preview = preview
+
+def _log10(value):
+    """log10(|value|), or 0 for zero - math.log10 accepts ints of any size"""
+    value = abs(value)
+    return math.log10(value) if value else 0.0
+
+def estimate_log10(a, op, b):
+    """Estimate of log10(|a op b|), found without computing a op b
+
+    Adding and subtracting take time linear in the digits, so for + and -
+    the result is computed and its log10 is exact.
+    """
+    log_a, log_b = _log10(a), _log10(b)
+    if op == "**":
+        return b * log_a if a else 0.0
+    if op == "*":
+        return log_a + log_b
+    if op in ("+", "-"):
+        return _log10(OPERATIONS[op](a, b))
+    if op in ("/", "//"):
+        return log_a - log_b if b else log_a
+    if op == "%":
+        return min(log_a, log_b)
+    raise ValueError(f"Unknown operator {op!r}")
+
+def _digit_count(log):
+    return int(log) + 1 if log > 0 else 1
+
+def _preview(a, op, b, log):
+    """Leading and trailing digits of a huge a op b, without computing it"""
+    if op == "**":
+        negative = a < 0 and isinstance(b, int) and b % 2 == 1
+    elif op in ("+", "-"):
+        negative = OPERATIONS[op](a, b) < 0
+    else:
+        negative = (a < 0) != (b < 0)
+    sign = "-" if negative else ""
+
+    exponent = math.floor(log)
+    # Past ~10^12 the float logarithm no longer pins down the leading digits
+    if log < 1e12:
+        mantissa = 10 ** (log - exponent)
+        text = f"≈ {sign}{mantissa:.6f} × 10^{exponent:,}"
+    else:
+        text = f"≈ {sign}10^{exponent:,}"
+
+    # Modular arithmetic gives the last digits of sums, products and powers only
+    if isinstance(a, int) and isinstance(b, int) and b >= 0 and op in ("**", "*", "+", "-"):
+        modulus = 10 ** EDGE_DIGITS
+        if op == "**":
+            tail = pow(a, b, modulus)
+        elif op == "*":
+            tail = (a % modulus) * (b % modulus) % modulus
+        else:
+            tail = OPERATIONS[op](a, b) % modulus
+        if negative:
+            tail = (modulus - tail) % modulus
+        text += f", ending in …{tail:0{EDGE_DIGITS}d}"
+    return text
+
+def evaluate(a, op, b):
+    """Return a op b, or raise ResultTooLarge if it would exceed MAX_DIGITS digits
+
+    Errors Python itself raises (ZeroDivisionError, OverflowError for floats)
+    are passed through unchanged so the panels can still teach them.
+    """
+    # Only ints can grow without bound; float arithmetic takes constant time
+    # and ends in inf, nan or OverflowError on its own
+    if isinstance(a, int) and isinstance(b, int):
+        log = estimate_log10(a, op, b)
+        if log >= MAX_DIGITS:
+            raise ResultTooLarge(_digit_count(log), _preview(a, op, b, log))
+    return OPERATIONS[op](a, b)
+
+def format_number(value):
+    """str(value), with the middle of very long ints replaced by an ellipsis"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        text = str(abs(value))
+        if len(text) > 3 * EDGE_DIGITS:
+            sign = "-" if value < 0 else ""
+            return f"{sign}{text[:EDGE_DIGITS]}…{text[-EDGE_DIGITS:]} ({len(text):,} digits)"
+    return str(value)
@@ -0,0 +1,271 @@
+"""
+Sandbox
+Runs snippets through the tracer in a pool of resource-limited worker processes
+
+The Streamlit server never executes snippet code itself. Workers are started
+ahead of time as `python -m visualizations.core.sandbox`, import only the
+tracer and the timer, and each is reused for many snippets. (They aren't
+multiprocessing children: Streamlit makes the app script __main__, and those
+re-run it.) A worker forks a child for every job, and the child closes the
+worker's pipes to the server before the snippet starts, so nothing the snippet
+can reach leads back to the server. Inside the child setrlimit caps CPU time,
+memory and file writes; the server also kills any worker that hasn't answered
+within the job's wall-clock budget (WALL_SECONDS for a snippet) and starts a
+fresh one, so a runaway snippet costs at most one worker for a few seconds.
+
+Jobs and replies travel as JSON, never pickles, and the server checks the
+shape of every reply before it uses it: a reply it can't read counts as a
+killed worker.
+"""
+
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+from multiprocessing.connection import Connection
+
+from visualizations.core import timing, tracer
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Set VISUALIZER_SANDBOX=0 to trace in the server process (local development only).
+# Workers need POSIX pipes and rlimits, so Windows always traces in process.
+SANDBOX_ENABLED = os.environ.get("VISUALIZER_SANDBOX", "1") != "0" and os.name == "posix"
+WORKERS = max(1, int(os.environ.get("VISUALIZER_SANDBOX_WORKERS", "2")))
+WALL_SECONDS = float(os.environ.get("VISUALIZER_SANDBOX_SECONDS", "3"))
+MEMORY_BYTES = int(os.environ.get("VISUALIZER_SANDBOX_MEMORY_MB", "256")) * 1024 * 1024
+# CPU seconds per snippet - the rlimit fires before the wall-clock kill
+CPU_SECONDS = 1
+# Timing operators keeps the CPU busy on purpose, so those jobs get more of both
+TIMING_CPU_SECONDS = 3
+TIMING_WALL_SECONDS = WALL_SECONDS + TIMING_CPU_SECONDS
+
+# Snippets one worker runs before it is replaced, so nothing can build up in it
+JOBS_PER_WORKER = 200
+
+# Longest reply the server reads from a worker
+MAX_REPLY_BYTES = 16 * 1024 * 1024
+
+# Directory holding the visualizations package, so workers can import it
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _trace_job(source, max_steps, max_seconds):
+    return tracer.trace(source, max_steps, max_seconds).to_plain()
+
+def _read_trace(args, plain):
+    return tracer.Trace.from_plain(args[0], plain)
+
+def _read_timings(args, plain):
+    return timing.from_plain(plain)
+
+# What a worker can be asked to do:
+# job -> (function run in the child, reader of its result in the server, CPU seconds, wall-clock seconds)
+_JOBS = {
+    'trace': (_trace_job, _read_trace, CPU_SECONDS, WALL_SECONDS),
+    'time': (timing.measure, _read_timings, TIMING_CPU_SECONDS, TIMING_WALL_SECONDS)
+}
+
+# Errors a job can refuse a snippet with, rebuilt in the server from their name
+_REFUSALS = {'SyntaxError', 'UnsafeCode'}
+
+def _address_space():
+    """Bytes of address space this process already uses (0 if unknown)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError):
+        return 0
+
+def _limit_resources():
+    """Limits for the whole life of a worker: memory on top of what it uses now, no files, no core dumps"""
+    memory = _address_space() + MEMORY_BYTES
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+def _limit_cpu(seconds):
+    """CPU seconds for the child running one job - a forked child starts with none used"""
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    resource.setrlimit(resource.RLIMIT_CPU, (seconds, hard))
+
+def _run_job(job, args):
+    """JSON reply for one job: ["ok", result] or ["refused", error name, message, line]"""
+    function, _, cpu_seconds, _ = _JOBS[job]
+    _limit_cpu(cpu_seconds)
+    try:
+        reply = ["ok", function(*args)]
+    except (SyntaxError, tracer.UnsafeCode) as error:
+        if isinstance(error, SyntaxError):
+            reply = ["refused", "SyntaxError", error.msg, error.lineno]
+        else:
+            reply = ["refused", "UnsafeCode", str(error), None]
+    return json.dumps(reply).encode()
+
+def _fork_job(job, args, pipes):
+    """Run one job in a child process and return its reply (empty if the child died)"""
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            # The snippet's frames lead back to the worker's; close its way to the server first
+            os.close(read_end)
+            for pipe in pipes:
+                pipe.close()
+            with os.fdopen(write_end, "wb") as reply:
+                reply.write(_run_job(job, args))
+        finally:
+            os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end, "rb") as reply:
+        data = reply.read(MAX_REPLY_BYTES + 1)
+    os.waitpid(pid, 0)
+    return data
+
+def _worker_main():
+    """Worker process: run each job read from stdin in a child and write its reply to stdout"""
+    # Replies keep the real stdout; anything else written to fd 1 goes to stderr
+    replies = Connection(os.dup(1), readable=False)
+    os.dup2(2, 1)
+    jobs = Connection(0, writable=False)
+    _limit_resources()
+    while True:
+        try:
+            job, args = json.loads(jobs.recv_bytes())
+        except EOFError:
+            # The server has gone away
+            return
+        replies.send_bytes(_fork_job(job, args, (jobs, replies)))
+
+def _read_reply(job, args, data):
+    """(status, result) from a worker's reply - a refusal is ('refused', the error to raise)
+
+    Raises ValueError for anything that isn't a well-formed reply.
+    """
+    if not data:
+        return "killed", None
+    reply = json.loads(data)
+    if not isinstance(reply, list) or not reply:
+        raise ValueError("Not a reply")
+    if reply[0] == "ok" and len(reply) == 2:
+        return "ok", _JOBS[job][1](args, reply[1])
+    if reply[0] == "refused" and len(reply) == 4:
+        _, name, message, line = reply
+        if name not in _REFUSALS or not isinstance(message, str) or not (line is None or type(line) is int):
+            raise ValueError("Not a refusal")
+        if name == "SyntaxError":
+            return "refused", SyntaxError(message, (tracer.FILENAME, line, None, None))
+        return "refused", tracer.UnsafeCode(message)
+    raise ValueError("Not a reply")
+
+def _stopped(source, reason):
+    """Trace for a snippet that never got to run to the end in a worker"""
+    result = tracer.Trace(source)
+    result.stopped = reason
+    result.steps.append((None, 0, {}, ()))
+    return result
+
+class _Worker:
+    def __init__(self):
+        # Doesn't wait for the worker to boot - the first job just waits in its stdin
+        # Its own process group, so stop() takes the child running a job down with it
+        self.process = subprocess.Popen([sys.executable, "-m", "visualizations.core.sandbox"],
+                                        cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        start_new_session=True)
+        self.jobs = Connection(os.dup(self.process.stdin.fileno()), readable=False)
+        self.replies = Connection(os.dup(self.process.stdout.fileno()), writable=False)
+        self.process.stdin.close()
+        self.process.stdout.close()
+        self.count = 0
+
+    def stop(self):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.process.wait()
+        self.jobs.close()
+        self.replies.close()
+
+class Pool:
+    """Workers waiting for jobs; call() borrows one and always hands back a healthy one"""
+
+    def __init__(self, size=WORKERS):
+        self.idle = queue.Queue()
+        for _ in range(size):
+            self.idle.put(_Worker())
+
+    def call(self, job, *args):
+        """(status, result) of a job: status is 'ok', or 'busy'/'killed' with no result"""
+        try:
+            worker = self.idle.get(timeout=WALL_SECONDS * 2)
+        except queue.Empty:
+            return "busy", None
+
+        data = None
+        try:
+            worker.jobs.send_bytes(json.dumps([job, args]).encode())
+            if worker.replies.poll(_JOBS[job][3]):
+                data = worker.replies.recv_bytes(MAX_REPLY_BYTES)
+        except (EOFError, OSError):
+            # The worker died - or sent more than MAX_REPLY_BYTES
+            pass
+        status, result = "killed", None
+        try:
+            status, result = _read_reply(job, args, data)
+        except (ValueError, RecursionError):
+            # Nothing a healthy worker would send - treat it like a crash
+            pass
+        finally:
+            worker.count += 1
+            if status == "killed" or worker.count >= JOBS_PER_WORKER:
+                worker.stop()
+                worker = _Worker()
+            self.idle.put(worker)
+
+        if status == "refused":
+            raise result
+        return status, result
+
+_pool = None
+_lock = threading.Lock()
+
+def start():
+    """Start the workers now rather than on the first snippet"""
+    global _pool
+    if not SANDBOX_ENABLED or _pool is not None:
+        return _pool
+    with _lock:
+        if _pool is None:
+            _pool = Pool()
+    return _pool
+
+def run(source, max_steps=None, max_seconds=None):
+    """tracer.trace() in a sandbox worker
+
+    A snippet whose worker had to be killed comes back as a trace stopped
+    with 'killed', and one that found every worker busy for too long as
+    'busy'. Raises SyntaxError/UnsafeCode like tracer.trace().
+    """
+    if not SANDBOX_ENABLED:
+        return tracer.trace(source, max_steps, max_seconds)
+    status, result = start().call('trace', source, max_steps, max_seconds)
+    return result if status == "ok" else _stopped(source, status)
+
+def measure(setup, statements):
+    """(status, timing.measure()) in a sandbox worker
+
+    status is 'ok', 'killed' if the worker went over its limits, or 'busy'
+    if every worker stayed busy for too long (then there are no timings).
+    """
+    if not SANDBOX_ENABLED:
+        return "ok", timing.measure(setup, statements)
+    return start().call('time', setup, statements)
+
+if __name__ == "__main__":
+    _worker_main()
@@ -0,0 +1,279 @@
+"""
+Session Limits
+Caps, measures and compacts the per-student collections kept in session state
+
+Concept modules register the session-state keys they own with manage(). At
+the end of every run enforce() trims each capped collection - ring buffers
+(lists) drop their oldest entries, LRU dicts drop the entry added or touch()ed
+longest ago - and now and then measures what each key costs.
+
+A background thread finds sessions left idle for IDLE_SECONDS and has them
+compacted: their managed keys are pickled and zlib-compressed into one bytes
+value, and derived caches are emptied. The thread never touches a session's
+state itself. It hands the work to the server's event loop, which is where
+Streamlit starts every script run, and compaction only goes ahead if the
+session has no script runner then - so no run, and no widget callback, can
+see the state half-compacted. start_run() at the top of the next run - script
+or panel fragment - unpacks it again, and the session counts as busy until
+end_run().
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+import zlib
+
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from visualizations.core.sizing import deep_getsizeof, format_bytes
+
+RING = "ring"
+LRU = "lru"
+
+# Override caps per key, e.g. VISUALIZER_SESSION_CAPS="my_list=200,call_history=20"
+CAP_OVERRIDES = {
+    key.strip(): int(cap)
+    for key, _, cap in (
+        item.partition("=") for item in os.environ.get("VISUALIZER_SESSION_CAPS", "").split(",")
+    )
+    if cap.strip()
+}
+
+# Compact a session after this many idle seconds; 0 turns compaction off
+IDLE_SECONDS = int(os.environ.get("VISUALIZER_IDLE_COMPACT_SECONDS", "900"))
+CHECK_INTERVAL = 60
+
+# Re-measure a session's footprint at most this often
+MEASURE_INTERVAL = 30
+
+COMPACTED_KEY = "_compacted_session"
+
+_LOGGER = logging.getLogger(__name__)
+
+# key -> {'cap', 'evict', 'on_evict', 'compact'}
+_managed = {}
+
+# Caches that are rebuilt on demand, so compaction just empties them
+_caches = set()
+
+# session id -> {'state', 'last_seen', 'running' (runs in progress), 'compacted', 'footprint', 'measured'}
+_sessions = {}
+_lock = threading.Lock()
+_janitor = None
+
+def manage(key, cap=None, evict=RING, on_evict=None, compact=True):
+    """Put a session-state key under the session manager
+
+    cap limits a list (evict=RING) or dict (evict=LRU) to that many entries;
+    on_evict(entry_key) is called for each dict entry dropped. compact=False
+    keeps the key in memory while idle (e.g. when a widget callback needs it
+    before start_run() has run).
+    """
+    _managed[key] = {
+        'cap': CAP_OVERRIDES.get(key, cap),
+        'evict': evict,
+        'on_evict': on_evict,
+        'compact': compact
+    }
+
+def managed_keys():
+    """Every session-state key registered with manage() so far"""
+    return list(_managed)
+
+def cache(key):
+    """Mark a session-state dict as a derived cache that can be emptied when idle"""
+    _caches.add(key)
+
+def touch(collection, entry_key):
+    """Mark a dict entry as just used, so LRU eviction drops it last"""
+    collection[entry_key] = collection.pop(entry_key)
+
+def _session():
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None, None
+    # The SafeSessionState wrapper is per run; the SessionState inside lives as long as the session
+    return ctx.session_id, ctx.session_state._state
+
+def start_run(full=True):
+    """Unpack a compacted session and mark it busy - pair with end_run() in a finally block
+
+    The script calls it first thing. Panel fragments rerun without the script,
+    so they call it too with full=False. A full run is never nested in another
+    run of its session, so it also clears a busy mark a cut-short run left.
+    """
+    session_id, state = _session()
+    if session_id is None:
+        return
+
+    with _lock:
+        info = _sessions.setdefault(session_id, {
+            'state': state,
+            'footprint': {},
+            'measured': 0.0,
+            'compacted': False,
+            'running': 0
+        })
+        info['running'] = 1 if full else info['running'] + 1
+        info['last_seen'] = time.time()
+        if info['compacted']:
+            for key, value in pickle.loads(zlib.decompress(state[COMPACTED_KEY])).items():
+                state[key] = value
+            del state[COMPACTED_KEY]
+            info['compacted'] = False
+            info['footprint'] = {}
+            info['measured'] = 0.0
+
+    _start_janitor()
+
+def end_run():
+    """The run start_run() began has finished, one way or another"""
+    session_id, _ = _session()
+    with _lock:
+        info = _sessions.get(session_id)
+        if info is not None:
+            info['running'] = max(info['running'] - 1, 0)
+            info['last_seen'] = time.time()
+
+def enforce():
+    """Call last thing in the script: applies the caps and measures the footprint"""
+    session_id, state = _session()
+    if session_id is None:
+        return
+
+    for key, rule in _managed.items():
+        if rule['cap'] is None or key not in state:
+            continue
+        collection = state[key]
+        overflow = len(collection) - rule['cap']
+        if overflow <= 0:
+            continue
+
+        if rule['evict'] == RING:
+            del collection[:overflow]
+        else:
+            for entry_key in list(collection)[:overflow]:
+                del collection[entry_key]
+                if rule['on_evict']:
+                    rule['on_evict'](entry_key)
+        st.toast(f"🧹 `{key}` is limited to {rule['cap']:,} entries - dropped the {overflow:,} oldest")
+
+    with _lock:
+        info = _sessions.get(session_id)
+        if info is None:
+            return
+        now = time.time()
+        if now - info['measured'] < MEASURE_INTERVAL:
+            return
+        info['measured'] = now
+
+    # Measured outside the lock - it only reads this session's own state
+    footprint = {key: deep_getsizeof(state[key]) for key in list(_managed) + sorted(_caches)
+                 if key in state}
+    with _lock:
+        info['footprint'] = footprint
+
+def _compact(state):
+    """Swap a session's managed keys for one compressed blob and empty its caches"""
+    values = {key: state[key] for key, rule in _managed.items() if rule['compact'] and key in state}
+    blob = zlib.compress(pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL))
+    state[COMPACTED_KEY] = blob
+    for key in values:
+        del state[key]
+    for key in _caches:
+        if key in state:
+            state[key].clear()
+    return len(blob)
+
+def _compact_idle(session_id, session):
+    """Compact an idle session - runs on the event loop, so no script run can start meanwhile"""
+    # A runner exists from the start of a run (widget callbacks included) until it has finished
+    if session._scriptrunner is not None:
+        return
+    with _lock:
+        info = _sessions.get(session_id)
+        if info is None or info['running'] or info['compacted']:
+            return
+        try:
+            size = _compact(info['state'])
+        except Exception:
+            _LOGGER.exception("Could not compact session %s", session_id)
+            # Don't retry every sweep
+            info['last_seen'] = time.time()
+            return
+        info['compacted'] = True
+        info['footprint'] = {COMPACTED_KEY: size}
+
+def _sweep():
+    """Have idle sessions compacted and forget the ones Streamlit has closed"""
+    if not Runtime.exists():
+        return
+    session_mgr = Runtime.instance()._session_mgr
+    now = time.time()
+    with _lock:
+        for session_id, info in list(_sessions.items()):
+            session_info = session_mgr.get_session_info(session_id)
+            if session_info is None:
+                del _sessions[session_id]
+            elif not info['running'] and not info['compacted'] and now - info['last_seen'] > IDLE_SECONDS:
+                session = session_info.session
+                session._event_loop.call_soon_threadsafe(_compact_idle, session_id, session)
+
+def _janitor_loop():
+    while True:
+        time.sleep(CHECK_INTERVAL)
+        try:
+            _sweep()
+        except Exception:
+            _LOGGER.exception("Session sweep failed")
+
+def _start_janitor():
+    global _janitor
+    if IDLE_SECONDS <= 0 or _janitor is not None:
+        return
+    with _lock:
+        if _janitor is None:
+            _janitor = threading.Thread(target=_janitor_loop, name="session-janitor", daemon=True)
+            _janitor.start()
+
+def summary():
+    """Sessions, compacted sessions and measured bytes per key across this server process"""
+    with _lock:
+        per_key = {}
+        for info in _sessions.values():
+            for key, size in info['footprint'].items():
+                per_key[key] = per_key.get(key, 0) + size
+        return {
+            'sessions': len(_sessions),
+            'compacted': sum(info['compacted'] for info in _sessions.values()),
+            'per_key': per_key
+        }
+
+def show_footprint_panel():
+    """Hidden sidebar panel with session-state sizes - open the app with ?admin=1"""
+    if st.query_params.get("admin") != "1":
+        return
+
+    session_id, _ = _session()
+    with _lock:
+        mine = dict(_sessions.get(session_id, {}).get('footprint', {}))
+    totals = summary()
+
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### 🧮 Session Memory")
+        st.caption(f"{totals['sessions']} sessions tracked, {totals['compacted']} compacted while idle "
+                   f"(after {IDLE_SECONDS}s)")
+        st.dataframe([
+            {
+                'key': key,
+                'cap': _managed[key]['cap'] if key in _managed else None,
+                'this session': format_bytes(mine[key]) if key in mine else "",
+                'all sessions': format_bytes(size)
+            }
+            for key, size in sorted(totals['per_key'].items(), key=lambda item: -item[1])
+        ], hide_index=True)
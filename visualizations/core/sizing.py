@@ -0,0 +1,49 @@
+"""
+Object Sizing
+Real memory cost of Python values: sys.getsizeof plus everything they refer to
+"""
+
+import sys
+
+def _referents(obj):
+    """The objects obj holds on to that count towards its size"""
+    if isinstance(obj, dict):
+        return list(obj.keys()) + list(obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+    if isinstance(obj, (str, bytes, bytearray, int, float, complex, bool, type(None), type)):
+        return ()
+    refs = []
+    if hasattr(obj, "__dict__"):
+        refs.append(vars(obj))
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            refs.append(getattr(obj, slot))
+    return refs
+
+def deep_getsizeof(obj, seen=None):
+    """Bytes used by obj and everything reachable from it, counting each object once
+
+    Pass the same seen set to several calls to total a group of values without
+    counting shared objects twice; it also stops cycles. Walks with an explicit
+    stack so deeply nested values can't hit the recursion limit.
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        stack.extend(_referents(current))
+    return total
+
+def format_bytes(size):
+    """1234 -> '1.2 KB'"""
+    for unit in ("bytes", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:,} {unit}" if unit == "bytes" else f"{size:,.1f} {unit}"
+        size /= 1024
@@ -0,0 +1,77 @@
+"""
+Timeline
+Step-by-step states stored as deltas plus a full checkpoint every so often
+
+Each step keeps only what it changed. Every so often the whole state is copied
+into a checkpoint, so rebuilding any step bisects to the checkpoint before it
+and replays the few deltas after that - never the run from the start. A
+checkpoint is taken once the deltas since the last one add up to
+CHECKPOINT_EVERY values or to the size of the state, whichever is larger, so
+checkpoints cost at most about as much memory as the deltas themselves.
+"""
+
+import bisect
+import os
+
+import streamlit as st
+
+CHECKPOINT_EVERY = max(1, int(os.environ.get("VISUALIZER_TIMELINE_CHECKPOINT", "64")))
+
+class Timeline:
+    """States after each step of a run, e.g. a snippet's variables or a set of account balances"""
+
+    def __init__(self, start=None, every=CHECKPOINT_EVERY):
+        self.every = every
+        self.deltas = []                     # ({name: value} changed, (names removed)) per step
+        self.labels = []                     # what each step was, e.g. its line number
+        self.positions = [-1]                # step each checkpoint was taken after; -1 is the start
+        self.checkpoints = [dict(start or {})]
+        self.last = dict(start or {})        # state after the newest step
+        self.work = 0                        # values changed since the newest checkpoint
+
+    def __len__(self):
+        return len(self.deltas)
+
+    def append(self, changed, removed=(), label=None):
+        for name in removed:
+            self.last.pop(name, None)
+        self.last.update(changed)
+        self.deltas.append((changed, tuple(removed)))
+        self.labels.append(label)
+
+        self.work += 1 + len(changed) + len(removed)
+        if self.work >= max(self.every, len(self.last)):
+            self.positions.append(len(self.deltas) - 1)
+            self.checkpoints.append(dict(self.last))
+            self.work = 0
+
+    def state(self, index):
+        """State after step index (-1 for the start), as a new dict"""
+        slot = bisect.bisect_right(self.positions, index) - 1
+        state = dict(self.checkpoints[slot])
+        for changed, removed in self.deltas[self.positions[slot] + 1:index + 1]:
+            for name in removed:
+                state.pop(name, None)
+            state.update(changed)
+        return state
+
+    def changed(self, index):
+        """Names step index set"""
+        return set(self.deltas[index][0]) if 0 <= index < len(self.deltas) else set()
+
+    @classmethod
+    def from_trace(cls, trace):
+        """Timeline of a tracer.Trace, labelled with the line each step was about to run"""
+        timeline = cls()
+        for line, depth, changed, removed in trace.steps:
+            timeline.append(changed, removed, line)
+        return timeline
+
+def scrubber(key, steps, label="Step"):
+    """Slider over steps 1..steps - returns the chosen step's index (0-based)"""
+    if steps <= 1:
+        return steps - 1
+    # A shorter run than last time: keep the slider in range rather than reset it
+    if st.session_state.get(key, 1) > steps:
+        st.session_state[key] = steps
+    return st.slider(label, min_value=1, max_value=steps, key=key) - 1
@@ -0,0 +1,64 @@
+"""
+Timing
+Times single operations with timeit, with error bars
+
+Each statement runs up to NUMBER times in a row, REPEAT times over, and every
+repeat gives one estimate of the time per operation. The result is their mean
+with a 95% confidence interval, so two operators whose intervals overlap can't
+honestly be called faster or slower than each other. A short trial run first
+picks fewer loops for slow statements, so none takes much more than
+BUDGET_SECONDS however expensive it is. An empty statement is
+timed alongside as a baseline: that is timeit's own loop, which every other
+figure includes. This module runs inside the sandbox workers, so it must not
+import streamlit.
+"""
+
+import statistics
+import timeit
+
+NUMBER = 100_000
+REPEAT = 7
+BUDGET_SECONDS = 0.1
+
+# The trial run grows tenfold until it takes this long
+TRIAL_SECONDS = 0.001
+
+# Student's t for a two-sided 95% interval with REPEAT - 1 degrees of freedom
+T_95 = 2.447
+
+BASELINE = "pass"
+
+def _loops(timer):
+    """Loops per repeat that keep a statement's repeats within BUDGET_SECONDS, at most NUMBER"""
+    trial = 1
+    seconds = timer.timeit(trial)
+    while seconds < TRIAL_SECONDS and trial < NUMBER:
+        trial *= 10
+        seconds = timer.timeit(trial)
+    per_loop = seconds / trial
+    return max(1, min(NUMBER, int(BUDGET_SECONDS / REPEAT / max(per_loop, 1e-9))))
+
+def measure(setup, statements):
+    """[(statement, mean ns per operation, ± ns, loops per repeat)] for BASELINE and then each statement"""
+    results = []
+    for statement in [BASELINE] + list(statements):
+        timer = timeit.Timer(statement, setup)
+        loops = _loops(timer)
+        samples = [seconds / loops * 1e9 for seconds in timer.repeat(REPEAT, loops)]
+        spread = T_95 * statistics.stdev(samples) / REPEAT ** 0.5
+        results.append((statement, statistics.mean(samples), spread, loops))
+    return results
+
+def from_plain(rows):
+    """measure() results read back from JSON lists, raising ValueError unless every row has the right shape"""
+    results = []
+    try:
+        for statement, mean, spread, loops in rows:
+            numbers = (mean, spread, loops)
+            if (not isinstance(statement, str) or not isinstance(loops, int)
+                    or any(isinstance(value, bool) or not isinstance(value, (int, float)) for value in numbers)):
+                raise ValueError("Not a timing row")
+            results.append((statement, float(mean), float(spread), loops))
+    except TypeError as error:
+        raise ValueError(f"Not timing results: {error}") from None
+    return results
@@ -0,0 +1,228 @@
+"""
+Trace Cache
+Serves repeat runs of a snippet from a shared cache instead of running it again
+
+Most runs are the canned examples with their default inputs, so the same
+snippet is traced over and over by every student. Traces are keyed by a hash
+of the snippet's syntax tree plus the budgets it ran with: spacing inside a
+line and trailing comments don't change the key, but anything that moves a
+line does, because a trace refers to line numbers. Entries are stored as
+JSON, never pickles, and their shape is checked whenever one is read back.
+They are kept in an in-memory LRU shared by all sessions, and written through to a SQLite
+file so they outlive restarts; both tiers evict the least recently used
+entries to stay under a size budget. Traces that were cut short by time or by
+the sandbox depend on server load and are never cached.
+
+Operator timings share the same tiers. They belong to the interpreter that
+measured them, so they are keyed by its version as well: every Python a
+deployment runs times each comparison once.
+"""
+
+import ast
+import collections
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+import streamlit as st
+
+from visualizations.core import sandbox, timing, tracer
+from visualizations.core.sizing import format_bytes
+
+CACHE_ENABLED = os.environ.get("VISUALIZER_TRACE_CACHE", "1") != "0"
+MEMORY_BYTES = int(os.environ.get("VISUALIZER_TRACE_CACHE_MB", "16")) * 1024 * 1024
+# Set VISUALIZER_TRACE_CACHE_DISK_MB=0 to keep the cache in memory only
+DISK_BYTES = int(os.environ.get("VISUALIZER_TRACE_CACHE_DISK_MB", "128")) * 1024 * 1024
+DB_PATH = os.environ.get("VISUALIZER_TRACE_CACHE_DB", "trace_cache.db")
+
+# Bump when Trace or the timing results change shape so old entries on disk are never read back
+VERSION = 3
+
+# Stop reasons that say more about the server than about the snippet
+UNCACHEABLE = {'time', 'killed', 'busy'}
+
+_LOGGER = logging.getLogger(__name__)
+
+# key -> JSON-encoded entry, least recently used first
+_memory = collections.OrderedDict()
+_memory_bytes = 0
+_counts = {'memory': 0, 'disk': 0, 'miss': 0}
+_lock = threading.Lock()
+
+def _connect():
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS traces "
+                 "(key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+    return conn
+
+def key(source, *inputs):
+    """Hash of a snippet's syntax tree (with line numbers, without columns) and its inputs
+
+    Raises SyntaxError like the sandbox would, and RecursionError or
+    MemoryError for code nested too deeply to parse.
+    """
+    tree = ast.parse(source, tracer.FILENAME)
+    for node in ast.walk(tree):
+        if hasattr(node, "col_offset"):
+            node.col_offset = node.end_col_offset = 0
+    return _hash(f"{VERSION}|{ast.dump(tree, include_attributes=True)}|{inputs!r}")
+
+def _hash(text):
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+def _remember(entry_key, data):
+    """Put an entry at the recent end of the memory tier and evict from the old end"""
+    global _memory_bytes
+    with _lock:
+        old = _memory.pop(entry_key, None)
+        if old is not None:
+            _memory_bytes -= len(old)
+        _memory[entry_key] = data
+        _memory_bytes += len(data)
+        while _memory_bytes > MEMORY_BYTES and len(_memory) > 1:
+            _, dropped = _memory.popitem(last=False)
+            _memory_bytes -= len(dropped)
+
+def _from_disk(entry_key):
+    conn = _connect()
+    try:
+        with conn:
+            row = conn.execute("SELECT data FROM traces WHERE key = ?", (entry_key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE traces SET used = ? WHERE key = ?", (time.time(), entry_key))
+    finally:
+        conn.close()
+    return None if row is None else zlib.decompress(row[0])
+
+def _to_disk(entry_key, data):
+    """Write an entry, then drop the least recently used ones until the file is under budget"""
+    packed = zlib.compress(data)
+    conn = _connect()
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO traces (key, data, size, used) VALUES (?, ?, ?, ?)",
+                         (entry_key, packed, len(packed), time.time()))
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM traces").fetchone()[0]
+            if total > DISK_BYTES:
+                dropped = []
+                for old_key, size in conn.execute("SELECT key, size FROM traces ORDER BY used"):
+                    if total <= DISK_BYTES * 0.9:
+                        break
+                    dropped.append((old_key,))
+                    total -= size
+                conn.executemany("DELETE FROM traces WHERE key = ?", dropped)
+    finally:
+        conn.close()
+
+def _lookup(entry_key):
+    """JSON-encoded entry for a key from memory, then disk, or None"""
+    with _lock:
+        data = _memory.get(entry_key)
+        if data is not None:
+            _memory.move_to_end(entry_key)
+            _counts['memory'] += 1
+            return data
+    if DISK_BYTES <= 0:
+        return None
+    try:
+        data = _from_disk(entry_key)
+    except Exception:
+        _LOGGER.exception("Could not read the trace cache")
+        return None
+    if data is not None:
+        _remember(entry_key, data)
+        with _lock:
+            _counts['disk'] += 1
+    return data
+
+def _load(data, read):
+    """An entry decoded by read(plain), or None if it isn't one (then it counts as a miss)"""
+    try:
+        return read(json.loads(data))
+    except (ValueError, RecursionError):
+        _LOGGER.warning("Ignoring a malformed trace cache entry")
+        return None
+
+def _store(entry_key, plain):
+    data = json.dumps(plain).encode()
+    _remember(entry_key, data)
+    if DISK_BYTES <= 0:
+        return
+    try:
+        _to_disk(entry_key, data)
+    except Exception:
+        _LOGGER.exception("Could not write the trace cache")
+
+def run(source, max_steps=None, max_seconds=None):
+    """sandbox.run() for a snippet, served from the cache when the same snippet ran before
+
+    Every call gets its own Trace, so callers may change it freely.
+    """
+    if not CACHE_ENABLED:
+        return sandbox.run(source, max_steps, max_seconds)
+
+    # A SyntaxError from here is the one the sandbox would raise
+    entry_key = key(source, max_steps, max_seconds)
+    data = _lookup(entry_key)
+    if data is not None:
+        # The cached run may have been written with different spacing, so it takes this source
+        result = _load(data, lambda plain: tracer.Trace.from_plain(source, plain))
+        if result is not None:
+            return result
+
+    with _lock:
+        _counts['miss'] += 1
+    result = sandbox.run(source, max_steps, max_seconds)
+    if result.stopped not in UNCACHEABLE:
+        _store(entry_key, result.to_plain())
+    return result
+
+def measure(setup, statements):
+    """sandbox.measure() for some statements, served from the cache when this Python timed them before"""
+    if not CACHE_ENABLED:
+        return sandbox.measure(setup, statements)
+
+    statements = tuple(statements)
+    budget = f"{timing.NUMBER}x{timing.REPEAT}/{timing.BUDGET_SECONDS}"
+    entry_key = _hash(f"{VERSION}|timing|{sys.version}|{budget}|{setup!r}|{statements!r}")
+    data = _lookup(entry_key)
+    if data is not None:
+        result = _load(data, timing.from_plain)
+        if result is not None:
+            return "ok", result
+
+    with _lock:
+        _counts['miss'] += 1
+    status, result = sandbox.measure(setup, statements)
+    # A busy or killed worker says more about the server than about the statements
+    if status == "ok":
+        _store(entry_key, result)
+    return status, result
+
+def summary():
+    """Hits per tier, misses and what the memory tier holds"""
+    with _lock:
+        return dict(_counts, entries=len(_memory), bytes=_memory_bytes)
+
+def show_admin_panel():
+    """Hidden sidebar panel with cache hit counts - open the app with ?admin=1"""
+    if not CACHE_ENABLED or st.query_params.get("admin") != "1":
+        return
+
+    totals = summary()
+    runs = totals['memory'] + totals['disk'] + totals['miss']
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### 🗃️ Trace Cache")
+        st.caption(f"{totals['entries']} traces in memory ({format_bytes(totals['bytes'])} of "
+                   f"{format_bytes(MEMORY_BYTES)})")
+        if runs:
+            st.caption(f"{runs} runs: {totals['memory']} from memory, {totals['disk']} from disk, "
+                       f"{totals['miss']} traced ({(runs - totals['miss']) / runs:.0%} served from cache)")
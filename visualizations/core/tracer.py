@@ -0,0 +1,268 @@
+"""
+Tracer
+Runs a short snippet under sys.settrace and records every line it executes
+
+Each step is the line about to run plus only the variables that changed since
+the step before, so a loop over one variable stores one short value per step
+instead of a copy of every variable. Values are kept as bounded reprs.
+Recording stops at a step, time or output budget, so any snippet costs a
+bounded amount to trace. A Trace is plain data: to_plain() turns it into lists
+and dicts that JSON can carry, and from_plain() checks their shape on the way
+back, so a trace from a sandbox worker or the cache is never unpickled.
+"""
+
+import ast
+import builtins
+import os
+import reprlib
+import sys
+import time
+
+MAX_STEPS = int(os.environ.get("VISUALIZER_TRACE_STEPS", "5000"))
+MAX_SECONDS = float(os.environ.get("VISUALIZER_TRACE_SECONDS", "0.5"))
+MAX_OUTPUT = 20000
+
+FILENAME = "<snippet>"
+
+# Everything a snippet can use without an import
+SAFE_BUILTINS = {name: getattr(builtins, name) for name in (
+    "abs", "all", "any", "bin", "bool", "callable", "chr", "dict", "divmod", "enumerate",
+    "filter", "float", "format", "frozenset", "hash", "hex", "int", "isinstance", "issubclass",
+    "iter", "len", "list", "map", "max", "min", "next", "oct", "ord", "pow", "range", "repr",
+    "reversed", "round", "set", "slice", "sorted", "str", "sum", "tuple", "type", "zip",
+    "__build_class__",
+    "ArithmeticError", "AssertionError", "AttributeError", "Exception", "IndexError",
+    "KeyError", "LookupError", "NameError", "RuntimeError", "StopIteration", "TypeError",
+    "ValueError", "ZeroDivisionError"
+)}
+
+# Special names a class can define and call (super().__init__()); other dunders
+# lead out of the snippet (__class__, __globals__, __subclasses__, ...)
+ALLOWED_DUNDERS = {"__init__", "__str__", "__repr__", "__eq__", "__lt__", "__len__", "__name__"}
+
+# Attributes of generators, coroutines, frames, tracebacks and code objects:
+# g.gi_frame.f_back.f_globals reaches the modules the tracer itself imported
+FRAME_PREFIXES = ("gi_", "cr_", "ag_", "f_", "tb_", "co_")
+
+_repr = reprlib.Repr()
+_repr.maxstring = 60
+_repr.maxother = 60
+_repr.maxlist = _repr.maxtuple = _repr.maxset = _repr.maxdict = 10
+
+# Why a run can stop, as stored on Trace.stopped
+STOP_REASONS = {'steps', 'time', 'output', 'killed', 'busy'}
+
+class UnsafeCode(ValueError):
+    """The snippet uses something the tracer won't run"""
+
+class _Budget(BaseException):
+    """Stops the snippet from inside the trace function - `except Exception` can't catch it"""
+
+class Trace:
+    """Lines a snippet ran, the variables each one changed, and what it printed"""
+
+    def __init__(self, source):
+        self.source = source
+        self.steps = []        # (line, depth, {name: repr} changed, (names removed))
+        self.output = []       # (step index, text printed)
+        self.stopped = None    # 'steps', 'time' or 'output' when a budget cut the run short
+        self.error = None      # "ZeroDivisionError: division by zero" if the snippet raised
+        self.error_line = None
+
+    def __len__(self):
+        return len(self.steps)
+
+    def states(self):
+        """Yield (index, line, depth, variables) for every step - the dict is reused, copy it to keep it"""
+        variables = {}
+        for index, (line, depth, changed, removed) in enumerate(self.steps):
+            for name in removed:
+                del variables[name]
+            variables.update(changed)
+            yield index, line, depth, variables
+
+    def variables_at(self, index):
+        """Variables as they were at a step, rebuilt from the start"""
+        for current, _, _, variables in self.states():
+            if current == index:
+                return dict(variables)
+        return {}
+
+    def final_variables(self):
+        return self.variables_at(len(self.steps) - 1)
+
+    def printed(self, start=0, end=None):
+        """Text printed by steps start..end-1"""
+        end = len(self.steps) if end is None else end
+        return "".join(text for step, text in self.output if start <= step < end)
+
+    def to_plain(self):
+        """Everything but the source, as lists, dicts, strings and ints for JSON"""
+        return {'steps': self.steps, 'output': self.output, 'stopped': self.stopped,
+                'error': self.error, 'error_line': self.error_line}
+
+    @classmethod
+    def from_plain(cls, source, plain):
+        """Rebuild a trace of source from to_plain(), raising ValueError unless every field has the right shape"""
+        result = cls(source)
+        try:
+            for line, depth, changed, removed in plain['steps']:
+                _check(line is None or _is_int(line))
+                _check(_is_int(depth))
+                _check(isinstance(changed, dict) and all(isinstance(value, str) for value in changed.values()))
+                _check(isinstance(removed, list) and all(isinstance(name, str) for name in removed))
+                result.steps.append((line, depth, changed, tuple(removed)))
+            for step, text in plain['output']:
+                _check(_is_int(step) and isinstance(text, str))
+                result.output.append((step, text))
+            result.stopped = plain['stopped']
+            result.error = plain['error']
+            result.error_line = plain['error_line']
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"Not a trace: {error}") from None
+        _check(result.stopped is None or result.stopped in STOP_REASONS)
+        _check(result.error is None or isinstance(result.error, str))
+        _check(result.error_line is None or _is_int(result.error_line))
+        return result
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def _check(condition):
+    if not condition:
+        raise ValueError("Not a trace")
+
+def check_source(source):
+    """Parse a snippet, refusing imports, dunder names, frame attributes and handlers that catch everything"""
+    tree = ast.parse(source, FILENAME)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            raise UnsafeCode(f"line {node.lineno}: snippets can't import modules")
+        name = getattr(node, "id", None) or getattr(node, "attr", None) or getattr(node, "arg", None)
+        if isinstance(name, str) and name.startswith("__") and name not in ALLOWED_DUNDERS:
+            raise UnsafeCode(f"line {node.lineno}: snippets can't use {name}")
+        if isinstance(node, ast.Attribute) and node.attr.startswith(FRAME_PREFIXES):
+            raise UnsafeCode(f"line {node.lineno}: snippets can't use .{node.attr}")
+        if isinstance(node, ast.ExceptHandler) and (
+                node.type is None or getattr(node.type, "id", None) == "BaseException"):
+            raise UnsafeCode(f"line {node.lineno}: catch Exception (or something narrower) instead of everything")
+    return tree
+
+class _Recorder:
+    def __init__(self, trace, max_steps, max_seconds):
+        self.trace = trace
+        self.max_steps = max_steps
+        self.deadline = time.perf_counter() + max_seconds
+        self.depth = -1
+        self.shown = {}
+        self.printed = 0
+
+    def snapshot(self, line, local_vars):
+        view = {name: _repr.repr(value) for name, value in local_vars.items() if not name.startswith("__")}
+        changed = {name: value for name, value in view.items() if self.shown.get(name) != value}
+        removed = tuple(name for name in self.shown if name not in view)
+        self.shown = view
+        self.trace.steps.append((line, self.depth, changed, removed))
+
+    def on_call(self, frame, event, arg):
+        if frame.f_code.co_filename != FILENAME:
+            return None
+        self.depth += 1
+        return self.on_event
+
+    def on_event(self, frame, event, arg):
+        if event == "line":
+            if len(self.trace.steps) >= self.max_steps:
+                raise _Budget("steps")
+            if time.perf_counter() > self.deadline:
+                raise _Budget("time")
+            self.snapshot(frame.f_lineno, frame.f_locals)
+        elif event == "return":
+            self.depth -= 1
+        return self.on_event
+
+    def print(self, *args, sep=" ", end="\n", file=None, flush=False):
+        text = sep.join(str(arg) for arg in args) + end
+        self.printed += len(text)
+        if self.printed > MAX_OUTPUT:
+            raise _Budget("output")
+        self.trace.output.append((len(self.trace.steps) - 1, text))
+
+def trace(source, max_steps=None, max_seconds=None):
+    """Run source and return its Trace
+
+    Errors raised by the snippet are recorded on the trace; SyntaxError and
+    UnsafeCode are raised before anything runs.
+    """
+    code = compile(check_source(source), FILENAME, "exec")
+    result = Trace(source)
+    recorder = _Recorder(result, max_steps or MAX_STEPS, max_seconds or MAX_SECONDS)
+    namespace = {'__builtins__': dict(SAFE_BUILTINS, print=recorder.print), '__name__': "__snippet__"}
+
+    previous = sys.gettrace()
+    sys.settrace(recorder.on_call)
+    try:
+        exec(code, namespace)
+    except _Budget as stop:
+        result.stopped = stop.args[0]
+    except Exception as error:
+        result.error = f"{type(error).__name__}: {error}"
+        tb = error.__traceback__
+        while tb is not None:
+            if tb.tb_frame.f_code.co_filename == FILENAME:
+                result.error_line = tb.tb_lineno
+            tb = tb.tb_next
+    finally:
+        sys.settrace(previous)
+
+    # One last step with no line: the variables when the snippet finished
+    recorder.depth = 0
+    recorder.snapshot(None, namespace)
+    return result
+
+def loop_iterations(result, loop_line):
+    """Split a trace into the iterations of the loop whose header is on loop_line
+
+    Returns a list of dicts: 'number', 'start' and 'end' (step range),
+    'variables' (when the body starts), 'after' (when the iteration ends) and
+    'lines' (body lines that ran, e.g. to tell whether a break was reached).
+    Steps in functions called from the body count towards the iteration.
+    """
+    node = next(node for node in ast.walk(ast.parse(result.source))
+                if isinstance(node, (ast.For, ast.While)) and node.lineno == loop_line)
+    first, last = node.body[0].lineno, node.body[-1].end_lineno
+
+    iterations = []
+    current = None
+    depth = None
+    at_header = False
+    for index, line, step_depth, variables in result.states():
+        if depth is not None and step_depth > depth and line is not None:
+            continue
+        if line == loop_line:
+            depth = step_depth
+            at_header = True
+        elif line is not None and first <= line <= last and step_depth == depth:
+            if current is None and at_header:
+                current = {
+                    'number': len(iterations) + 1,
+                    'start': index,
+                    'end': None,
+                    'variables': dict(variables),
+                    'after': None,
+                    'lines': set()
+                }
+                iterations.append(current)
+            at_header = False
+            if current is not None:
+                current['lines'].add(line)
+            continue
+        else:
+            at_header = False
+
+        # Back at the header, or out of the loop: the running iteration is over
+        if current is not None:
+            current['end'] = index
+            current['after'] = dict(variables)
+            current = None
+    return iterations
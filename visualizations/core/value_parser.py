@@ -0,0 +1,102 @@
+"""
+Value Parser
+Turns what a student types into the value Python would read from it
+
+Every input box used to guess types with its own isdigit()/float() chain, and
+they disagreed: "true" was a bool on one tab and text on the next, "3." a float
+here and a str there. parse() reads the text as a Python literal with
+ast.literal_eval, so 42, -7, 3.14, True, None, 'quoted', [1, 2] and {"a": 1}
+become what they would in a program, and anything that isn't a literal stays
+the text that was typed. Text longer than MAX_LENGTH, or literals nested deeper
+than MAX_DEPTH or holding more than MAX_ITEMS values, raise ValueTooLarge
+before anything is built, so they never reach session state. Results are
+cached, since the same few inputs arrive again and again.
+"""
+
+import ast
+import functools
+import pickle
+
+MAX_LENGTH = 1000
+MAX_DEPTH = 5
+MAX_ITEMS = 200
+
+# Parsed inputs kept, shared by every session
+CACHE_SIZE = 2048
+
+_CONTAINERS = (ast.List, ast.Tuple, ast.Set, ast.Dict)
+
+class ValueTooLarge(ValueError):
+    """The input is too long, too deeply nested or has too many items to store"""
+
+def _check_size(tree):
+    """Raise ValueTooLarge if a parsed literal nests too deep or holds too much"""
+    items = 0
+    stack = [(tree, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, _CONTAINERS):
+            depth += 1
+            if depth > MAX_DEPTH:
+                raise ValueTooLarge(f"Values can only be nested {MAX_DEPTH} levels deep")
+        elif isinstance(node, ast.Constant):
+            items += 1
+            if items > MAX_ITEMS:
+                raise ValueTooLarge(f"Values can hold at most {MAX_ITEMS} items")
+        stack.extend((child, depth) for child in ast.iter_child_nodes(node))
+
+def _literal(text):
+    """(value, type name) for stripped text, uncached"""
+    if len(text) > MAX_LENGTH:
+        raise ValueTooLarge(f"Values can be at most {MAX_LENGTH:,} characters long")
+    try:
+        tree = ast.parse(text, mode="eval")
+    except (SyntaxError, ValueError) as error:
+        if "nested" in str(error):
+            # Deeper than Python's own parser allows
+            raise ValueTooLarge(f"Values can only be nested {MAX_DEPTH} levels deep")
+        # Not Python at all - e.g. Hello or 3.14.15
+        return text, "str"
+    _check_size(tree)
+    try:
+        value = ast.literal_eval(tree)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        # Python, but not a literal - e.g. a variable name or 2 + x
+        return text, "str"
+    return value, type(value).__name__
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _parse(text):
+    value, type_name = _literal(text)
+    # Kept pickled so every call gets new objects, as typing the literal again
+    # would: a stored list can't change the cached one, and two variables set
+    # to 1000 are two ints (small ints and single characters stay shared)
+    return pickle.dumps(value), type_name
+
+def parse(text):
+    """The value and type name Python would give typed-in text, e.g. "42" -> (42, "int")
+
+    Raises ValueTooLarge for input that shouldn't be stored.
+    """
+    data, type_name = _parse(text.strip())
+    return pickle.loads(data), type_name
+
+def type_name(text):
+    """Just the type name parse() would give text, without the cache - for classifying many values
+
+    Raises ValueTooLarge like parse().
+    """
+    return _literal(text.strip())[1]
+
+def parse_items(text, separator=","):
+    """Values from comma-separated text, e.g. "10, 2.5, hi" -> [10, 2.5, 'hi']
+
+    Text that is a tuple literal as a whole, like "(1, [2, 3])", gives its items.
+    """
+    value, _ = parse(text)
+    if isinstance(value, tuple):
+        return list(value)
+    parts = text.split(separator)
+    if len(parts) > MAX_ITEMS:
+        raise ValueTooLarge(f"Values can hold at most {MAX_ITEMS} items")
+    return [parse(part)[0] for part in parts]
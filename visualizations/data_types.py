@@ -1,5 +1,311 @@
+import time
+
 import streamlit as st
 
+from visualizations.core.fragments import panel
+from visualizations.core.safe_math import ResultTooLarge, evaluate, format_number
+from visualizations.core.value_parser import MAX_LENGTH, ValueTooLarge, parse, type_name
+
+# Values the bulk checker reads from a paste or upload
+MAX_BULK_VALUES = 100_000
+
+TYPE_NAMES = ["bool", "NoneType", "int", "float", "str"]
+
+# What the bulk checker calls values the parser refuses to build
+TOO_LARGE = "too large"
+
+# Shapes the bulk checker can classify without parsing: "-42", "+7", "0", "3.", ".5", "-0.25"
+# (no leading zeros on ints - Python rejects 007)
+SIMPLE_INT = r"[-+]?(?:0|[1-9][0-9]*)"
+SIMPLE_FLOAT = r"[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+)"
+
+# How the type checker shows each type name
+TYPE_STYLES = {
+    'bool': ("bool (Boolean)", "orange"),
+    'NoneType': ("NoneType", "gray"),
+    'int': ("int (Integer)", "blue"),
+    'float': ("float (Decimal)", "green"),
+    'str': ("str (String)", "purple"),
+}
+
+def check_type(text):
+    """The type name parse() gives typed-in text, uncached - or TOO_LARGE if it refuses the text"""
+    try:
+        return type_name(text)
+    except ValueTooLarge:
+        return TOO_LARGE
+
+def math_result(a, op, b):
+    """a op b for the type checker's examples, or TOO_LARGE when it overflows or would be huge"""
+    try:
+        return format_number(evaluate(a, op, b))
+    except (ResultTooLarge, OverflowError):
+        return TOO_LARGE
+
+def check_types(values):
+    """check_type() for a whole pandas Series of strings at once
+
+    Values in the most common shapes - plain ints and decimals, True, False
+    and None - are classified with vectorized string matching. Only the rest
+    go through the parser, once per distinct value, and pandas spreads the
+    answers back over the column. Returns the type name of every value, plus
+    the rows the parser refuses.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # Only the whitespace str.strip() removes too, and ASCII digits only, so
+    # anything these patterns call an int or float really is one
+    simple = values.str.strip(" \t\n\r\f\v")
+    short = simple.str.len() <= MAX_LENGTH
+    names = pd.Series(np.select(
+        [simple.isin(["True", "False"]), simple.eq("None"),
+         short & simple.str.fullmatch(SIMPLE_INT), short & simple.str.fullmatch(SIMPLE_FLOAT)],
+        TYPE_NAMES[:4], default=""
+    ), index=values.index)
+
+    rest = names.eq("")
+    codes, distinct = pd.factorize(values[rest])
+    names[rest] = np.array([check_type(text) for text in distinct], dtype=object)[codes]
+
+    refused = names.eq(TOO_LARGE)
+    failures = pd.DataFrame({
+        'row': values.index[refused] + 1,
+        'value': values[refused].str.slice(0, 60),
+        'length': values[refused].str.len()
+    })
+    return names, failures
+
+def sample_values(count, seed=0):
+    """count random values of every kind, including a few that only look like numbers"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    kinds = rng.integers(0, 5, count)
+    ints = rng.integers(-1000, 1000, count).astype(str)
+    floats = np.round(rng.uniform(-100, 100, count), 2).astype(str)
+    words = rng.choice(["apple", "Hello", "42abc", "3.14.15", "", "true", "1e5", "'42'", "[1, 2]", " 7 "], count)
+    special = rng.choice(["True", "False", "None"], count)
+    values = np.select([kinds == 1, kinds == 2, kinds == 3], [floats, words, special], default=ints)
+    # About one value in a hundred that looks like a number but isn't
+    tricky = rng.random(count) < 0.01
+    values[tricky] = rng.choice(["--5", "1-2", "²", "007"], tricky.sum())
+    return pd.Series(values)
+
+@panel
+def type_checker_panel():
+    """Try-it panel: detect the type of any value"""
+    col_input1, col_input2 = st.columns([2, 1])
+
+    with col_input1:
+        test_value = st.text_input("Enter any value (try: 42, 3.14, Hello, True)", 
+                                   value="42", 
+                                   key="type_test")
+
+    with col_input2:
+        st.write("")  # spacing
+        check_btn = st.button("🔍 Check Type", use_container_width=True)
+
+    if check_btn or test_value:
+        st.markdown("#### 🎯 Analysis Results:")
+
+        col_res1, col_res2, col_res3 = st.columns(3)
+
+        try:
+            actual_value, type_name = parse(test_value)
+        except ValueTooLarge as error:
+            st.error(f"❌ {error}")
+            return
+        python_type = type(actual_value)
+        type_name, type_color = TYPE_STYLES.get(type_name, (type_name, None))
+
+        with col_res1:
+            st.markdown(f"**Your Input:**")
+            st.code(f"{test_value}")
+
+        with col_res2:
+            st.markdown(f"**Python Type:**")
+            if type_color == "blue":
+                st.markdown(f":{type_color}[{type_name}]")
+            elif type_color == "green":
+                st.markdown(f":{type_color}[{type_name}]")
+            elif type_color == "purple":
+                st.markdown(f":{type_color}[{type_name}]")
+            elif type_color == "orange":
+                st.markdown(f":{type_color}[{type_name}]")
+            else:
+                st.markdown(f"{type_name}")
+
+        with col_res3:
+            st.markdown(f"**Python Code:**")
+            st.code(f"type({test_value})")
+
+        # Show what you can do with this type
+        st.markdown("#### 🎮 What Can You Do With This Type?")
+
+        if python_type == int or python_type == float:
+            st.success(f"""
+            **✅ Math Operations:**
+            - Addition: `{actual_value} + 5` = {math_result(actual_value, "+", 5)}
+            - Multiplication: `{actual_value} * 2` = {math_result(actual_value, "*", 2)}
+            - Division: `{actual_value} / 2` = {math_result(actual_value, "/", 2)}
+            - Power: `{actual_value} ** 2` = {math_result(actual_value, "**", 2)}
+            """)
+        elif python_type == str:
+            st.success(f"""
+            **✅ String Operations:**
+            - Length: `len("{actual_value}")` = {len(actual_value)}
+            - Uppercase: `"{actual_value}".upper()` = "{actual_value.upper()}"
+            - Repeat: `"{actual_value}" * 3` = "{actual_value * 3}"
+            - Join: `"{actual_value}" + " World"` = "{actual_value} World"
+            """)
+        elif python_type == bool:
+            st.success(f"""
+            **✅ Boolean Operations:**
+            - NOT: `not {actual_value}` = {not actual_value}
+            - AND: `{actual_value} and True` = {actual_value and True}
+            - OR: `{actual_value} or False` = {actual_value or False}
+            - Used in: if statements, while loops
+            """)
+        elif actual_value is None:
+            st.success("""
+            **✅ None Usage:**
+            - Represents "no value" or "empty"
+            - Often used as default value
+            - Check with: `if value is None:`
+            """)
+
+@panel
+def bulk_type_checker_panel():
+    """Try-it panel: classify thousands of values, one by one and all at once"""
+    source = st.radio("Values from:", ["🎲 Random sample", "✍️ Paste", "📁 Upload"],
+                      horizontal=True, key="bulk_source")
+
+    if source == "🎲 Random sample":
+        count = st.number_input("How many values?", min_value=10, max_value=MAX_BULK_VALUES,
+                                value=50_000, step=5000, key="bulk_count")
+    elif source == "✍️ Paste":
+        text = st.text_area("One value per line:", value="42\n3.14\nHello\nTrue\nNone\n-7\n1e5\n[1, 2]\n--5",
+                            height=150, key="bulk_paste")
+    else:
+        upload = st.file_uploader("A .txt file with one value per line, or a .csv file",
+                                  type=["txt", "csv"], key="bulk_upload")
+        if upload is None:
+            st.info("👆 Upload a file to check every value in it")
+            return
+
+    # Checking runs both ways on purpose, so only do it when asked
+    if not st.button("⚡ Check Every Value", key="bulk_check"):
+        return
+
+    # pandas takes about half a second to import, so the page doesn't wait for it until now
+    import pandas as pd
+
+    if source == "🎲 Random sample":
+        values = sample_values(int(count))
+    elif source == "✍️ Paste":
+        values = pd.Series(text.splitlines(), dtype=object)
+    elif upload.name.endswith(".csv"):
+        try:
+            table = pd.read_csv(upload, header=None, dtype=str, keep_default_na=False)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError) as error:
+            st.error(f"❌ Couldn't read that CSV file: {error}")
+            return
+        values = table.stack().reset_index(drop=True)
+    else:
+        values = pd.Series(upload.getvalue().decode("utf-8", "replace").splitlines(), dtype=object)
+
+    if len(values) > MAX_BULK_VALUES:
+        st.warning(f"✂️ Only the first {MAX_BULK_VALUES:,} of {len(values):,} values are checked.")
+        values = values[:MAX_BULK_VALUES]
+    if values.empty:
+        st.info("There are no values to check.")
+        return
+
+    # The same parser runs both ways: once per value in a Python loop, then
+    # only where pandas can't settle the type itself
+    start = time.perf_counter()
+    one_by_one = [check_type(value) for value in values]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    names, failures = check_types(values.astype(str))
+    vector_seconds = time.perf_counter() - start
+
+    st.markdown(f"#### ⏱️ {len(values):,} Values: Loop vs Vectorized")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🐢 One at a time", f"{loop_seconds * 1000:,.1f} ms")
+        st.code("[check_type(v) for v in values]", language="python")
+    with col2:
+        st.metric("⚡ Whole column", f"{vector_seconds * 1000:,.1f} ms")
+        st.code('values.str.fullmatch(SIMPLE_INT)  # ...', language="python")
+    with col3:
+        speedup = loop_seconds / max(vector_seconds, 1e-9)
+        st.metric("🚀 Speed-up", f"{speedup:,.1f}×" if speedup >= 1 else "the loop wins")
+        if one_by_one == names.tolist():
+            st.success("✅ Both ways agree on every value")
+        else:
+            st.error("❌ The two ways disagree")
+    st.caption("The loop parses every value in Python. pandas matches the common shapes - plain numbers, "
+               "True, False, None - over the whole column in compiled code, and parses each remaining "
+               "distinct value only once. Each pandas step has a fixed start-up cost, so the loop can "
+               "win for a handful of values - the gap grows with the number of values.")
+
+    counts = names.value_counts()
+    counts = counts.reindex(TYPE_NAMES + sorted(set(counts.index) - set(TYPE_NAMES)), fill_value=0)
+    col_counts, col_chart = st.columns([1, 2])
+    with col_counts:
+        st.markdown("#### 🧮 Type Counts")
+        st.dataframe(counts.rename("count").rename_axis("type").reset_index(), hide_index=True)
+    with col_chart:
+        st.markdown("#### 📊 Histogram")
+        st.bar_chart(counts)
+
+    st.markdown(f"#### ⚠️ Too Large to Check ({len(failures):,})")
+    if failures.empty:
+        st.success("Every value was small enough to read.")
+    else:
+        st.write(f"The type checker refuses these: over {MAX_LENGTH:,} characters, or too deeply nested "
+                 "or too many items for a literal:")
+        st.dataframe(failures.head(500), hide_index=True, use_container_width=True)
+
+@panel
+def type_conversion_panel():
+    """Try-it panel: convert a value to int, float or str"""
+    st.markdown("#### 🎯 Try Type Conversion")
+
+    col_try1, col_try2, col_try3 = st.columns([2, 1, 2])
+
+    with col_try1:
+        conv_value = st.text_input("Enter a value to convert", value="42", key="conv_input")
+
+    with col_try2:
+        conv_type = st.selectbox("Convert to:", ["int", "float", "str"], key="conv_type")
+
+    with col_try3:
+        st.write("")  # spacing
+        convert_btn = st.button("🔄 Convert", use_container_width=True)
+
+    if convert_btn or (conv_value and conv_type):
+        try:
+            if conv_type == "int":
+                result = int(float(conv_value))  # float first to handle "3.7"
+                st.success(f"✅ Result: `{result}` (type: {type(result).__name__})")
+                st.code(f"int({conv_value}) = {result}", language="python")
+            elif conv_type == "float":
+                result = float(conv_value)
+                st.success(f"✅ Result: `{result}` (type: {type(result).__name__})")
+                st.code(f"float({conv_value}) = {result}", language="python")
+            elif conv_type == "str":
+                result = str(conv_value)
+                st.success(f"✅ Result: `\"{result}\"` (type: {type(result).__name__})")
+                st.code(f"str({conv_value}) = \"{result}\"", language="python")
+        except Exception as e:
+            st.error(f"❌ Cannot convert '{conv_value}' to {conv_type}")
+            st.caption(f"Error: {str(e)}")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">🎨 Python Data Types Explorer</h2>', unsafe_allow_html=True)
     st.write("Discover different types of data in Python and how to use them!")
@@ -64,125 +370,14 @@ def show():
     st.markdown("---")
     st.markdown("### 🔍 Type Checker - Try It Out!")
     
-    col_input1, col_input2 = st.columns([2, 1])
+    type_checker_panel()
     
-    with col_input1:
-        test_value = st.text_input("Enter any value (try: 42, 3.14, Hello, True)", 
-                                   value="42", 
-                                   key="type_test")
+    # Bulk type checker
+    st.markdown("---")
+    st.markdown("### 📦 Bulk Type Checker - Thousands at Once")
+    st.write("Check a whole list of values and see why pandas works on columns instead of loops!")
     
-    with col_input2:
-        st.write("")  # spacing
-        check_btn = st.button("🔍 Check Type", use_container_width=True)
-    
-    if check_btn or test_value:
-        st.markdown("#### 🎯 Analysis Results:")
-        
-        col_res1, col_res2, col_res3 = st.columns(3)
-        
-        # Determine the type
-        python_type = None
-        type_name = None
-        type_color = None
-        actual_value = None
-        
-        # Try to evaluate the value
-        try:
-            # Check for boolean first
-            if test_value == "True":
-                actual_value = True
-                python_type = bool
-                type_name = "bool (Boolean)"
-                type_color = "orange"
-            elif test_value == "False":
-                actual_value = False
-                python_type = bool
-                type_name = "bool (Boolean)"
-                type_color = "orange"
-            elif test_value == "None":
-                actual_value = None
-                python_type = type(None)
-                type_name = "NoneType"
-                type_color = "gray"
-            # Try as int
-            elif test_value.lstrip('-').isdigit():
-                actual_value = int(test_value)
-                python_type = int
-                type_name = "int (Integer)"
-                type_color = "blue"
-            # Try as float
-            elif test_value.replace('.', '', 1).replace('-', '', 1).isdigit():
-                actual_value = float(test_value)
-                python_type = float
-                type_name = "float (Decimal)"
-                type_color = "green"
-            else:
-                # It's a string
-                actual_value = test_value
-                python_type = str
-                type_name = "str (String)"
-                type_color = "purple"
-        except:
-            actual_value = test_value
-            python_type = str
-            type_name = "str (String)"
-            type_color = "purple"
-        
-        with col_res1:
-            st.markdown(f"**Your Input:**")
-            st.code(f"{test_value}")
-        
-        with col_res2:
-            st.markdown(f"**Python Type:**")
-            if type_color == "blue":
-                st.markdown(f":{type_color}[{type_name}]")
-            elif type_color == "green":
-                st.markdown(f":{type_color}[{type_name}]")
-            elif type_color == "purple":
-                st.markdown(f":{type_color}[{type_name}]")
-            elif type_color == "orange":
-                st.markdown(f":{type_color}[{type_name}]")
-            else:
-                st.markdown(f"{type_name}")
-        
-        with col_res3:
-            st.markdown(f"**Python Code:**")
-            st.code(f"type({test_value})")
-        
-        # Show what you can do with this type
-        st.markdown("#### 🎮 What Can You Do With This Type?")
-        
-        if python_type == int or python_type == float:
-            st.success(f"""
-            **✅ Math Operations:**
-            - Addition: `{actual_value} + 5` = {actual_value + 5}
-            - Multiplication: `{actual_value} * 2` = {actual_value * 2}
-            - Division: `{actual_value} / 2` = {actual_value / 2}
-            - Power: `{actual_value} ** 2` = {actual_value ** 2}
-            """)
-        elif python_type == str:
-            st.success(f"""
-            **✅ String Operations:**
-            - Length: `len("{actual_value}")` = {len(actual_value)}
-            - Uppercase: `"{actual_value}".upper()` = "{actual_value.upper()}"
-            - Repeat: `"{actual_value}" * 3` = "{actual_value * 3}"
-            - Join: `"{actual_value}" + " World"` = "{actual_value} World"
-            """)
-        elif python_type == bool:
-            st.success(f"""
-            **✅ Boolean Operations:**
-            - NOT: `not {actual_value}` = {not actual_value}
-            - AND: `{actual_value} and True` = {actual_value and True}
-            - OR: `{actual_value} or False` = {actual_value or False}
-            - Used in: if statements, while loops
-            """)
-        elif actual_value is None:
-            st.success("""
-            **✅ None Usage:**
-            - Represents "no value" or "empty"
-            - Often used as default value
-            - Check with: `if value is None:`
-            """)
+    bulk_type_checker_panel()
     
     # Type conversion section
     st.markdown("---")
@@ -229,37 +424,7 @@ float(-10)     # → -10.0
 """, language="python")
     
     # Interactive conversion
-    st.markdown("#### 🎯 Try Type Conversion")
-    
-    col_try1, col_try2, col_try3 = st.columns([2, 1, 2])
-    
-    with col_try1:
-        conv_value = st.text_input("Enter a value to convert", value="42", key="conv_input")
-    
-    with col_try2:
-        conv_type = st.selectbox("Convert to:", ["int", "float", "str"], key="conv_type")
-    
-    with col_try3:
-        st.write("")  # spacing
-        convert_btn = st.button("🔄 Convert", use_container_width=True)
-    
-    if convert_btn or (conv_value and conv_type):
-        try:
-            if conv_type == "int":
-                result = int(float(conv_value))  # float first to handle "3.7"
-                st.success(f"✅ Result: `{result}` (type: {type(result).__name__})")
-                st.code(f"int({conv_value}) = {result}", language="python")
-            elif conv_type == "float":
-                result = float(conv_value)
-                st.success(f"✅ Result: `{result}` (type: {type(result).__name__})")
-                st.code(f"float({conv_value}) = {result}", language="python")
-            elif conv_type == "str":
-                result = str(conv_value)
-                st.success(f"✅ Result: `\"{result}\"` (type: {type(result).__name__})")
-                st.code(f"str({conv_value}) = \"{result}\"", language="python")
-        except Exception as e:
-            st.error(f"❌ Cannot convert '{conv_value}' to {conv_type}")
-            st.caption(f"Error: {str(e)}")
+    type_conversion_panel()
     
     # Common mistakes section
     st.markdown("---")
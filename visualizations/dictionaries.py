@@ -1,6 +1,179 @@
 import streamlit as st
 import json
 
+from visualizations.core.cards import card_pairs, item_card
+from visualizations.core.fragments import panel
+from visualizations.core.session_limits import LRU, manage
+from visualizations.core.value_parser import ValueTooLarge, parse
+
+# Per-student session state kept in check by the session manager
+manage('my_dict', cap=500, evict=LRU)
+
+@panel
+def access_values_panel():
+    """Try-it panel: [] vs get() lookups"""
+    if len(st.session_state.my_dict) == 0:
+        st.warning("⚠️ Dictionary is empty! Add items first.")
+    else:
+        st.info("""
+        **Two ways to access values:**
+
+        1. **Square brackets** `dict[key]` - Error if key doesn't exist
+        2. **`.get()` method** `dict.get(key)` - Returns None if key doesn't exist
+
+        ```python
+        name = my_dict["name"]           # KeyError if "name" not found
+        age = my_dict.get("age")         # Returns None if not found
+        age = my_dict.get("age", 0)      # Returns 0 if not found (default)
+        ```
+        """)
+
+        access_method = st.radio("Choose method:", 
+                                ["Square brackets []", "get() method"],
+                                horizontal=True,
+                                key="access_method")
+
+        if "Square brackets" in access_method:
+            st.markdown("#### 🔲 Using Square Brackets")
+
+            col_sq1, col_sq2 = st.columns([3, 1])
+            with col_sq1:
+                access_key = st.selectbox("Select key to access:", 
+                                         list(st.session_state.my_dict.keys()),
+                                         key="access_key_sq")
+            with col_sq2:
+                st.write("")
+                access_btn = st.button("🔍 Access", use_container_width=True, key="access_btn_sq")
+
+            if access_btn or access_key:
+                value = st.session_state.my_dict[access_key]
+                st.success(f"✅ `my_dict[{repr(access_key)}]` = {repr(value)}")
+                st.code(f"value = my_dict[{repr(access_key)}]\nprint(value)  # {repr(value)}", language="python")
+
+            # Show error example
+            st.markdown("---")
+            st.markdown("**⚠️ What happens with a non-existent key?**")
+            fake_key = st.text_input("Try a key that doesn't exist:", value="xyz", key="fake_key_sq")
+            if st.button("Try It", key="try_fake_btn_sq"):
+                if fake_key in st.session_state.my_dict:
+                    st.info(f"Key '{fake_key}' exists! Value: {st.session_state.my_dict[fake_key]}")
+                else:
+                    st.error(f"❌ KeyError: '{fake_key}' not found in dictionary!")
+                    st.code(f"value = my_dict[{repr(fake_key)}]  # KeyError!", language="python")
+
+        else:  # get() method
+            st.markdown("#### 🎯 Using .get() Method")
+
+            col_get1, col_get2, col_get3 = st.columns([2, 2, 1])
+            with col_get1:
+                get_key = st.text_input("Key to get:", key="get_key")
+            with col_get2:
+                default_val = st.text_input("Default value (if not found):", value="Not Found", key="default_val")
+            with col_get3:
+                st.write("")
+                get_btn = st.button("🔍 Get", use_container_width=True, key="get_btn_method")
+
+            if get_btn and get_key:
+                value = st.session_state.my_dict.get(get_key, default_val)
+
+                if get_key in st.session_state.my_dict:
+                    st.success(f"✅ Found! `my_dict.get({repr(get_key)})` = {repr(value)}")
+                else:
+                    st.warning(f"⚠️ Key not found. Returned default: {repr(value)}")
+
+                st.code(f"value = my_dict.get({repr(get_key)}, {repr(default_val)})\nprint(value)  # {repr(value)}", language="python")
+
+            st.info("""
+            **💡 Why use .get()?**
+            - Safer - no errors if key missing
+            - Can provide default value
+            - Good for optional data
+            """)
+
+@panel
+def iterate_panel():
+    """Try-it panel: loop over keys, values or items"""
+    if len(st.session_state.my_dict) == 0:
+        st.warning("⚠️ Dictionary is empty! Add items first.")
+    else:
+        loop_type = st.radio("Choose what to loop over:", 
+                            ["Keys only", "Values only", "Key-Value pairs"],
+                            horizontal=True,
+                            key="loop_type")
+
+        if loop_type == "Keys only":
+            st.info("""
+            **Loop through keys:**
+            ```python
+            for key in my_dict:
+                print(key)
+            ```
+            or
+            ```python
+            for key in my_dict.keys():
+                print(key)
+            ```
+            """)
+
+            if st.button("▶️ Run Loop", key="run_keys"):
+                st.markdown("#### Iteration Results:")
+                st.code(f"for key in my_dict:\n    print(key)", language="python")
+                st.markdown("---")
+
+                for i, key in enumerate(st.session_state.my_dict, 1):
+                    col1, col2 = st.columns([1, 3])
+                    with col1:
+                        st.markdown(f"**Iteration {i}**")
+                    with col2:
+                        st.code(f"key = {repr(key)}", language="python")
+                    st.markdown("---")
+
+        elif loop_type == "Values only":
+            st.info("""
+            **Loop through values:**
+            ```python
+            for value in my_dict.values():
+                print(value)
+            ```
+            """)
+
+            if st.button("▶️ Run Loop", key="run_values"):
+                st.markdown("#### Iteration Results:")
+                st.code(f"for value in my_dict.values():\n    print(value)", language="python")
+                st.markdown("---")
+
+                for i, value in enumerate(st.session_state.my_dict.values(), 1):
+                    col1, col2 = st.columns([1, 3])
+                    with col1:
+                        st.markdown(f"**Iteration {i}**")
+                    with col2:
+                        st.code(f"value = {repr(value)}", language="python")
+                    st.markdown("---")
+
+        else:  # Key-Value pairs
+            st.info("""
+            **Loop through key-value pairs:**
+            ```python
+            for key, value in my_dict.items():
+                print(f"{key}: {value}")
+            ```
+            """)
+
+            if st.button("▶️ Run Loop", key="run_items"):
+                st.markdown("#### Iteration Results:")
+                st.code(f"for key, value in my_dict.items():\n    print(f'{{key}}: {{value}}')", language="python")
+                st.markdown("---")
+
+                for i, (key, value) in enumerate(st.session_state.my_dict.items(), 1):
+                    col1, col2, col3 = st.columns([1, 2, 2])
+                    with col1:
+                        st.markdown(f"**Iter {i}**")
+                    with col2:
+                        st.markdown(f"**key:** :orange[{repr(key)}]")
+                    with col3:
+                        st.markdown(f"**value:** :green[{repr(value)}]")
+                    st.markdown("---")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">📖 Python Dictionaries Explorer</h2>', unsafe_allow_html=True)
     st.write("Learn how to store and manage key-value pairs in dictionaries!")
@@ -45,41 +218,10 @@ def show():
         st.info("📭 Dictionary is empty! Add some key-value pairs below.")
     else:
         # Visual representation of the dictionary
-        for key, value in st.session_state.my_dict.items():
-            col1, col2, col3 = st.columns([2, 1, 2])
-            
-            with col1:
-                st.markdown(f"""
-                <div style='
-                    border: 2px solid #FF9800;
-                    border-radius: 10px;
-                    padding: 15px;
-                    background-color: rgba(255, 152, 0, 0.1);
-                    text-align: center;
-                '>
-                    <div style='font-size: 0.8rem; color: #666;'>KEY</div>
-                    <div style='font-size: 1.2rem; font-weight: bold; color: #FF9800;'>{key}</div>
-                    <div style='font-size: 0.7rem; color: #999;'>({type(key).__name__})</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("<div style='text-align: center; font-size: 2rem; padding-top: 20px;'>→</div>", unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div style='
-                    border: 2px solid #4CAF50;
-                    border-radius: 10px;
-                    padding: 15px;
-                    background-color: rgba(76, 175, 80, 0.1);
-                    text-align: center;
-                '>
-                    <div style='font-size: 0.8rem; color: #666;'>VALUE</div>
-                    <div style='font-size: 1.2rem; font-weight: bold; color: #4CAF50;'>{value}</div>
-                    <div style='font-size: 0.7rem; color: #999;'>({type(value).__name__})</div>
-                </div>
-                """, unsafe_allow_html=True)
+        card_pairs([
+            (item_card("KEY", key, "#FF9800"), item_card("VALUE", value, "#4CAF50"))
+            for key, value in st.session_state.my_dict.items()
+        ])
     
     # Show Python code representation
     st.code(f"my_dict = {st.session_state.my_dict}", language="python")
@@ -129,32 +271,23 @@ def show():
             add_btn = st.button("➕ Add/Update", use_container_width=True)
         
         if add_btn and new_key and new_value:
-            # Try to convert value to appropriate type
             try:
-                if '.' in new_value:
-                    converted_value = float(new_value)
-                else:
-                    converted_value = int(new_value)
-            except:
-                if new_value == "True":
-                    converted_value = True
-                elif new_value == "False":
-                    converted_value = False
-                else:
-                    converted_value = new_value
-            
-            # Check if updating existing key
-            if new_key in st.session_state.my_dict:
-                old_value = st.session_state.my_dict[new_key]
-                st.session_state.my_dict[new_key] = converted_value
-                st.warning(f"✏️ Updated '{new_key}': {repr(old_value)} → {repr(converted_value)}")
-                st.code(f"my_dict[{repr(new_key)}] = {repr(converted_value)}\n# Result: {st.session_state.my_dict}", language="python")
+                converted_value, _ = parse(new_value)
+            except ValueTooLarge as error:
+                st.error(f"❌ {error}")
             else:
-                st.session_state.my_dict[new_key] = converted_value
-                st.success(f"✅ Added new pair: '{new_key}' → {repr(converted_value)}")
-                st.code(f"my_dict[{repr(new_key)}] = {repr(converted_value)}\n# Result: {st.session_state.my_dict}", language="python")
+                # Check if updating existing key
+                if new_key in st.session_state.my_dict:
+                    old_value = st.session_state.my_dict[new_key]
+                    st.session_state.my_dict[new_key] = converted_value
+                    st.warning(f"✏️ Updated '{new_key}': {repr(old_value)} → {repr(converted_value)}")
+                    st.code(f"my_dict[{repr(new_key)}] = {repr(converted_value)}\n# Result: {st.session_state.my_dict}", language="python")
+                else:
+                    st.session_state.my_dict[new_key] = converted_value
+                    st.success(f"✅ Added new pair: '{new_key}' → {repr(converted_value)}")
+                    st.code(f"my_dict[{repr(new_key)}] = {repr(converted_value)}\n# Result: {st.session_state.my_dict}", language="python")
             
-            st.rerun()
+                st.rerun()
         
         # Bulk update
         st.markdown("---")
@@ -183,7 +316,7 @@ def show():
                 for pair in pairs:
                     if ":" in pair:
                         k, v = pair.split(":", 1)
-                        new_dict[k.strip()] = v.strip()
+                        new_dict[k.strip()], _ = parse(v)
                 
                 st.session_state.my_dict.update(new_dict)
                 st.success(f"✅ Updated {len(new_dict)} pairs!")
@@ -198,83 +331,7 @@ def show():
     with op_tabs[1]:
         st.markdown("### 🔍 Access Values by Key")
         
-        if len(st.session_state.my_dict) == 0:
-            st.warning("⚠️ Dictionary is empty! Add items first.")
-        else:
-            st.info("""
-            **Two ways to access values:**
-            
-            1. **Square brackets** `dict[key]` - Error if key doesn't exist
-            2. **`.get()` method** `dict.get(key)` - Returns None if key doesn't exist
-            
-            ```python
-            name = my_dict["name"]           # KeyError if "name" not found
-            age = my_dict.get("age")         # Returns None if not found
-            age = my_dict.get("age", 0)      # Returns 0 if not found (default)
-            ```
-            """)
-            
-            access_method = st.radio("Choose method:", 
-                                    ["Square brackets []", "get() method"],
-                                    horizontal=True,
-                                    key="access_method")
-            
-            if "Square brackets" in access_method:
-                st.markdown("#### 🔲 Using Square Brackets")
-                
-                col_sq1, col_sq2 = st.columns([3, 1])
-                with col_sq1:
-                    access_key = st.selectbox("Select key to access:", 
-                                             list(st.session_state.my_dict.keys()),
-                                             key="access_key_sq")
-                with col_sq2:
-                    st.write("")
-                    access_btn = st.button("🔍 Access", use_container_width=True, key="access_btn_sq")
-                
-                if access_btn or access_key:
-                    value = st.session_state.my_dict[access_key]
-                    st.success(f"✅ `my_dict[{repr(access_key)}]` = {repr(value)}")
-                    st.code(f"value = my_dict[{repr(access_key)}]\nprint(value)  # {repr(value)}", language="python")
-                
-                # Show error example
-                st.markdown("---")
-                st.markdown("**⚠️ What happens with a non-existent key?**")
-                fake_key = st.text_input("Try a key that doesn't exist:", value="xyz", key="fake_key_sq")
-                if st.button("Try It", key="try_fake_btn_sq"):
-                    if fake_key in st.session_state.my_dict:
-                        st.info(f"Key '{fake_key}' exists! Value: {st.session_state.my_dict[fake_key]}")
-                    else:
-                        st.error(f"❌ KeyError: '{fake_key}' not found in dictionary!")
-                        st.code(f"value = my_dict[{repr(fake_key)}]  # KeyError!", language="python")
-            
-            else:  # get() method
-                st.markdown("#### 🎯 Using .get() Method")
-                
-                col_get1, col_get2, col_get3 = st.columns([2, 2, 1])
-                with col_get1:
-                    get_key = st.text_input("Key to get:", key="get_key")
-                with col_get2:
-                    default_val = st.text_input("Default value (if not found):", value="Not Found", key="default_val")
-                with col_get3:
-                    st.write("")
-                    get_btn = st.button("🔍 Get", use_container_width=True, key="get_btn_method")
-                
-                if get_btn and get_key:
-                    value = st.session_state.my_dict.get(get_key, default_val)
-                    
-                    if get_key in st.session_state.my_dict:
-                        st.success(f"✅ Found! `my_dict.get({repr(get_key)})` = {repr(value)}")
-                    else:
-                        st.warning(f"⚠️ Key not found. Returned default: {repr(value)}")
-                    
-                    st.code(f"value = my_dict.get({repr(get_key)}, {repr(default_val)})\nprint(value)  # {repr(value)}", language="python")
-                
-                st.info("""
-                **💡 Why use .get()?**
-                - Safer - no errors if key missing
-                - Can provide default value
-                - Good for optional data
-                """)
+        access_values_panel()
     
     # ============================================
     # TAB 3: REMOVE ITEMS
@@ -415,86 +472,7 @@ def show():
     with op_tabs[4]:
         st.markdown("### 🔄 Loop Through Dictionary")
         
-        if len(st.session_state.my_dict) == 0:
-            st.warning("⚠️ Dictionary is empty! Add items first.")
-        else:
-            loop_type = st.radio("Choose what to loop over:", 
-                                ["Keys only", "Values only", "Key-Value pairs"],
-                                horizontal=True,
-                                key="loop_type")
-            
-            if loop_type == "Keys only":
-                st.info("""
-                **Loop through keys:**
-                ```python
-                for key in my_dict:
-                    print(key)
-                ```
-                or
-                ```python
-                for key in my_dict.keys():
-                    print(key)
-                ```
-                """)
-                
-                if st.button("▶️ Run Loop", key="run_keys"):
-                    st.markdown("#### Iteration Results:")
-                    st.code(f"for key in my_dict:\n    print(key)", language="python")
-                    st.markdown("---")
-                    
-                    for i, key in enumerate(st.session_state.my_dict, 1):
-                        col1, col2 = st.columns([1, 3])
-                        with col1:
-                            st.markdown(f"**Iteration {i}**")
-                        with col2:
-                            st.code(f"key = {repr(key)}", language="python")
-                        st.markdown("---")
-            
-            elif loop_type == "Values only":
-                st.info("""
-                **Loop through values:**
-                ```python
-                for value in my_dict.values():
-                    print(value)
-                ```
-                """)
-                
-                if st.button("▶️ Run Loop", key="run_values"):
-                    st.markdown("#### Iteration Results:")
-                    st.code(f"for value in my_dict.values():\n    print(value)", language="python")
-                    st.markdown("---")
-                    
-                    for i, value in enumerate(st.session_state.my_dict.values(), 1):
-                        col1, col2 = st.columns([1, 3])
-                        with col1:
-                            st.markdown(f"**Iteration {i}**")
-                        with col2:
-                            st.code(f"value = {repr(value)}", language="python")
-                        st.markdown("---")
-            
-            else:  # Key-Value pairs
-                st.info("""
-                **Loop through key-value pairs:**
-                ```python
-                for key, value in my_dict.items():
-                    print(f"{key}: {value}")
-                ```
-                """)
-                
-                if st.button("▶️ Run Loop", key="run_items"):
-                    st.markdown("#### Iteration Results:")
-                    st.code(f"for key, value in my_dict.items():\n    print(f'{{key}}: {{value}}')", language="python")
-                    st.markdown("---")
-                    
-                    for i, (key, value) in enumerate(st.session_state.my_dict.items(), 1):
-                        col1, col2, col3 = st.columns([1, 2, 2])
-                        with col1:
-                            st.markdown(f"**Iter {i}**")
-                        with col2:
-                            st.markdown(f"**key:** :orange[{repr(key)}]")
-                        with col3:
-                            st.markdown(f"**value:** :green[{repr(value)}]")
-                        st.markdown("---")
+        iterate_panel()
     
     # Reset button
     st.markdown("---")
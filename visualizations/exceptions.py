@@ -1,5 +1,439 @@
 import streamlit as st
 
+from visualizations.core.fragments import panel
+
+@panel
+def division_panel():
+    """Try-it panel: division with and without try-except"""
+    col_div1, col_div2 = st.columns(2)
+
+    with col_div1:
+        numerator = st.number_input("Numerator:", value=10, key="num_basic")
+
+    with col_div2:
+        denominator = st.number_input("Denominator:", value=0, key="denom_basic")
+
+    col_demo1, col_demo2 = st.columns(2)
+
+    with col_demo1:
+        st.markdown("**❌ Without Try-Except:**")
+        if st.button("Run (Will Crash!)", key="no_try_btn"):
+            st.code(f"""result = {numerator} / {denominator}
+print(result)""", language="python")
+
+            if denominator == 0:
+                st.error("""
+                💥 **ZeroDivisionError:**
+                division by zero
+
+                ❌ Program crashed!
+                """)
+            else:
+                result = numerator / denominator
+                st.success(f"Result: {result}")
+
+    with col_demo2:
+        st.markdown("**✅ With Try-Except:**")
+        if st.button("Run (Safe!)", key="with_try_btn"):
+            st.code(f"""try:
+    result = {numerator} / {denominator}
+    print(result)
+except:
+    print("Cannot divide by zero!")""", language="python")
+
+            try:
+                result = numerator / denominator
+                st.success(f"✅ Result: {result}")
+            except:
+                st.warning("⚠️ Cannot divide by zero!\n\n✅ Program still running!")
+
+@panel
+def convert_int_panel():
+    """Try-it panel: convert text to an integer"""
+    user_input = st.text_input("Enter a number:", value="42", key="basic_input")
+
+    if st.button("🔍 Convert to Integer", key="convert_int_btn"):
+        col_flow1, col_flow2 = st.columns(2)
+
+        with col_flow1:
+            st.markdown("**Code:**")
+            st.code(f"""try:
+    number = int("{user_input}")
+    print(f"Success! {{number}}")
+except:
+    print("That's not a number!")""", language="python")
+
+        with col_flow2:
+            st.markdown("**Result:**")
+            try:
+                number = int(user_input)
+                st.success(f"✅ Success! {number}")
+                st.info(f"Type: {type(number).__name__}")
+            except:
+                st.error(f'❌ "{user_input}" is not a valid number!')
+                st.warning("⚠️ Handled error gracefully!")
+
+@panel
+def exception_types_panel():
+    """Try-it panel: different exception types"""
+    exception_demo = st.radio("Choose operation:", 
+                              ["Convert to Integer", "Divide Numbers", "Access List Item", "Get Dict Value"],
+                              key="exception_demo")
+
+    if exception_demo == "Convert to Integer":
+        st.markdown("**ValueError Demo:**")
+
+        convert_input = st.text_input("Enter value:", value="hello", key="convert_input")
+
+        if st.button("🔄 Convert", key="convert_btn"):
+            st.code(f"""try:
+    number = int("{convert_input}")
+    print(f"Converted: {{number}}")
+except ValueError:
+    print("ValueError: Cannot convert to integer!")""", language="python")
+
+            try:
+                number = int(convert_input)
+                st.success(f"✅ Converted: {number}")
+            except ValueError:
+                st.error("❌ ValueError: Cannot convert to integer!")
+                st.info("💡 Caught ValueError specifically!")
+
+    elif exception_demo == "Divide Numbers":
+        st.markdown("**ZeroDivisionError Demo:**")
+
+        col_d1, col_d2 = st.columns(2)
+        with col_d1:
+            div_a = st.number_input("Numerator:", value=100, key="div_a")
+        with col_d2:
+            div_b = st.number_input("Denominator:", value=0, key="div_b")
+
+        if st.button("➗ Divide", key="divide_btn"):
+            st.code(f"""try:
+    result = {div_a} / {div_b}
+    print(f"Result: {{result}}")
+except ZeroDivisionError:
+    print("ZeroDivisionError: Cannot divide by zero!")""", language="python")
+
+            try:
+                result = div_a / div_b
+                st.success(f"✅ Result: {result}")
+            except ZeroDivisionError:
+                st.error("❌ ZeroDivisionError: Cannot divide by zero!")
+                st.info("💡 Caught ZeroDivisionError specifically!")
+
+    elif exception_demo == "Access List Item":
+        st.markdown("**IndexError Demo:**")
+
+        demo_list = [10, 20, 30]
+        st.code(f"my_list = {demo_list}", language="python")
+
+        index_input = st.number_input("Enter index:", value=5, min_value=-10, max_value=10, key="index_input")
+
+        if st.button("🔍 Access", key="access_btn"):
+            st.code(f"""try:
+    value = my_list[{int(index_input)}]
+    print(f"Value: {{value}}")
+except IndexError:
+    print("IndexError: Index out of range!")""", language="python")
+
+            try:
+                value = demo_list[int(index_input)]
+                st.success(f"✅ Value: {value}")
+            except IndexError:
+                st.error(f"❌ IndexError: Index {int(index_input)} out of range!")
+                st.info(f"💡 Valid range: 0 to {len(demo_list)-1}")
+
+    else:  # Get Dict Value
+        st.markdown("**KeyError Demo:**")
+
+        demo_dict = {"name": "Alice", "age": 15, "grade": "10th"}
+        st.code(f"student = {demo_dict}", language="python")
+
+        key_input = st.text_input("Enter key:", value="email", key="key_input")
+
+        if st.button("🔑 Get Value", key="getval_btn"):
+            st.code(f"""try:
+    value = student["{key_input}"]
+    print(f"Value: {{value}}")
+except KeyError:
+    print("KeyError: Key not found!")""", language="python")
+
+            try:
+                value = demo_dict[key_input]
+                st.success(f"✅ Value: {value}")
+            except KeyError:
+                st.error(f"❌ KeyError: '{key_input}' not found!")
+                st.info(f"💡 Available keys: {list(demo_dict.keys())}")
+
+@panel
+def multi_except_calculator():
+    """Try-it panel: calculator with multiple except blocks"""
+    col_calc1, col_calc2, col_calc3 = st.columns([2, 1, 2])
+
+    with col_calc1:
+        calc_input1 = st.text_input("First value:", value="10", key="calc1")
+
+    with col_calc2:
+        calc_op = st.selectbox("Operation:", ["+", "-", "*", "/"], key="calc_op")
+
+    with col_calc3:
+        calc_input2 = st.text_input("Second value:", value="0", key="calc2")
+
+    if st.button("🔢 Calculate", key="calc_btn"):
+        st.code(f"""try:
+    a = float("{calc_input1}")
+    b = float("{calc_input2}")
+    
+    if "{calc_op}" == "+":
+        result = a + b
+    elif "{calc_op}" == "-":
+        result = a - b
+    elif "{calc_op}" == "*":
+        result = a * b
+    else:
+        result = a / b
+    
+    print(f"Result: {{result}}")
+    
+except ValueError:
+    print("ValueError: Invalid number format!")
+except ZeroDivisionError:
+    print("ZeroDivisionError: Cannot divide by zero!")
+except Exception as e:
+    print(f"Unexpected error: {{e}}")""", language="python")
+
+        try:
+            a = float(calc_input1)
+            b = float(calc_input2)
+
+            if calc_op == "+":
+                result = a + b
+            elif calc_op == "-":
+                result = a - b
+            elif calc_op == "*":
+                result = a * b
+            else:
+                result = a / b
+
+            st.success(f"✅ Result: {result}")
+
+        except ValueError as e:
+            st.error(f"❌ ValueError: Invalid number format!")
+            st.warning(f"Make sure both inputs are numbers")
+
+        except ZeroDivisionError:
+            st.error(f"❌ ZeroDivisionError: Cannot divide by zero!")
+            st.warning("Change the second number to non-zero")
+
+        except Exception as e:
+            st.error(f"❌ Unexpected error: {e}")
+
+@panel
+def complete_structure_panel():
+    """Try-it panel: try, except, else and finally"""
+    complete_input = st.text_input("Enter a number:", value="42", key="complete_input")
+
+    if st.button("🔍 Process Number", key="complete_btn"):
+        st.code(f"""try:
+    number = int("{complete_input}")
+    print(f"Converted: {{number}}")
+except ValueError:
+    print("Error: Not a valid number!")
+else:
+    print("Success: No errors occurred!")
+    squared = number ** 2
+    print(f"Squared: {{squared}}")
+finally:
+    print("Finally: This always runs!")""", language="python")
+
+        st.markdown("---")
+        st.markdown("#### 📊 Execution Log:")
+
+        log_msgs = []
+
+        # Try block
+        st.info("🔷 **Try Block:** Attempting conversion...")
+        log_msgs.append("Try: Attempting conversion...")
+
+        try:
+            number = int(complete_input)
+            st.success(f"✅ Converted: {number}")
+            log_msgs.append(f"Try: Successfully converted to {number}")
+            error_occurred = False
+
+        except ValueError:
+            st.error(f"❌ Error: '{complete_input}' is not a valid number!")
+            log_msgs.append(f"Except: ValueError caught")
+            error_occurred = True
+
+        else:
+            if not error_occurred:
+                st.success("✅ **Else Block:** No errors, continuing...")
+                squared = number ** 2
+                st.info(f"Squared: {squared}")
+                log_msgs.append(f"Else: Calculated {number}² = {squared}")
+
+        # Finally block
+        st.warning("⚠️ **Finally Block:** This always runs!")
+        log_msgs.append("Finally: Cleanup complete")
+
+        st.markdown("---")
+        st.code("\n".join(log_msgs), language="text")
+
+@panel
+def real_world_examples():
+    """Try-it panel: real-world try-except examples"""
+    example_choice = st.selectbox("Choose example:", 
+                                 ["Age Input Validator", "List Access Safety", "Dictionary Lookup", "Number Converter"],
+                                 key="example_choice")
+
+    if example_choice == "Age Input Validator":
+        st.markdown("#### 🎂 Age Input Validator")
+
+        age_input = st.text_input("Enter your age:", value="15", key="age_val_input")
+
+        if st.button("✅ Validate Age", key="validate_age_btn"):
+            st.code(f"""try:
+    age = int("{age_input}")
+    
+    if age < 0:
+        print("Error: Age cannot be negative!")
+    elif age > 150:
+        print("Error: Age seems unrealistic!")
+    else:
+        print(f"Valid age: {{age}}")
+        
+except ValueError:
+    print("Error: Please enter a number!")""", language="python")
+
+            try:
+                age = int(age_input)
+
+                if age < 0:
+                    st.error("❌ Error: Age cannot be negative!")
+                elif age > 150:
+                    st.error("❌ Error: Age seems unrealistic!")
+                else:
+                    st.success(f"✅ Valid age: {age}")
+
+                    # Age category
+                    if age < 13:
+                        category = "Child"
+                    elif age < 20:
+                        category = "Teenager"
+                    elif age < 65:
+                        category = "Adult"
+                    else:
+                        category = "Senior"
+
+                    st.info(f"Category: {category}")
+
+            except ValueError:
+                st.error("❌ Error: Please enter a valid number!")
+
+    elif example_choice == "List Access Safety":
+        st.markdown("#### 📚 Safe List Access")
+
+        demo_list = ["Python", "Java", "C++", "JavaScript"]
+        st.code(f"languages = {demo_list}", language="python")
+
+        list_index = st.number_input("Enter index:", value=0, min_value=-10, max_value=10, key="list_safe_index")
+
+        if st.button("🔍 Get Language", key="get_lang_btn"):
+            st.code(f"""try:
+    language = languages[{int(list_index)}]
+    print(f"Language: {{language}}")
+except IndexError:
+    print("Error: Index out of range!")
+    print(f"Valid range: 0 to {{len(languages)-1}}")""", language="python")
+
+            try:
+                language = demo_list[int(list_index)]
+                st.success(f"✅ Language: {language}")
+                st.info(f"Position: {int(list_index) + 1} of {len(demo_list)}")
+            except IndexError:
+                st.error(f"❌ Error: Index {int(list_index)} is out of range!")
+                st.warning(f"Valid range: 0 to {len(demo_list)-1}")
+
+    elif example_choice == "Dictionary Lookup":
+        st.markdown("#### 📖 Safe Dictionary Lookup")
+
+        grades = {"Alice": 95, "Bob": 87, "Charlie": 92}
+        st.code(f"grades = {grades}", language="python")
+
+        student_name = st.text_input("Enter student name:", value="Alice", key="student_lookup")
+
+        if st.button("🔍 Get Grade", key="get_grade_btn"):
+            st.code(f"""try:
+    grade = grades["{student_name}"]
+    print(f"{{"{student_name}"}}'s grade: {{grade}}")
+except KeyError:
+    print("Error: Student not found!")
+    print(f"Available students: {{list(grades.keys())}}")""", language="python")
+
+            try:
+                grade = grades[student_name]
+                st.success(f"✅ {student_name}'s grade: {grade}")
+
+                if grade >= 90:
+                    letter = "A"
+                elif grade >= 80:
+                    letter = "B"
+                elif grade >= 70:
+                    letter = "C"
+                else:
+                    letter = "D"
+
+                st.info(f"Letter grade: {letter}")
+
+            except KeyError:
+                st.error(f"❌ Error: '{student_name}' not found!")
+                st.warning(f"Available students: {list(grades.keys())}")
+
+    else:  # Number Converter
+        st.markdown("#### 🔢 Multi-Format Number Converter")
+
+        num_input = st.text_input("Enter value:", value="42", key="num_convert")
+
+        if st.button("🔄 Convert", key="num_convert_btn"):
+            st.code(f"""value = "{num_input}"
+
+# Try multiple conversions
+try:
+    # Try integer first
+    num = int(value)
+    print(f"Integer: {{num}}")
+except ValueError:
+    try:
+        # Try float
+        num = float(value)
+        print(f"Float: {{num}}")
+    except ValueError:
+        print("Error: Not a valid number!")
+        num = None
+
+if num is not None:
+    print(f"Doubled: {{num * 2}}")""", language="python")
+
+            try:
+                # Try integer first
+                num = int(num_input)
+                st.success(f"✅ Integer: {num}")
+                st.info(f"Type: {type(num).__name__}")
+                st.info(f"Doubled: {num * 2}")
+
+            except ValueError:
+                try:
+                    # Try float
+                    num = float(num_input)
+                    st.success(f"✅ Float: {num}")
+                    st.info(f"Type: {type(num).__name__}")
+                    st.info(f"Doubled: {num * 2}")
+
+                except ValueError:
+                    st.error(f"❌ Error: '{num_input}' is not a valid number!")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">🛡️ Exception Handling (Try-Except)</h2>', unsafe_allow_html=True)
     st.write("Learn how to handle errors gracefully in your programs!")
@@ -69,47 +503,7 @@ def show():
         st.markdown("---")
         st.markdown("#### 🎮 Try It: Division by Zero")
         
-        col_div1, col_div2 = st.columns(2)
-        
-        with col_div1:
-            numerator = st.number_input("Numerator:", value=10, key="num_basic")
-        
-        with col_div2:
-            denominator = st.number_input("Denominator:", value=0, key="denom_basic")
-        
-        col_demo1, col_demo2 = st.columns(2)
-        
-        with col_demo1:
-            st.markdown("**❌ Without Try-Except:**")
-            if st.button("Run (Will Crash!)", key="no_try_btn"):
-                st.code(f"""result = {numerator} / {denominator}
-print(result)""", language="python")
-                
-                if denominator == 0:
-                    st.error("""
-                    💥 **ZeroDivisionError:**
-                    division by zero
-                    
-                    ❌ Program crashed!
-                    """)
-                else:
-                    result = numerator / denominator
-                    st.success(f"Result: {result}")
-        
-        with col_demo2:
-            st.markdown("**✅ With Try-Except:**")
-            if st.button("Run (Safe!)", key="with_try_btn"):
-                st.code(f"""try:
-    result = {numerator} / {denominator}
-    print(result)
-except:
-    print("Cannot divide by zero!")""", language="python")
-                
-                try:
-                    result = numerator / denominator
-                    st.success(f"✅ Result: {result}")
-                except:
-                    st.warning("⚠️ Cannot divide by zero!\n\n✅ Program still running!")
+        division_panel()
         
         st.markdown("---")
         st.markdown("#### 🔄 Execution Flow")
@@ -136,28 +530,7 @@ except:
         st.markdown("---")
         st.markdown("#### 🎯 Interactive Example")
         
-        user_input = st.text_input("Enter a number:", value="42", key="basic_input")
-        
-        if st.button("🔍 Convert to Integer", key="convert_int_btn"):
-            col_flow1, col_flow2 = st.columns(2)
-            
-            with col_flow1:
-                st.markdown("**Code:**")
-                st.code(f"""try:
-    number = int("{user_input}")
-    print(f"Success! {{number}}")
-except:
-    print("That's not a number!")""", language="python")
-            
-            with col_flow2:
-                st.markdown("**Result:**")
-                try:
-                    number = int(user_input)
-                    st.success(f"✅ Success! {number}")
-                    st.info(f"Type: {type(number).__name__}")
-                except:
-                    st.error(f'❌ "{user_input}" is not a valid number!')
-                    st.warning("⚠️ Handled error gracefully!")
+        convert_int_panel()
     
     # ============================================
     # TAB 2: SPECIFIC EXCEPTIONS
@@ -187,95 +560,7 @@ except:
         st.markdown("---")
         st.markdown("#### 🎮 Try Different Exception Types")
         
-        exception_demo = st.radio("Choose operation:", 
-                                  ["Convert to Integer", "Divide Numbers", "Access List Item", "Get Dict Value"],
-                                  key="exception_demo")
-        
-        if exception_demo == "Convert to Integer":
-            st.markdown("**ValueError Demo:**")
-            
-            convert_input = st.text_input("Enter value:", value="hello", key="convert_input")
-            
-            if st.button("🔄 Convert", key="convert_btn"):
-                st.code(f"""try:
-    number = int("{convert_input}")
-    print(f"Converted: {{number}}")
-except ValueError:
-    print("ValueError: Cannot convert to integer!")""", language="python")
-                
-                try:
-                    number = int(convert_input)
-                    st.success(f"✅ Converted: {number}")
-                except ValueError:
-                    st.error("❌ ValueError: Cannot convert to integer!")
-                    st.info("💡 Caught ValueError specifically!")
-        
-        elif exception_demo == "Divide Numbers":
-            st.markdown("**ZeroDivisionError Demo:**")
-            
-            col_d1, col_d2 = st.columns(2)
-            with col_d1:
-                div_a = st.number_input("Numerator:", value=100, key="div_a")
-            with col_d2:
-                div_b = st.number_input("Denominator:", value=0, key="div_b")
-            
-            if st.button("➗ Divide", key="divide_btn"):
-                st.code(f"""try:
-    result = {div_a} / {div_b}
-    print(f"Result: {{result}}")
-except ZeroDivisionError:
-    print("ZeroDivisionError: Cannot divide by zero!")""", language="python")
-                
-                try:
-                    result = div_a / div_b
-                    st.success(f"✅ Result: {result}")
-                except ZeroDivisionError:
-                    st.error("❌ ZeroDivisionError: Cannot divide by zero!")
-                    st.info("💡 Caught ZeroDivisionError specifically!")
-        
-        elif exception_demo == "Access List Item":
-            st.markdown("**IndexError Demo:**")
-            
-            demo_list = [10, 20, 30]
-            st.code(f"my_list = {demo_list}", language="python")
-            
-            index_input = st.number_input("Enter index:", value=5, min_value=-10, max_value=10, key="index_input")
-            
-            if st.button("🔍 Access", key="access_btn"):
-                st.code(f"""try:
-    value = my_list[{int(index_input)}]
-    print(f"Value: {{value}}")
-except IndexError:
-    print("IndexError: Index out of range!")""", language="python")
-                
-                try:
-                    value = demo_list[int(index_input)]
-                    st.success(f"✅ Value: {value}")
-                except IndexError:
-                    st.error(f"❌ IndexError: Index {int(index_input)} out of range!")
-                    st.info(f"💡 Valid range: 0 to {len(demo_list)-1}")
-        
-        else:  # Get Dict Value
-            st.markdown("**KeyError Demo:**")
-            
-            demo_dict = {"name": "Alice", "age": 15, "grade": "10th"}
-            st.code(f"student = {demo_dict}", language="python")
-            
-            key_input = st.text_input("Enter key:", value="email", key="key_input")
-            
-            if st.button("🔑 Get Value", key="getval_btn"):
-                st.code(f"""try:
-    value = student["{key_input}"]
-    print(f"Value: {{value}}")
-except KeyError:
-    print("KeyError: Key not found!")""", language="python")
-                
-                try:
-                    value = demo_dict[key_input]
-                    st.success(f"✅ Value: {value}")
-                except KeyError:
-                    st.error(f"❌ KeyError: '{key_input}' not found!")
-                    st.info(f"💡 Available keys: {list(demo_dict.keys())}")
+        exception_types_panel()
     
     # ============================================
     # TAB 3: MULTIPLE EXCEPT
@@ -310,65 +595,7 @@ except KeyError:
         st.markdown("---")
         st.markdown("#### 🎮 Calculator with Multiple Exceptions")
         
-        col_calc1, col_calc2, col_calc3 = st.columns([2, 1, 2])
-        
-        with col_calc1:
-            calc_input1 = st.text_input("First value:", value="10", key="calc1")
-        
-        with col_calc2:
-            calc_op = st.selectbox("Operation:", ["+", "-", "*", "/"], key="calc_op")
-        
-        with col_calc3:
-            calc_input2 = st.text_input("Second value:", value="0", key="calc2")
-        
-        if st.button("🔢 Calculate", key="calc_btn"):
-            st.code(f"""try:
-    a = float("{calc_input1}")
-    b = float("{calc_input2}")
-    
-    if "{calc_op}" == "+":
-        result = a + b
-    elif "{calc_op}" == "-":
-        result = a - b
-    elif "{calc_op}" == "*":
-        result = a * b
-    else:
-        result = a / b
-    
-    print(f"Result: {{result}}")
-    
-except ValueError:
-    print("ValueError: Invalid number format!")
-except ZeroDivisionError:
-    print("ZeroDivisionError: Cannot divide by zero!")
-except Exception as e:
-    print(f"Unexpected error: {{e}}")""", language="python")
-            
-            try:
-                a = float(calc_input1)
-                b = float(calc_input2)
-                
-                if calc_op == "+":
-                    result = a + b
-                elif calc_op == "-":
-                    result = a - b
-                elif calc_op == "*":
-                    result = a * b
-                else:
-                    result = a / b
-                
-                st.success(f"✅ Result: {result}")
-                
-            except ValueError as e:
-                st.error(f"❌ ValueError: Invalid number format!")
-                st.warning(f"Make sure both inputs are numbers")
-                
-            except ZeroDivisionError:
-                st.error(f"❌ ZeroDivisionError: Cannot divide by zero!")
-                st.warning("Change the second number to non-zero")
-                
-            except Exception as e:
-                st.error(f"❌ Unexpected error: {e}")
+        multi_except_calculator()
         
         st.markdown("---")
         st.markdown("#### 📊 Error Flow Diagram")
@@ -425,54 +652,7 @@ Continue Program
         st.markdown("---")
         st.markdown("#### 🎮 Try the Complete Structure")
         
-        complete_input = st.text_input("Enter a number:", value="42", key="complete_input")
-        
-        if st.button("🔍 Process Number", key="complete_btn"):
-            st.code(f"""try:
-    number = int("{complete_input}")
-    print(f"Converted: {{number}}")
-except ValueError:
-    print("Error: Not a valid number!")
-else:
-    print("Success: No errors occurred!")
-    squared = number ** 2
-    print(f"Squared: {{squared}}")
-finally:
-    print("Finally: This always runs!")""", language="python")
-            
-            st.markdown("---")
-            st.markdown("#### 📊 Execution Log:")
-            
-            log_msgs = []
-            
-            # Try block
-            st.info("🔷 **Try Block:** Attempting conversion...")
-            log_msgs.append("Try: Attempting conversion...")
-            
-            try:
-                number = int(complete_input)
-                st.success(f"✅ Converted: {number}")
-                log_msgs.append(f"Try: Successfully converted to {number}")
-                error_occurred = False
-                
-            except ValueError:
-                st.error(f"❌ Error: '{complete_input}' is not a valid number!")
-                log_msgs.append(f"Except: ValueError caught")
-                error_occurred = True
-            
-            else:
-                if not error_occurred:
-                    st.success("✅ **Else Block:** No errors, continuing...")
-                    squared = number ** 2
-                    st.info(f"Squared: {squared}")
-                    log_msgs.append(f"Else: Calculated {number}² = {squared}")
-            
-            # Finally block
-            st.warning("⚠️ **Finally Block:** This always runs!")
-            log_msgs.append("Finally: Cleanup complete")
-            
-            st.markdown("---")
-            st.code("\n".join(log_msgs), language="text")
+        complete_structure_panel()
         
         st.markdown("---")
         st.markdown("#### 📁 File Handling Example")
@@ -507,155 +687,7 @@ finally:
     with tabs[4]:
         st.markdown("### 💡 Real-World Examples")
         
-        example_choice = st.selectbox("Choose example:", 
-                                     ["Age Input Validator", "List Access Safety", "Dictionary Lookup", "Number Converter"],
-                                     key="example_choice")
-        
-        if example_choice == "Age Input Validator":
-            st.markdown("#### 🎂 Age Input Validator")
-            
-            age_input = st.text_input("Enter your age:", value="15", key="age_val_input")
-            
-            if st.button("✅ Validate Age", key="validate_age_btn"):
-                st.code(f"""try:
-    age = int("{age_input}")
-    
-    if age < 0:
-        print("Error: Age cannot be negative!")
-    elif age > 150:
-        print("Error: Age seems unrealistic!")
-    else:
-        print(f"Valid age: {{age}}")
-        
-except ValueError:
-    print("Error: Please enter a number!")""", language="python")
-                
-                try:
-                    age = int(age_input)
-                    
-                    if age < 0:
-                        st.error("❌ Error: Age cannot be negative!")
-                    elif age > 150:
-                        st.error("❌ Error: Age seems unrealistic!")
-                    else:
-                        st.success(f"✅ Valid age: {age}")
-                        
-                        # Age category
-                        if age < 13:
-                            category = "Child"
-                        elif age < 20:
-                            category = "Teenager"
-                        elif age < 65:
-                            category = "Adult"
-                        else:
-                            category = "Senior"
-                        
-                        st.info(f"Category: {category}")
-                
-                except ValueError:
-                    st.error("❌ Error: Please enter a valid number!")
-        
-        elif example_choice == "List Access Safety":
-            st.markdown("#### 📚 Safe List Access")
-            
-            demo_list = ["Python", "Java", "C++", "JavaScript"]
-            st.code(f"languages = {demo_list}", language="python")
-            
-            list_index = st.number_input("Enter index:", value=0, min_value=-10, max_value=10, key="list_safe_index")
-            
-            if st.button("🔍 Get Language", key="get_lang_btn"):
-                st.code(f"""try:
-    language = languages[{int(list_index)}]
-    print(f"Language: {{language}}")
-except IndexError:
-    print("Error: Index out of range!")
-    print(f"Valid range: 0 to {{len(languages)-1}}")""", language="python")
-                
-                try:
-                    language = demo_list[int(list_index)]
-                    st.success(f"✅ Language: {language}")
-                    st.info(f"Position: {int(list_index) + 1} of {len(demo_list)}")
-                except IndexError:
-                    st.error(f"❌ Error: Index {int(list_index)} is out of range!")
-                    st.warning(f"Valid range: 0 to {len(demo_list)-1}")
-        
-        elif example_choice == "Dictionary Lookup":
-            st.markdown("#### 📖 Safe Dictionary Lookup")
-            
-            grades = {"Alice": 95, "Bob": 87, "Charlie": 92}
-            st.code(f"grades = {grades}", language="python")
-            
-            student_name = st.text_input("Enter student name:", value="Alice", key="student_lookup")
-            
-            if st.button("🔍 Get Grade", key="get_grade_btn"):
-                st.code(f"""try:
-    grade = grades["{student_name}"]
-    print(f"{{"{student_name}"}}'s grade: {{grade}}")
-except KeyError:
-    print("Error: Student not found!")
-    print(f"Available students: {{list(grades.keys())}}")""", language="python")
-                
-                try:
-                    grade = grades[student_name]
-                    st.success(f"✅ {student_name}'s grade: {grade}")
-                    
-                    if grade >= 90:
-                        letter = "A"
-                    elif grade >= 80:
-                        letter = "B"
-                    elif grade >= 70:
-                        letter = "C"
-                    else:
-                        letter = "D"
-                    
-                    st.info(f"Letter grade: {letter}")
-                    
-                except KeyError:
-                    st.error(f"❌ Error: '{student_name}' not found!")
-                    st.warning(f"Available students: {list(grades.keys())}")
-        
-        else:  # Number Converter
-            st.markdown("#### 🔢 Multi-Format Number Converter")
-            
-            num_input = st.text_input("Enter value:", value="42", key="num_convert")
-            
-            if st.button("🔄 Convert", key="num_convert_btn"):
-                st.code(f"""value = "{num_input}"
-
-# Try multiple conversions
-try:
-    # Try integer first
-    num = int(value)
-    print(f"Integer: {{num}}")
-except ValueError:
-    try:
-        # Try float
-        num = float(value)
-        print(f"Float: {{num}}")
-    except ValueError:
-        print("Error: Not a valid number!")
-        num = None
-
-if num is not None:
-    print(f"Doubled: {{num * 2}}")""", language="python")
-                
-                try:
-                    # Try integer first
-                    num = int(num_input)
-                    st.success(f"✅ Integer: {num}")
-                    st.info(f"Type: {type(num).__name__}")
-                    st.info(f"Doubled: {num * 2}")
-                    
-                except ValueError:
-                    try:
-                        # Try float
-                        num = float(num_input)
-                        st.success(f"✅ Float: {num}")
-                        st.info(f"Type: {type(num).__name__}")
-                        st.info(f"Doubled: {num * 2}")
-                        
-                    except ValueError:
-                        st.error(f"❌ Error: '{num_input}' is not a valid number!")
+        real_world_examples()
     
     # Key takeaways
     st.markdown("---")
@@ -6,6 +6,15 @@ Shows how function local scope differs from global scope
 import streamlit as st
 import time
 
+from visualizations.core.cards import banner_card, card, card_frame, card_stack, scope_card
+from visualizations.core.session_limits import manage
+
+# Per-student session state kept in check by the session manager
+manage('call_history', cap=100)
+manage('global_vars')
+manage('local_vars')
+manage('function_active')
+
 def show_function_scope_visualization():
     """Main function to display the function scope visualization"""
     
@@ -74,7 +83,8 @@ def add(a, b):
                     
                     # Add to history
                     st.session_state.call_history.append({
-                        'call_num': len(st.session_state.call_history) + 1,
+                        # Oldest calls may have been dropped, so count on from the last one
+                        'call_num': st.session_state.call_history[-1]['call_num'] + 1 if st.session_state.call_history else 1,
                         'a': a_val,
                         'b': b_val,
                         'result': a_val + b_val
@@ -97,24 +107,11 @@ def add(a, b):
         # Global Memory
         st.markdown("#### 🌍 Global Memory (Outside Function)")
         if st.session_state.global_vars:
-            for var_name, var_value in st.session_state.global_vars.items():
-                # Different colors for different variables
-                color = '#4CAF50' if var_name in ['a', 'b'] else '#FF9800'
-                
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, {color}22 0%, {color}44 100%);
-                    border-left: 5px solid {color};
-                    padding: 1rem;
-                    border-radius: 8px;
-                    margin: 0.5rem 0;
-                ">
-                    <div style="display: flex; justify-content: space-between;">
-                        <span style="font-weight: bold; font-size: 1.2rem;">{var_name}</span>
-                        <span style="font-size: 1.2rem; color: {color};">{var_value}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Different colors for different variables
+            card_stack([
+                scope_card(var_name, var_value, '#4CAF50' if var_name in ['a', 'b'] else '#FF9800')
+                for var_name, var_value in st.session_state.global_vars.items()
+            ])
         else:
             st.info("👈 No global variables yet. Set them in the controls!")
         
@@ -124,59 +121,17 @@ def add(a, b):
         st.markdown("#### 🔒 Function Local Memory (Inside add function)")
         
         if st.session_state.function_active and st.session_state.local_vars:
-            st.markdown("""
-            <div style="
-                border: 3px dashed #2196F3;
-                padding: 1.5rem;
-                border-radius: 12px;
-                background: #E3F2FD;
-            ">
-            """, unsafe_allow_html=True)
-            
-            st.markdown('<p style="color: #1976D2; font-weight: bold; margin-bottom: 1rem;">⚡ Function is executing...</p>', unsafe_allow_html=True)
-            
+            local_cards = []
             for var_name, var_value in st.session_state.local_vars.items():
                 # Different styling for parameters vs local vars
                 if var_name in ['a', 'b']:
-                    badge = "📥 Parameter"
-                    color = '#2196F3'
+                    local_cards.append(scope_card(var_name, var_value, '#2196F3', "📥 Parameter", local=True))
                 else:
-                    badge = "📦 Local Variable"
-                    color = '#9C27B0'
-                
-                st.markdown(f"""
-                <div style="
-                    background: white;
-                    border-left: 5px solid {color};
-                    padding: 1rem;
-                    border-radius: 8px;
-                    margin: 0.5rem 0;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                ">
-                    <div style="font-size: 0.8rem; color: #666; margin-bottom: 0.3rem;">{badge}</div>
-                    <div style="display: flex; justify-content: space-between;">
-                        <span style="font-weight: bold; font-size: 1.2rem;">{var_name}</span>
-                        <span style="font-size: 1.2rem; color: {color};">{var_value}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                    local_cards.append(scope_card(var_name, var_value, '#9C27B0', "📦 Local Variable", local=True))
             
-            st.markdown("</div>", unsafe_allow_html=True)
+            card_frame("⚡ Function is executing...", local_cards)
             
-            st.markdown(f"""
-            <div style="
-                background: #4CAF50;
-                color: white;
-                padding: 1rem;
-                border-radius: 8px;
-                margin-top: 1rem;
-                text-align: center;
-                font-size: 1.2rem;
-                font-weight: bold;
-            ">
-                🎯 Return value: {st.session_state.local_vars['c']}
-            </div>
-            """, unsafe_allow_html=True)
+            card(banner_card(f"🎯 Return value: {st.session_state.local_vars['c']}", '#4CAF50'))
             
         else:
             st.info("📭 Function not active. Call the function to see local memory!")
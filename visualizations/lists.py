@@ -1,6 +1,151 @@
 import streamlit as st
 import json
 
+from visualizations.core.cards import card_row, item_card
+from visualizations.core.fragments import panel
+from visualizations.core.list_history import ListHistory
+from visualizations.core.session_limits import manage
+from visualizations.core.value_parser import ValueTooLarge, parse, parse_items
+
+# Per-student session state kept in check by the session manager; the
+# history bounds itself
+manage('my_list', cap=500)
+manage('list_history')
+
+DEFAULT_LIST = ["apple", "banana", "orange"]
+
+def edit_list(code, start, stop, items):
+    """my_list[start:stop] = items, recorded on the undo timeline as code"""
+    st.session_state.list_history.splice(st.session_state.my_list, code, start, stop, items)
+
+def _timeline_moved():
+    # Callbacks run before a compacted session is unpacked, so only note the
+    # move here and let history_controls() do the seeking
+    st.session_state.list_timeline_moved = True
+
+def history_controls():
+    """Undo/redo buttons and a timeline to scrub through earlier versions of the list"""
+    history = st.session_state.list_history
+    my_list = st.session_state.my_list
+    history.sync(my_list)
+    if st.session_state.pop('list_timeline_moved', False):
+        history.seek(my_list, min(st.session_state.list_timeline, len(history)))
+    if not len(history):
+        return
+
+    # Drawn above the list, so the list below already shows where the timeline is
+    col_undo, col_redo, col_timeline = st.columns([1, 1, 4])
+    with col_undo:
+        if st.button("⏪ Undo", use_container_width=True) and history.undo(my_list) is None:
+            st.toast("Nothing left to undo")
+    with col_redo:
+        if st.button("⏩ Redo", use_container_width=True) and history.redo(my_list) is None:
+            st.toast("Nothing left to redo")
+    with col_timeline:
+        # Set before the slider is drawn, so it follows undo/redo and new edits too
+        st.session_state.list_timeline = history.position
+        st.select_slider(
+            "Timeline",
+            options=list(range(len(history) + 1)),
+            format_func=history.label,
+            key="list_timeline",
+            on_change=_timeline_moved,
+            label_visibility="collapsed"
+        )
+    st.caption(f"Step {history.position} of {len(history)} - the history keeps only what each "
+               f"step changed ({history.items} items), not a copy of the list per step")
+
+@panel
+def access_items_panel():
+    """Try-it panel: indexing and slicing the list"""
+    if len(st.session_state.my_list) == 0:
+        st.warning("⚠️ List is empty! Add items first.")
+    else:
+        st.info("""
+        **Indexing** - Access items by their position (index)
+        - Indexes start at **0** (first item)
+        - Negative indexes count from the end
+        - `list[0]` gets first item
+        - `list[-1]` gets last item
+        """)
+
+        # Show positive and negative indexes
+        col_idx1, col_idx2 = st.columns(2)
+
+        with col_idx1:
+            st.markdown("#### Positive Indexes (from start)")
+            for i, item in enumerate(st.session_state.my_list):
+                st.code(f"my_list[{i}] = {repr(item)}", language="python")
+
+        with col_idx2:
+            st.markdown("#### Negative Indexes (from end)")
+            for i, item in enumerate(st.session_state.my_list):
+                neg_idx = i - len(st.session_state.my_list)
+                st.code(f"my_list[{neg_idx}] = {repr(item)}", language="python")
+
+        st.markdown("---")
+        st.markdown("#### 🎯 Try Accessing an Item")
+
+        col_acc1, col_acc2 = st.columns([3, 1])
+        with col_acc1:
+            access_index = st.number_input("Index to access", min_value=-len(st.session_state.my_list), max_value=len(st.session_state.my_list)-1, value=0, key="access_index")
+        with col_acc2:
+            st.write("")
+            access_btn = st.button("🔍 Access", use_container_width=True)
+
+        if access_btn or access_index is not None:
+            try:
+                accessed_item = st.session_state.my_list[int(access_index)]
+                st.success(f"✅ `my_list[{int(access_index)}]` = {repr(accessed_item)}")
+                st.code(f"item = my_list[{int(access_index)}]\nprint(item)  # {repr(accessed_item)}", language="python")
+            except IndexError:
+                st.error(f"❌ Index {int(access_index)} is out of range!")
+
+        # Slicing
+        st.markdown("---")
+        st.markdown("#### ✂️ List Slicing - Get Multiple Items")
+
+        st.info("""
+        **Slicing** - Get a portion of the list
+        - `list[start:end]` - from start to end-1
+        - `list[:3]` - first 3 items
+        - `list[2:]` - from index 2 to end
+        - `list[-3:]` - last 3 items
+        """)
+
+        col_slice1, col_slice2, col_slice3 = st.columns([2, 2, 1])
+        with col_slice1:
+            slice_start = st.number_input("Start index", min_value=0, max_value=len(st.session_state.my_list), value=0, key="slice_start")
+        with col_slice2:
+            slice_end = st.number_input("End index", min_value=0, max_value=len(st.session_state.my_list), value=len(st.session_state.my_list), key="slice_end")
+        with col_slice3:
+            st.write("")
+            slice_btn = st.button("✂️ Slice", use_container_width=True)
+
+        if slice_btn or (slice_start is not None and slice_end is not None):
+            sliced = st.session_state.my_list[int(slice_start):int(slice_end)]
+            st.success(f"✅ `my_list[{int(slice_start)}:{int(slice_end)}]` = {sliced}")
+            st.code(f"sliced = my_list[{int(slice_start)}:{int(slice_end)}]\nprint(sliced)  # {sliced}", language="python")
+
+@panel
+def membership_panel():
+    """Try-it panel: check if a value is in the list"""
+    check_value = st.text_input("Check if value exists:", key="check_value")
+    if check_value:
+        try:
+            check_val, _ = parse(check_value)
+        except ValueTooLarge as error:
+            st.error(f"❌ {error}")
+            return
+
+        exists = check_val in st.session_state.my_list
+        if exists:
+            st.success(f"✅ '{check_val}' is IN the list!")
+        else:
+            st.error(f"❌ '{check_val}' is NOT in the list!")
+
+        st.code(f"{repr(check_val)} in my_list  # {exists}", language="python")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">📚 Python Lists Explorer</h2>', unsafe_allow_html=True)
     st.write("Learn how to store and manage multiple values in a list!")
@@ -33,52 +178,24 @@ def show():
     
     # Initialize session state for the interactive list
     if 'my_list' not in st.session_state:
-        st.session_state.my_list = ["apple", "banana", "orange"]
+        st.session_state.my_list = list(DEFAULT_LIST)
     
-    if 'list_history' not in st.session_state:
-        st.session_state.list_history = []
+    if not isinstance(st.session_state.get('list_history'), ListHistory):
+        st.session_state.list_history = ListHistory()
     
     # Main visualization
     st.markdown("### 🎮 Interactive List Builder")
     
+    history_controls()
+    
     # Display current list
     st.markdown("#### Current List:")
     
     if len(st.session_state.my_list) == 0:
         st.info("📭 List is empty! Add some items below.")
     else:
-        # Visual representation of the list
-        cols = st.columns(len(st.session_state.my_list))
-        
-        for i, item in enumerate(st.session_state.my_list):
-            with cols[i]:
-                # Determine color based on type
-                item_type = type(item).__name__
-                if isinstance(item, int):
-                    color = "blue"
-                elif isinstance(item, str):
-                    color = "green"
-                elif isinstance(item, float):
-                    color = "orange"
-                elif isinstance(item, bool):
-                    color = "red"
-                else:
-                    color = "gray"
-                
-                st.markdown(f"""
-                <div style='
-                    border: 2px solid #{color if color != "green" else "4CAF50"};
-                    border-radius: 10px;
-                    padding: 10px;
-                    margin: 5px;
-                    text-align: center;
-                    background-color: rgba(33, 150, 243, 0.1);
-                '>
-                    <div style='font-size: 0.8rem; color: #666;'>Index: {i}</div>
-                    <div style='font-size: 1.2rem; font-weight: bold; color: #333; margin: 5px 0;'>{item}</div>
-                    <div style='font-size: 0.7rem; color: #999;'>({item_type})</div>
-                </div>
-                """, unsafe_allow_html=True)
+        # Visual representation of the list, colored by type
+        card_row([item_card(f"Index: {i}", item) for i, item in enumerate(st.session_state.my_list)])
     
     # Show Python code representation
     st.code(f"my_list = {st.session_state.my_list}", language="python")
@@ -119,24 +236,17 @@ def show():
                 append_btn = st.button("➕ Append", use_container_width=True)
             
             if append_btn and append_item:
-                # Try to convert to number if possible
                 try:
-                    if '.' in append_item:
-                        item_to_add = float(append_item)
-                    else:
-                        item_to_add = int(append_item)
-                except:
-                    if append_item == "True":
-                        item_to_add = True
-                    elif append_item == "False":
-                        item_to_add = False
-                    else:
-                        item_to_add = append_item
-                
-                st.session_state.my_list.append(item_to_add)
-                st.success(f"✅ Added '{item_to_add}' to end of list!")
-                st.code(f"my_list.append({repr(item_to_add)})\n# Result: {st.session_state.my_list}", language="python")
-                st.rerun()
+                    # Read it the way Python reads a literal: 42 is an int, 'hi' and hi are both str
+                    item_to_add, _ = parse(append_item)
+                except ValueTooLarge as error:
+                    st.error(f"❌ {error}")
+                else:
+                    end = len(st.session_state.my_list)
+                    edit_list(f"my_list.append({repr(item_to_add)})", end, end, [item_to_add])
+                    st.success(f"✅ Added '{item_to_add}' to end of list!")
+                    st.code(f"my_list.append({repr(item_to_add)})\n# Result: {st.session_state.my_list}", language="python")
+                    st.rerun()
         
         elif "insert" in add_method:
             st.info("""
@@ -156,22 +266,15 @@ def show():
             
             if insert_btn and insert_item:
                 try:
-                    if '.' in insert_item:
-                        item_to_add = float(insert_item)
-                    else:
-                        item_to_add = int(insert_item)
-                except:
-                    if insert_item == "True":
-                        item_to_add = True
-                    elif insert_item == "False":
-                        item_to_add = False
-                    else:
-                        item_to_add = insert_item
-                
-                st.session_state.my_list.insert(int(insert_index), item_to_add)
-                st.success(f"✅ Inserted '{item_to_add}' at index {insert_index}!")
-                st.code(f"my_list.insert({insert_index}, {repr(item_to_add)})\n# Result: {st.session_state.my_list}", language="python")
-                st.rerun()
+                    item_to_add, _ = parse(insert_item)
+                except ValueTooLarge as error:
+                    st.error(f"❌ {error}")
+                else:
+                    edit_list(f"my_list.insert({insert_index}, {repr(item_to_add)})",
+                              int(insert_index), int(insert_index), [item_to_add])
+                    st.success(f"✅ Inserted '{item_to_add}' at index {insert_index}!")
+                    st.code(f"my_list.insert({insert_index}, {repr(item_to_add)})\n# Result: {st.session_state.my_list}", language="python")
+                    st.rerun()
         
         elif "extend" in add_method:
             st.info("""
@@ -188,11 +291,16 @@ def show():
                 extend_btn = st.button("➕ Extend", use_container_width=True)
             
             if extend_btn and extend_items:
-                items_to_add = [item.strip() for item in extend_items.split(",")]
-                st.session_state.my_list.extend(items_to_add)
-                st.success(f"✅ Added {len(items_to_add)} items to list!")
-                st.code(f"my_list.extend({items_to_add})\n# Result: {st.session_state.my_list}", language="python")
-                st.rerun()
+                try:
+                    items_to_add = parse_items(extend_items)
+                except ValueTooLarge as error:
+                    st.error(f"❌ {error}")
+                else:
+                    end = len(st.session_state.my_list)
+                    edit_list(f"my_list.extend({items_to_add})", end, end, items_to_add)
+                    st.success(f"✅ Added {len(items_to_add)} items to list!")
+                    st.code(f"my_list.extend({items_to_add})\n# Result: {st.session_state.my_list}", language="python")
+                    st.rerun()
     
     # ============================================
     # TAB 2: REMOVE ITEMS
@@ -221,7 +329,8 @@ def show():
                     pop_btn = st.button("🗑️ Pop", use_container_width=True)
                 
                 if pop_btn:
-                    popped_item = st.session_state.my_list.pop(int(pop_index))
+                    popped_item = st.session_state.my_list[int(pop_index)]
+                    edit_list(f"my_list.pop({pop_index})", int(pop_index), int(pop_index) + 1, [])
                     st.success(f"✅ Removed '{popped_item}' from index {pop_index}!")
                     st.code(f"item = my_list.pop({pop_index})\nprint(item)  # {repr(popped_item)}\n# Result: {st.session_state.my_list}", language="python")
                     st.rerun()
@@ -242,7 +351,8 @@ def show():
                     remove_btn = st.button("🗑️ Remove", use_container_width=True)
                 
                 if remove_btn:
-                    st.session_state.my_list.remove(remove_value)
+                    remove_index = st.session_state.my_list.index(remove_value)
+                    edit_list(f"my_list.remove({repr(remove_value)})", remove_index, remove_index + 1, [])
                     st.success(f"✅ Removed '{remove_value}' from list!")
                     st.code(f"my_list.remove({repr(remove_value)})\n# Result: {st.session_state.my_list}", language="python")
                     st.rerun()
@@ -251,13 +361,13 @@ def show():
                 st.warning("""
                 **`clear()`** - Removes **ALL** items from the list
                 - List becomes empty
-                - Cannot be undone!
+                - Cannot be undone in Python! (This page's ⏪ Undo button can bring them back)
                 """)
                 
                 clear_btn = st.button("🗑️ Clear All", type="primary")
                 
                 if clear_btn:
-                    st.session_state.my_list.clear()
+                    edit_list("my_list.clear()", 0, len(st.session_state.my_list), [])
                     st.success("✅ Cleared all items from list!")
                     st.code(f"my_list.clear()\n# Result: {st.session_state.my_list}", language="python")
                     st.rerun()
@@ -268,74 +378,7 @@ def show():
     with op_tabs[2]:
         st.markdown("### 🔍 Access Items in List")
         
-        if len(st.session_state.my_list) == 0:
-            st.warning("⚠️ List is empty! Add items first.")
-        else:
-            st.info("""
-            **Indexing** - Access items by their position (index)
-            - Indexes start at **0** (first item)
-            - Negative indexes count from the end
-            - `list[0]` gets first item
-            - `list[-1]` gets last item
-            """)
-            
-            # Show positive and negative indexes
-            col_idx1, col_idx2 = st.columns(2)
-            
-            with col_idx1:
-                st.markdown("#### Positive Indexes (from start)")
-                for i, item in enumerate(st.session_state.my_list):
-                    st.code(f"my_list[{i}] = {repr(item)}", language="python")
-            
-            with col_idx2:
-                st.markdown("#### Negative Indexes (from end)")
-                for i, item in enumerate(st.session_state.my_list):
-                    neg_idx = i - len(st.session_state.my_list)
-                    st.code(f"my_list[{neg_idx}] = {repr(item)}", language="python")
-            
-            st.markdown("---")
-            st.markdown("#### 🎯 Try Accessing an Item")
-            
-            col_acc1, col_acc2 = st.columns([3, 1])
-            with col_acc1:
-                access_index = st.number_input("Index to access", min_value=-len(st.session_state.my_list), max_value=len(st.session_state.my_list)-1, value=0, key="access_index")
-            with col_acc2:
-                st.write("")
-                access_btn = st.button("🔍 Access", use_container_width=True)
-            
-            if access_btn or access_index is not None:
-                try:
-                    accessed_item = st.session_state.my_list[int(access_index)]
-                    st.success(f"✅ `my_list[{int(access_index)}]` = {repr(accessed_item)}")
-                    st.code(f"item = my_list[{int(access_index)}]\nprint(item)  # {repr(accessed_item)}", language="python")
-                except IndexError:
-                    st.error(f"❌ Index {int(access_index)} is out of range!")
-            
-            # Slicing
-            st.markdown("---")
-            st.markdown("#### ✂️ List Slicing - Get Multiple Items")
-            
-            st.info("""
-            **Slicing** - Get a portion of the list
-            - `list[start:end]` - from start to end-1
-            - `list[:3]` - first 3 items
-            - `list[2:]` - from index 2 to end
-            - `list[-3:]` - last 3 items
-            """)
-            
-            col_slice1, col_slice2, col_slice3 = st.columns([2, 2, 1])
-            with col_slice1:
-                slice_start = st.number_input("Start index", min_value=0, max_value=len(st.session_state.my_list), value=0, key="slice_start")
-            with col_slice2:
-                slice_end = st.number_input("End index", min_value=0, max_value=len(st.session_state.my_list), value=len(st.session_state.my_list), key="slice_end")
-            with col_slice3:
-                st.write("")
-                slice_btn = st.button("✂️ Slice", use_container_width=True)
-            
-            if slice_btn or (slice_start is not None and slice_end is not None):
-                sliced = st.session_state.my_list[int(slice_start):int(slice_end)]
-                st.success(f"✅ `my_list[{int(slice_start)}:{int(slice_end)}]` = {sliced}")
-                st.code(f"sliced = my_list[{int(slice_start)}:{int(slice_end)}]\nprint(sliced)  # {sliced}", language="python")
+        access_items_panel()
     
     # ============================================
     # TAB 4: MODIFY ITEMS
@@ -365,22 +408,15 @@ def show():
                 old_value = st.session_state.my_list[int(modify_index)]
                 
                 try:
-                    if '.' in new_value:
-                        converted_value = float(new_value)
-                    else:
-                        converted_value = int(new_value)
-                except:
-                    if new_value == "True":
-                        converted_value = True
-                    elif new_value == "False":
-                        converted_value = False
-                    else:
-                        converted_value = new_value
-                
-                st.session_state.my_list[int(modify_index)] = converted_value
-                st.success(f"✅ Changed index {int(modify_index)} from '{old_value}' to '{converted_value}'!")
-                st.code(f"my_list[{int(modify_index)}] = {repr(converted_value)}\n# Result: {st.session_state.my_list}", language="python")
-                st.rerun()
+                    converted_value, _ = parse(new_value)
+                except ValueTooLarge as error:
+                    st.error(f"❌ {error}")
+                else:
+                    edit_list(f"my_list[{int(modify_index)}] = {repr(converted_value)}",
+                              int(modify_index), int(modify_index) + 1, [converted_value])
+                    st.success(f"✅ Changed index {int(modify_index)} from '{old_value}' to '{converted_value}'!")
+                    st.code(f"my_list[{int(modify_index)}] = {repr(converted_value)}\n# Result: {st.session_state.my_list}", language="python")
+                    st.rerun()
             
             # Show current values
             st.markdown("#### Current Values:")
@@ -407,7 +443,9 @@ def show():
             
             # Count
             if st.session_state.my_list:
-                count_value = st.selectbox("Count occurrences of:", list(set(st.session_state.my_list)), key="count_value")
+                # Distinct by repr, since items can be lists and set() needs hashable ones
+                distinct = list({repr(item): item for item in st.session_state.my_list}.values())
+                count_value = st.selectbox("Count occurrences of:", distinct, key="count_value")
                 count = st.session_state.my_list.count(count_value)
                 st.code(f"my_list.count({repr(count_value)}) = {count}", language="python")
                 st.caption("How many times value appears")
@@ -428,7 +466,8 @@ def show():
             # Reverse
             reverse_btn = st.button("🔄 Reverse List")
             if reverse_btn:
-                st.session_state.my_list.reverse()
+                edit_list("my_list.reverse()", 0, len(st.session_state.my_list),
+                          st.session_state.my_list[::-1])
                 st.success("✅ List reversed!")
                 st.rerun()
             st.caption("Reverse the order of items")
@@ -437,7 +476,9 @@ def show():
             sort_btn = st.button("📊 Sort List")
             if sort_btn:
                 try:
-                    st.session_state.my_list.sort()
+                    # sorted() fails on mixed types before anything is changed
+                    edit_list("my_list.sort()", 0, len(st.session_state.my_list),
+                              sorted(st.session_state.my_list))
                     st.success("✅ List sorted!")
                     st.rerun()
                 except:
@@ -455,31 +496,14 @@ def show():
         
         # Check membership
         st.markdown("#### 🔍 Check if Item Exists")
-        check_value = st.text_input("Check if value exists:", key="check_value")
-        if check_value:
-            # Try to convert
-            try:
-                if '.' in check_value:
-                    check_val = float(check_value)
-                else:
-                    check_val = int(check_value)
-            except:
-                check_val = check_value
-            
-            exists = check_val in st.session_state.my_list
-            if exists:
-                st.success(f"✅ '{check_val}' is IN the list!")
-            else:
-                st.error(f"❌ '{check_val}' is NOT in the list!")
-            
-            st.code(f"{repr(check_val)} in my_list  # {exists}", language="python")
+        membership_panel()
     
     # Reset button
     st.markdown("---")
     col_reset1, col_reset2 = st.columns([3, 1])
     with col_reset2:
         if st.button("🔄 Reset to Default", type="secondary"):
-            st.session_state.my_list = ["apple", "banana", "orange"]
+            edit_list(f"my_list = {DEFAULT_LIST}", 0, len(st.session_state.my_list), DEFAULT_LIST)
             st.rerun()
     
     # Key concepts
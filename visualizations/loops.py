@@ -1,6 +1,707 @@
 import streamlit as st
 import time
 
+from visualizations.core import trace_cache, tracer
+from visualizations.core.fragments import panel
+from visualizations.core.iteration import render_iterations, run_button, sequence_length
+from visualizations.core.session_limits import cache
+from visualizations.core.timeline import Timeline, scrubber
+
+# This session's latest traces (and their timelines), so paging or scrubbing
+# through a run doesn't fetch its trace again
+cache('loop_traces')
+RECENT_TRACES = 4
+
+STOP_REASONS = {
+    'steps': "it reached the step limit",
+    'time': "it reached the time limit",
+    'output': "it printed too much",
+    'killed': "it went over the code runner's time or memory limit",
+    'busy': "every code runner was busy - try again in a moment"
+}
+
+def run_traced(source):
+    """Run a loop snippet in the sandbox (or fetch its trace), noting if it was cut short or raised"""
+    recent = st.session_state.setdefault('loop_traces', {})
+    entry = recent.pop(source, None)
+    if entry is None:
+        entry = {'trace': trace_cache.run(source), 'timeline': None}
+    recent[source] = entry
+    while len(recent) > RECENT_TRACES:
+        del recent[next(iter(recent))]
+
+    trace = entry['trace']
+    if trace.stopped:
+        st.warning(f"⏱️ Tracing stopped after {len(trace) - 1:,} steps because "
+                   f"{STOP_REASONS[trace.stopped]} - below are the iterations it got through.")
+    if trace.error:
+        st.error(f"💥 Line {trace.error_line}: `{trace.error}`")
+    return trace
+
+def output_of(trace, iteration):
+    """What one iteration printed, as a single line"""
+    return trace.printed(iteration['start'], iteration['end']).rstrip("\n").replace("\n", " | ")
+
+def step_through(key, trace):
+    """Slider through every line a traced run executed, with the variables at that step"""
+    entry = st.session_state.loop_traces.get(trace.source)
+    if entry is None or entry['trace'] is not trace:
+        entry = {'trace': trace, 'timeline': None}
+    if entry['timeline'] is None:
+        entry['timeline'] = Timeline.from_trace(trace)
+    timeline = entry['timeline']
+
+    # The last step is the snapshot taken after the snippet finished
+    index = scrubber(key, len(timeline) - 1, f"Step (of {len(timeline) - 1:,})")
+    if index < 0:
+        st.info("Nothing ran.")
+        return
+    line = timeline.labels[index]
+    changed = timeline.changed(index)
+
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.code("\n".join(
+            f"{text}  # 👈 line {number} runs next" if number == line else text
+            for number, text in enumerate(trace.source.splitlines(), 1)
+        ), language="python")
+    with col2:
+        st.markdown("**Variables:**")
+        variables = timeline.state(index)
+        if variables:
+            st.dataframe([
+                {'name': name, 'value': value, '': "✏️" if name in changed else ""}
+                for name, value in variables.items()
+            ], hide_index=True, use_container_width=True)
+        else:
+            st.caption("(none yet)")
+        printed = trace.printed(0, index + 1).rstrip("\n").splitlines()
+        if printed:
+            st.markdown("**Printed so far:**")
+            st.code("\n".join(printed[-5:]), language="text")
+
+@panel
+def for_loop_panel():
+    """Try-it panel: for loops over a list, range or string"""
+    for_type = st.radio("Choose what to loop over:", 
+                       ["List", "Range", "String"], 
+                       horizontal=True,
+                       key="for_type")
+
+    if for_type == "List":
+        st.info("""
+        **Loop through a list** - Visit each item one by one
+        ```python
+        for item in my_list:
+            print(item)
+        ```
+        """)
+
+        # Input list
+        list_input = st.text_input("Enter items (comma-separated):", 
+                                  value="apple, banana, orange",
+                                  key="for_list_input")
+        items = [item.strip() for item in list_input.split(",") if item.strip()]
+
+        run = run_button("▶️ Run For Loop", "run_for_list", {'items': items})
+        if run:
+            items = run['items']
+            st.markdown("#### 🎬 Loop Execution:")
+
+            # Create container for loop visualization
+            loop_container = st.container()
+
+            with loop_container:
+                source = f"my_list = {items}\n\nfor item in my_list:\n    print(item)"
+                st.code(source, language="python")
+
+                st.markdown("---")
+
+                trace = run_traced(source)
+
+                # Show each iteration, as the tracer saw it
+                def show_item(number, iteration):
+                    item = iteration['variables']['item']
+                    col1, col2, col3 = st.columns([1, 2, 2])
+
+                    with col1:
+                        st.markdown(f"### Iteration {number}")
+
+                    with col2:
+                        st.markdown(f"**Current item:**")
+                        st.markdown(f"### :green[{item}]")
+
+                    with col3:
+                        st.code(f"item = {item}\nprint(item)  # Output: {output_of(trace, iteration)}", language="python")
+
+                    st.markdown("---")
+
+                iterations = tracer.loop_iterations(trace, 3)
+                render_iterations("run_for_list", iterations, show_item)
+
+            if not trace.stopped:
+                st.success(f"✅ Loop completed! Processed {len(iterations)} items.")
+
+    elif for_type == "Range":
+        st.info("""
+        **Loop through a range** - Repeat a specific number of times
+        ```python
+        for i in range(5):  # 0, 1, 2, 3, 4
+            print(i)
+        ```
+        """)
+
+        col_r1, col_r2, col_r3 = st.columns(3)
+
+        with col_r1:
+            range_start = st.number_input("Start", value=0, key="range_start")
+        with col_r2:
+            range_end = st.number_input("End", value=5, key="range_end")
+        with col_r3:
+            range_step = st.number_input("Step", value=1, min_value=1, key="range_step")
+
+        run = run_button("▶️ Run For Loop", "run_for_range",
+                         {'start': int(range_start), 'end': int(range_end), 'step': int(range_step)})
+        if run:
+            st.markdown("#### 🎬 Loop Execution:")
+
+            if run['start'] < run['end']:
+                source = f"for i in range({run['start']}, {run['end']}, {run['step']}):\n    print(i)"
+                st.code(source, language="python")
+                st.markdown("---")
+
+                # Long loops stop at the tracer's step budget, then page through what it saw
+                trace = run_traced(source)
+
+                # Visual representation
+                def show_value(number, iteration):
+                    i = iteration['variables']['i']
+                    col1, col2, col3 = st.columns([1, 2, 2])
+
+                    with col1:
+                        st.markdown(f"### Iteration {number}")
+
+                    with col2:
+                        st.markdown(f"**Current value:**")
+                        st.markdown(f"### :blue[{i}]")
+
+                    with col3:
+                        st.code(f"i = {i}\nprint(i)  # Output: {output_of(trace, iteration)}", language="python")
+
+                    st.markdown("---")
+
+                total = render_iterations("run_for_range", tracer.loop_iterations(trace, 1), show_value)
+
+                with st.expander("🎞️ Step through it line by line"):
+                    step_through("run_for_range_step", trace)
+
+                if trace.stopped:
+                    total_runs = sequence_length(range(run['start'], run['end'], run['step']))
+                    st.info(f"🔢 The whole loop would run {total_runs:,} times.")
+                else:
+                    st.success(f"✅ Loop completed! Ran {total:,} times.")
+            else:
+                st.error("❌ Start must be less than End!")
+
+    elif for_type == "String":
+        st.info("""
+        **Loop through a string** - Visit each character
+        ```python
+        for char in "Hello":
+            print(char)
+        ```
+        """)
+
+        string_input = st.text_input("Enter a string:", value="Python", key="for_string_input")
+
+        run = run_button("▶️ Run For Loop", "run_for_string", {'text': string_input})
+        if run:
+            string_input = run['text']
+            st.markdown("#### 🎬 Loop Execution:")
+
+            source = f"text = {repr(string_input)}\n\nfor char in text:\n    print(char)"
+            st.code(source, language="python")
+            st.markdown("---")
+
+            trace = run_traced(source)
+
+            def show_char(number, iteration):
+                char = iteration['variables']['char']
+                col1, col2, col3 = st.columns([1, 2, 2])
+
+                with col1:
+                    st.markdown(f"### Iteration {number}")
+
+                with col2:
+                    st.markdown(f"**Current char:**")
+                    st.markdown(f"### :orange[{char}]")
+
+                with col3:
+                    st.code(f"char = {char}\nprint(char)  # Output: {output_of(trace, iteration)}", language="python")
+
+                st.markdown("---")
+
+            iterations = tracer.loop_iterations(trace, 3)
+            render_iterations("run_for_string", iterations, show_char)
+
+            if not trace.stopped:
+                st.success(f"✅ Loop completed! Processed {len(iterations)} characters.")
+
+@panel
+def enumerate_panel():
+    """Try-it panel: for loop with enumerate()"""
+    enum_input = st.text_input("Enter items:", value="cat, dog, bird", key="enum_input")
+    enum_items = [item.strip() for item in enum_input.split(",") if item.strip()]
+
+    run = run_button("▶️ Run Enumerate Loop", "run_enum", {'items': enum_items})
+    if run:
+        enum_items = run['items']
+        source = f"items = {enum_items}\n\nfor index, item in enumerate(items):\n    print(f'{{index}}: {{item}}')"
+        st.code(source, language="python")
+        st.markdown("---")
+
+        trace = run_traced(source)
+
+        def show_pair(number, iteration):
+            index, item = iteration['variables']['index'], iteration['variables']['item']
+            col1, col2, col3 = st.columns([1, 1, 3])
+
+            with col1:
+                st.markdown(f"**Index:** :blue[{index}]")
+            with col2:
+                st.markdown(f"**Item:** :green[{item}]")
+            with col3:
+                st.code(f"print(f'{{index}}: {{item}}')\n# Output: {output_of(trace, iteration)}", language="python")
+
+            st.markdown("---")
+
+        render_iterations("run_enum", tracer.loop_iterations(trace, 3), show_pair)
+
+@panel
+def while_loop_panel():
+    """Try-it panel: while loop examples"""
+    while_example = st.radio("Choose example:", 
+                             ["Count Up", "Count Down", "Find Target"],
+                             horizontal=True,
+                             key="while_example")
+
+    if while_example == "Count Up":
+        st.markdown("#### 🔼 Count Up Example")
+
+        col_cu1, col_cu2 = st.columns(2)
+        with col_cu1:
+            start_val = st.number_input("Start value", value=0, key="cu_start")
+        with col_cu2:
+            target_val = st.number_input("Target value", value=5, key="cu_target")
+
+        run = run_button("▶️ Run While Loop", "run_while_up",
+                         {'start': int(start_val), 'target': int(target_val)})
+        if run:
+            start_val, target_val = run['start'], run['target']
+            if start_val < target_val:
+                source = f"count = {int(start_val)}\nwhile count < {int(target_val)}:\n    print(count)\n    count += 1"
+                st.code(source, language="python")
+                st.markdown("---")
+
+                trace = run_traced(source)
+
+                def show_step(iteration, step):
+                    count = step['variables']['count']
+                    col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
+
+                    with col1:
+                        st.markdown(f"**Iter {iteration}**")
+                    with col2:
+                        st.markdown(f"**count:** :blue[{count}]")
+                    with col3:
+                        st.markdown(f"**Check:** `{count} < {int(target_val)}` = :green[True]")
+                    with col4:
+                        st.code(f"print(count)  # Output: {output_of(trace, step)}\ncount += 1  # count is now {step['after']['count']}", language="python")
+
+                    st.markdown("---")
+
+                iterations = render_iterations("run_while_up", tracer.loop_iterations(trace, 2), show_step)
+
+                if not trace.stopped:
+                    # Final check (condition becomes False)
+                    count = trace.final_variables()['count']
+                    col1, col2, col3 = st.columns([1, 1, 3])
+                    with col1:
+                        st.markdown(f"**Final**")
+                    with col2:
+                        st.markdown(f"**count:** :blue[{count}]")
+                    with col3:
+                        st.markdown(f"**Check:** `{count} < {int(target_val)}` = :red[False] → Loop stops!")
+
+                    st.success(f"✅ Loop completed after {iterations:,} iterations!")
+                else:
+                    # The trace stopped early, but the count is plain arithmetic
+                    st.info(f"🔢 The whole loop would run {abs(int(target_val) - int(start_val)):,} times.")
+            else:
+                st.error("❌ Start must be less than target!")
+
+    elif while_example == "Count Down":
+        st.markdown("#### 🔽 Count Down Example")
+
+        col_cd1, col_cd2 = st.columns(2)
+        with col_cd1:
+            countdown_start = st.number_input("Start value", value=5, key="cd_start")
+        with col_cd2:
+            countdown_end = st.number_input("Stop at", value=0, key="cd_end")
+
+        run = run_button("▶️ Run While Loop", "run_while_down",
+                         {'start': int(countdown_start), 'end': int(countdown_end)})
+        if run:
+            countdown_start, countdown_end = run['start'], run['end']
+            if countdown_start > countdown_end:
+                source = f"count = {int(countdown_start)}\nwhile count > {int(countdown_end)}:\n    print(count)\n    count -= 1"
+                st.code(source, language="python")
+                st.markdown("---")
+
+                trace = run_traced(source)
+
+                def show_step(iteration, step):
+                    count = step['variables']['count']
+                    col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
+
+                    with col1:
+                        st.markdown(f"**Iter {iteration}**")
+                    with col2:
+                        st.markdown(f"**count:** :orange[{count}]")
+                    with col3:
+                        st.markdown(f"**Check:** `{count} > {int(countdown_end)}` = :green[True]")
+                    with col4:
+                        st.code(f"print(count)  # Output: {output_of(trace, step)}\ncount -= 1  # count is now {step['after']['count']}", language="python")
+
+                    st.markdown("---")
+
+                iterations = render_iterations("run_while_down", tracer.loop_iterations(trace, 2), show_step)
+
+                if not trace.stopped:
+                    # Final check
+                    count = trace.final_variables()['count']
+                    col1, col2, col3 = st.columns([1, 1, 3])
+                    with col1:
+                        st.markdown(f"**Final**")
+                    with col2:
+                        st.markdown(f"**count:** :orange[{count}]")
+                    with col3:
+                        st.markdown(f"**Check:** `{count} > {int(countdown_end)}` = :red[False] → Loop stops!")
+
+                    st.success(f"✅ Loop completed after {iterations:,} iterations!")
+                else:
+                    # The trace stopped early, but the count is plain arithmetic
+                    st.info(f"🔢 The whole loop would run {abs(int(countdown_start) - int(countdown_end)):,} times.")
+            else:
+                st.error("❌ Start must be greater than end!")
+
+    elif while_example == "Find Target":
+        st.markdown("#### 🎯 Find Target Example")
+        st.write("Search through a list until target is found")
+
+        col_ft1, col_ft2 = st.columns(2)
+        with col_ft1:
+            search_list = st.text_input("List (comma-separated):", value="10, 20, 30, 40, 50", key="search_list")
+        with col_ft2:
+            target_item = st.text_input("Target to find:", value="30", key="target_item")
+
+        run = run_button("▶️ Run While Loop", "run_while_find",
+                         {'items': [item.strip() for item in search_list.split(",")], 'target': target_item})
+        if run:
+            items, target_item = run['items'], run['target']
+
+            source = f"""items = {items}
+target = {repr(target_item)}
+index = 0
+found = False
+
+while index < len(items) and not found:
+    if items[index] == target:
+        found = True
+        print(f"Found at index {{index}}!")
+    else:
+        index += 1"""
+            st.code(source, language="python")
+
+            st.markdown("---")
+
+            trace = run_traced(source)
+
+            # The loop visits items up to and including the first match
+            def show_check(iteration, step):
+                index = int(step['variables']['index'])
+                col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
+
+                with col1:
+                    st.markdown(f"**Iter {iteration}**")
+                with col2:
+                    st.markdown(f"**index:** :blue[{index}]")
+                with col3:
+                    st.markdown(f"**Check:** `items[{index}]` = {repr(items[index])}")
+                with col4:
+                    # Line 8 is `found = True` - it only runs on a match
+                    if 8 in step['lines']:
+                        st.markdown(f":green[**Match!** {output_of(trace, step)}]")
+                    else:
+                        st.markdown(f":red[No match, continue...]")
+
+                st.markdown("---")
+
+            render_iterations("run_while_find", tracer.loop_iterations(trace, 6), show_check)
+
+            final = trace.final_variables()
+            if final.get('found') == "True":
+                st.success(f"✅ Found '{target_item}' at index {final['index']}!")
+            elif not trace.stopped:
+                st.error(f"❌ '{target_item}' not found in list!")
+
+@panel
+def loop_control_panel():
+    """Try-it panel: break and continue"""
+    control_type = st.radio("Choose control statement:", 
+                           ["break - Exit loop", "continue - Skip iteration"],
+                           key="control_type")
+
+    if "break" in control_type:
+        st.info("""
+        **`break`** - Exit the loop immediately
+        ```python
+        for i in range(10):
+            if i == 5:
+                break  # Stop the loop
+            print(i)
+        # Prints: 0, 1, 2, 3, 4
+        ```
+        """)
+
+        col_br1, col_br2 = st.columns(2)
+        with col_br1:
+            break_range = st.number_input("Loop from 0 to:", value=10, min_value=1, key="break_range")
+        with col_br2:
+            break_at = st.number_input("Break at:", value=5, min_value=0, key="break_at")
+
+        run = run_button("▶️ Run Loop with Break", "run_break",
+                         {'range': int(break_range), 'at': int(break_at)})
+        if run:
+            break_range, break_at = run['range'], run['at']
+            source = f"for i in range({int(break_range)}):\n    if i == {int(break_at)}:\n        break\n    print(i)"
+            st.code(source, language="python")
+            st.markdown("---")
+
+            trace = run_traced(source)
+
+            def show_step(iteration, step):
+                i = step['variables']['i']
+                # Line 3 is the break - the tracer saw it run
+                if 3 in step['lines']:
+                    col1, col2 = st.columns([1, 3])
+                    with col1:
+                        st.markdown(f"### :red[i = {i}]")
+                    with col2:
+                        st.error(f"🛑 **BREAK!** i == {int(break_at)} → Exit loop")
+                else:
+                    col1, col2, col3 = st.columns([1, 2, 2])
+                    with col1:
+                        st.markdown(f"**i = {i}**")
+                    with col2:
+                        st.markdown(f"Check: `{i} == {int(break_at)}` = False")
+                    with col3:
+                        st.code(f"print({i})  # Output: {output_of(trace, step)}", language="python")
+                    st.markdown("---")
+
+            iterations = tracer.loop_iterations(trace, 1)
+            render_iterations("run_break", iterations, show_step)
+
+            if iterations and 3 in iterations[-1]['lines']:
+                st.success(f"✅ Loop broke at i = {int(break_at)}")
+            elif not trace.stopped:
+                st.success(f"✅ Loop finished all {int(break_range)} iterations - i never reached {int(break_at)}")
+
+    elif "continue" in control_type:
+        st.info("""
+        **`continue`** - Skip to next iteration
+        ```python
+        for i in range(5):
+            if i == 2:
+                continue  # Skip this iteration
+            print(i)
+        # Prints: 0, 1, 3, 4 (skips 2)
+        ```
+        """)
+
+        col_co1, col_co2 = st.columns(2)
+        with col_co1:
+            continue_range = st.number_input("Loop from 0 to:", value=10, min_value=1, key="continue_range")
+        with col_co2:
+            skip_at = st.number_input("Skip at:", value=5, min_value=0, key="skip_at")
+
+        run = run_button("▶️ Run Loop with Continue", "run_continue",
+                         {'range': int(continue_range), 'at': int(skip_at)})
+        if run:
+            continue_range, skip_at = run['range'], run['at']
+            source = f"for i in range({int(continue_range)}):\n    if i == {int(skip_at)}:\n        continue  # Skip\n    print(i)"
+            st.code(source, language="python")
+            st.markdown("---")
+
+            trace = run_traced(source)
+
+            def show_step(iteration, step):
+                i = step['variables']['i']
+                # Line 3 is the continue - the tracer saw it run
+                if 3 in step['lines']:
+                    col1, col2 = st.columns([1, 3])
+                    with col1:
+                        st.markdown(f"### :orange[i = {i}]")
+                    with col2:
+                        st.warning(f"⏭️ **CONTINUE!** i == {int(skip_at)} → Skip to next iteration")
+                    st.markdown("---")
+                    return
+
+                col1, col2, col3 = st.columns([1, 2, 2])
+                with col1:
+                    st.markdown(f"**i = {i}**")
+                with col2:
+                    st.markdown(f"Check: `{i} == {int(skip_at)}` = False")
+                with col3:
+                    st.code(f"print({i})  # Output: {output_of(trace, step)}", language="python")
+                st.markdown("---")
+
+            render_iterations("run_continue", tracer.loop_iterations(trace, 1), show_step)
+
+            if not trace.stopped:
+                st.success(f"✅ Loop completed, skipped i = {int(skip_at)}")
+
+@panel
+def nested_loop_panel():
+    """Try-it panel: nested loop examples"""
+    nested_type = st.radio("Choose example:", 
+                          ["Multiplication Table", "Grid Pattern"],
+                          key="nested_type")
+
+    if nested_type == "Multiplication Table":
+        st.markdown("#### ✖️ Multiplication Table (Nested Loops)")
+
+        col_mt1, col_mt2 = st.columns(2)
+        with col_mt1:
+            rows_mult = st.number_input("Numbers (rows):", value=3, min_value=1, max_value=5, key="mult_rows")
+        with col_mt2:
+            cols_mult = st.number_input("Multiply up to (cols):", value=3, min_value=1, max_value=5, key="mult_cols")
+
+        if st.button("▶️ Generate Table", key="run_mult"):
+            source = f"# Nested loops: outer for rows, inner for columns\nfor row in range(1, {int(rows_mult)+1}):\n    for col in range(1, {int(cols_mult)+1}):\n        result = row * col\n        print(f'{{row}} x {{col}} = {{result}}')\n    print('---')  # Separate each row"
+            st.code(source, language="python")
+            st.markdown("---")
+
+            trace = run_traced(source)
+            inner = tracer.loop_iterations(trace, 3)
+
+            # Show execution: each outer iteration with the inner iterations it ran
+            for outer in tracer.loop_iterations(trace, 2):
+                st.markdown(f"### 🔄 Outer Loop: row = {outer['variables']['row']}")
+
+                for step in inner:
+                    if not outer['start'] <= step['start'] < outer['end']:
+                        continue
+                    values = step['after']
+                    col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
+
+                    with col1:
+                        st.markdown(f"**Row {values['row']}**")
+                    with col2:
+                        st.markdown(f"**Col {values['col']}**")
+                    with col3:
+                        st.markdown(f"`{values['row']} × {values['col']}`")
+                    with col4:
+                        st.markdown(f"### :green[= {values['result']}]")
+
+                st.markdown("---")
+
+            st.success(f"✅ Nested loops: Outer ran {int(rows_mult)} times, Inner ran {int(cols_mult)} times each = {len(inner)} total iterations!")
+
+    elif nested_type == "Grid Pattern":
+        st.markdown("#### 🎨 Grid Pattern")
+
+        col_gp1, col_gp2 = st.columns(2)
+        with col_gp1:
+            rows = st.number_input("Rows:", value=3, min_value=1, max_value=5, key="grid_rows")
+        with col_gp2:
+            cols = st.number_input("Columns:", value=3, min_value=1, max_value=5, key="grid_cols")
+
+        if st.button("▶️ Generate Grid", key="run_grid"):
+            source = f"for row in range({int(rows)}):\n    for col in range({int(cols)}):\n        print(f'({{row}}, {{col}})', end=' ')\n    print()  # New line"
+            st.code(source, language="python")
+            st.markdown("---")
+
+            trace = run_traced(source)
+            inner = tracer.loop_iterations(trace, 2)
+
+            # One row of cells per outer iteration, each showing what the inner print wrote
+            for outer in tracer.loop_iterations(trace, 1):
+                cells = [step for step in inner if outer['start'] <= step['start'] < outer['end']]
+                cols_ui = st.columns(int(cols))
+
+                for col, step in enumerate(cells):
+                    with cols_ui[col]:
+                        st.markdown(f"""
+                        <div style='
+                            border: 2px solid #2196F3;
+                            border-radius: 10px;
+                            padding: 20px;
+                            text-align: center;
+                            background-color: rgba(33, 150, 243, 0.1);
+                            margin: 5px;
+                        '>
+                            <div style='font-weight: bold; font-size: 1.2rem;'>{trace.printed(step['start'], step['end']).strip()}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
+
+            st.success(f"✅ Generated {int(rows)} × {int(cols)} grid!")
+
+@panel
+def own_code_panel():
+    """Try-it panel: trace any short loop the student writes"""
+    source = st.text_area("Your code:", value="total = 0\nfor i in range(1, 11):\n    total += i\nprint(total)",
+                          height=180, key="own_code")
+
+    run = run_button("▶️ Trace My Code", "run_own_code", {'source': source})
+    if run:
+        try:
+            trace = run_traced(run['source'])
+        except SyntaxError as error:
+            st.error(f"❌ Syntax error on line {error.lineno}: {error.msg}")
+            return
+        except tracer.UnsafeCode as error:
+            st.error(f"🚫 {error}")
+            return
+        except (RecursionError, MemoryError):
+            st.error("🚫 This code is nested too deeply to run - try splitting it into simpler lines.")
+            return
+
+        lines = run['source'].splitlines()
+        st.markdown("#### 🖨️ Output:")
+        st.code(trace.printed() or "(nothing printed)", language="text")
+
+        st.markdown(f"#### 👣 Step by Step ({len(trace) - 1:,} steps)")
+        step_through("own_code_step", trace)
+
+        # One row per line Python ran, with only the variables that line changed -
+        # built only on request, since a long run has thousands of rows
+        if st.toggle("📋 Show every step as a table", key="own_code_table"):
+            st.dataframe([
+                {
+                    'step': index + 1,
+                    'line': line,
+                    'code': lines[line - 1].strip(),
+                    'changed': ", ".join(f"{name} = {value}" for name, value in changed.items())
+                }
+                for index, (line, depth, changed, removed) in enumerate(trace.steps)
+                if line is not None
+            ], hide_index=True, use_container_width=True)
+
+        if not trace.stopped and not trace.error:
+            st.success("✅ Finished with: " + ", ".join(
+                f"{name} = {value}" for name, value in trace.final_variables().items()))
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">🔁 Python Loops Visualizer</h2>', unsafe_allow_html=True)
     st.write("Watch loops in action and understand how they repeat code!")
@@ -34,7 +735,7 @@ def show():
         """)
     
     # Create tabs for different loop types
-    loop_tabs = st.tabs(["🔄 For Loops", "⏰ While Loops", "🎮 Loop Control", "🎯 Nested Loops"])
+    loop_tabs = st.tabs(["🔄 For Loops", "⏰ While Loops", "🎮 Loop Control", "🎯 Nested Loops", "✍️ Your Own Code"])
     
     # ============================================
     # TAB 1: FOR LOOPS
@@ -44,135 +745,7 @@ def show():
         st.write("Iterate over sequences (lists, strings, ranges)")
         
         # For loop type selector
-        for_type = st.radio("Choose what to loop over:", 
-                           ["List", "Range", "String"], 
-                           horizontal=True,
-                           key="for_type")
-        
-        if for_type == "List":
-            st.info("""
-            **Loop through a list** - Visit each item one by one
-            ```python
-            for item in my_list:
-                print(item)
-            ```
-            """)
-            
-            # Input list
-            list_input = st.text_input("Enter items (comma-separated):", 
-                                      value="apple, banana, orange",
-                                      key="for_list_input")
-            items = [item.strip() for item in list_input.split(",") if item.strip()]
-            
-            if st.button("▶️ Run For Loop", key="run_for_list"):
-                st.markdown("#### 🎬 Loop Execution:")
-                
-                # Create container for loop visualization
-                loop_container = st.container()
-                
-                with loop_container:
-                    st.code(f"my_list = {items}\n\nfor item in my_list:\n    print(item)", language="python")
-                    
-                    st.markdown("---")
-                    
-                    # Show each iteration
-                    for i, item in enumerate(items):
-                        col1, col2, col3 = st.columns([1, 2, 2])
-                        
-                        with col1:
-                            st.markdown(f"### Iteration {i+1}")
-                        
-                        with col2:
-                            st.markdown(f"**Current item:**")
-                            st.markdown(f"### :green[{item}]")
-                        
-                        with col3:
-                            st.code(f"item = {repr(item)}\nprint(item)  # Output: {item}", language="python")
-                        
-                        st.markdown("---")
-                
-                st.success(f"✅ Loop completed! Processed {len(items)} items.")
-        
-        elif for_type == "Range":
-            st.info("""
-            **Loop through a range** - Repeat a specific number of times
-            ```python
-            for i in range(5):  # 0, 1, 2, 3, 4
-                print(i)
-            ```
-            """)
-            
-            col_r1, col_r2, col_r3 = st.columns(3)
-            
-            with col_r1:
-                range_start = st.number_input("Start", value=0, key="range_start")
-            with col_r2:
-                range_end = st.number_input("End", value=5, key="range_end")
-            with col_r3:
-                range_step = st.number_input("Step", value=1, min_value=1, key="range_step")
-            
-            if st.button("▶️ Run For Loop", key="run_for_range"):
-                st.markdown("#### 🎬 Loop Execution:")
-                
-                if range_start < range_end:
-                    st.code(f"for i in range({int(range_start)}, {int(range_end)}, {int(range_step)}):\n    print(i)", language="python")
-                    st.markdown("---")
-                    
-                    numbers = list(range(int(range_start), int(range_end), int(range_step)))
-                    
-                    # Visual representation
-                    for idx, i in enumerate(numbers):
-                        col1, col2, col3 = st.columns([1, 2, 2])
-                        
-                        with col1:
-                            st.markdown(f"### Iteration {idx+1}")
-                        
-                        with col2:
-                            st.markdown(f"**Current value:**")
-                            st.markdown(f"### :blue[{i}]")
-                        
-                        with col3:
-                            st.code(f"i = {i}\nprint(i)  # Output: {i}", language="python")
-                        
-                        st.markdown("---")
-                    
-                    st.success(f"✅ Loop completed! Ran {len(numbers)} times.")
-                else:
-                    st.error("❌ Start must be less than End!")
-        
-        elif for_type == "String":
-            st.info("""
-            **Loop through a string** - Visit each character
-            ```python
-            for char in "Hello":
-                print(char)
-            ```
-            """)
-            
-            string_input = st.text_input("Enter a string:", value="Python", key="for_string_input")
-            
-            if st.button("▶️ Run For Loop", key="run_for_string"):
-                st.markdown("#### 🎬 Loop Execution:")
-                
-                st.code(f"text = {repr(string_input)}\n\nfor char in text:\n    print(char)", language="python")
-                st.markdown("---")
-                
-                for i, char in enumerate(string_input):
-                    col1, col2, col3 = st.columns([1, 2, 2])
-                    
-                    with col1:
-                        st.markdown(f"### Iteration {i+1}")
-                    
-                    with col2:
-                        st.markdown(f"**Current char:**")
-                        st.markdown(f"### :orange[{repr(char)}]")
-                    
-                    with col3:
-                        st.code(f"char = {repr(char)}\nprint(char)  # Output: {char}", language="python")
-                    
-                    st.markdown("---")
-                
-                st.success(f"✅ Loop completed! Processed {len(string_input)} characters.")
+        for_loop_panel()
         
         # Enumerate example
         st.markdown("---")
@@ -186,24 +759,7 @@ def show():
         ```
         """)
         
-        enum_input = st.text_input("Enter items:", value="cat, dog, bird", key="enum_input")
-        enum_items = [item.strip() for item in enum_input.split(",") if item.strip()]
-        
-        if st.button("▶️ Run Enumerate Loop", key="run_enum"):
-            st.code(f"items = {enum_items}\n\nfor index, item in enumerate(items):\n    print(f'{{index}}: {{item}}')", language="python")
-            st.markdown("---")
-            
-            for index, item in enumerate(enum_items):
-                col1, col2, col3 = st.columns([1, 1, 3])
-                
-                with col1:
-                    st.markdown(f"**Index:** :blue[{index}]")
-                with col2:
-                    st.markdown(f"**Item:** :green[{item}]")
-                with col3:
-                    st.code(f"print(f'{index}: {item}')\n# Output: {index}: {item}", language="python")
-                
-                st.markdown("---")
+        enumerate_panel()
     
     # ============================================
     # TAB 2: WHILE LOOPS
@@ -225,159 +781,7 @@ def show():
         st.warning("⚠️ **Danger:** Infinite loops! Always update your condition variable!")
         
         # While loop examples
-        while_example = st.radio("Choose example:", 
-                                 ["Count Up", "Count Down", "Find Target"],
-                                 horizontal=True,
-                                 key="while_example")
-        
-        if while_example == "Count Up":
-            st.markdown("#### 🔼 Count Up Example")
-            
-            col_cu1, col_cu2 = st.columns(2)
-            with col_cu1:
-                start_val = st.number_input("Start value", value=0, key="cu_start")
-            with col_cu2:
-                target_val = st.number_input("Target value", value=5, key="cu_target")
-            
-            if st.button("▶️ Run While Loop", key="run_while_up"):
-                if start_val < target_val:
-                    st.code(f"count = {int(start_val)}\nwhile count < {int(target_val)}:\n    print(count)\n    count += 1", language="python")
-                    st.markdown("---")
-                    
-                    count = int(start_val)
-                    iteration = 1
-                    
-                    while count < int(target_val):
-                        col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
-                        
-                        with col1:
-                            st.markdown(f"**Iter {iteration}**")
-                        with col2:
-                            st.markdown(f"**count:** :blue[{count}]")
-                        with col3:
-                            st.markdown(f"**Check:** `{count} < {int(target_val)}` = :green[True]")
-                        with col4:
-                            st.code(f"print({count})\ncount = {count} + 1", language="python")
-                        
-                        count += 1
-                        iteration += 1
-                        st.markdown("---")
-                    
-                    # Final check (condition becomes False)
-                    col1, col2, col3 = st.columns([1, 1, 3])
-                    with col1:
-                        st.markdown(f"**Final**")
-                    with col2:
-                        st.markdown(f"**count:** :blue[{count}]")
-                    with col3:
-                        st.markdown(f"**Check:** `{count} < {int(target_val)}` = :red[False] → Loop stops!")
-                    
-                    st.success(f"✅ Loop completed after {iteration-1} iterations!")
-                else:
-                    st.error("❌ Start must be less than target!")
-        
-        elif while_example == "Count Down":
-            st.markdown("#### 🔽 Count Down Example")
-            
-            col_cd1, col_cd2 = st.columns(2)
-            with col_cd1:
-                countdown_start = st.number_input("Start value", value=5, key="cd_start")
-            with col_cd2:
-                countdown_end = st.number_input("Stop at", value=0, key="cd_end")
-            
-            if st.button("▶️ Run While Loop", key="run_while_down"):
-                if countdown_start > countdown_end:
-                    st.code(f"count = {int(countdown_start)}\nwhile count > {int(countdown_end)}:\n    print(count)\n    count -= 1", language="python")
-                    st.markdown("---")
-                    
-                    count = int(countdown_start)
-                    iteration = 1
-                    
-                    while count > int(countdown_end):
-                        col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
-                        
-                        with col1:
-                            st.markdown(f"**Iter {iteration}**")
-                        with col2:
-                            st.markdown(f"**count:** :orange[{count}]")
-                        with col3:
-                            st.markdown(f"**Check:** `{count} > {int(countdown_end)}` = :green[True]")
-                        with col4:
-                            st.code(f"print({count})\ncount = {count} - 1", language="python")
-                        
-                        count -= 1
-                        iteration += 1
-                        st.markdown("---")
-                    
-                    # Final check
-                    col1, col2, col3 = st.columns([1, 1, 3])
-                    with col1:
-                        st.markdown(f"**Final**")
-                    with col2:
-                        st.markdown(f"**count:** :orange[{count}]")
-                    with col3:
-                        st.markdown(f"**Check:** `{count} > {int(countdown_end)}` = :red[False] → Loop stops!")
-                    
-                    st.success(f"✅ Loop completed after {iteration-1} iterations!")
-                else:
-                    st.error("❌ Start must be greater than end!")
-        
-        elif while_example == "Find Target":
-            st.markdown("#### 🎯 Find Target Example")
-            st.write("Search through a list until target is found")
-            
-            col_ft1, col_ft2 = st.columns(2)
-            with col_ft1:
-                search_list = st.text_input("List (comma-separated):", value="10, 20, 30, 40, 50", key="search_list")
-            with col_ft2:
-                target_item = st.text_input("Target to find:", value="30", key="target_item")
-            
-            if st.button("▶️ Run While Loop", key="run_while_find"):
-                items = [item.strip() for item in search_list.split(",")]
-                
-                st.code(f"""items = {items}
-target = {repr(target_item)}
-index = 0
-found = False
-
-while index < len(items) and not found:
-    if items[index] == target:
-        found = True
-        print(f"Found at index {{index}}!")
-    else:
-        index += 1""", language="python")
-                
-                st.markdown("---")
-                
-                index = 0
-                found = False
-                iteration = 1
-                
-                while index < len(items) and not found:
-                    col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
-                    
-                    with col1:
-                        st.markdown(f"**Iter {iteration}**")
-                    with col2:
-                        st.markdown(f"**index:** :blue[{index}]")
-                    with col3:
-                        st.markdown(f"**Check:** `items[{index}]` = {repr(items[index])}")
-                    with col4:
-                        if items[index] == target_item:
-                            st.markdown(f":green[**Match!** Found '{target_item}']")
-                            found = True
-                        else:
-                            st.markdown(f":red[No match, continue...]")
-                    
-                    if not found:
-                        index += 1
-                    iteration += 1
-                    st.markdown("---")
-                
-                if found:
-                    st.success(f"✅ Found '{target_item}' at index {index}!")
-                else:
-                    st.error(f"❌ '{target_item}' not found in list!")
+        while_loop_panel()
     
     # ============================================
     # TAB 3: LOOP CONTROL
@@ -386,94 +790,7 @@ while index < len(items) and not found:
         st.markdown("### 🎮 Loop Control (break & continue)")
         st.write("Control how loops execute")
         
-        control_type = st.radio("Choose control statement:", 
-                               ["break - Exit loop", "continue - Skip iteration"],
-                               key="control_type")
-        
-        if "break" in control_type:
-            st.info("""
-            **`break`** - Exit the loop immediately
-            ```python
-            for i in range(10):
-                if i == 5:
-                    break  # Stop the loop
-                print(i)
-            # Prints: 0, 1, 2, 3, 4
-            ```
-            """)
-            
-            col_br1, col_br2 = st.columns(2)
-            with col_br1:
-                break_range = st.number_input("Loop from 0 to:", value=10, min_value=1, key="break_range")
-            with col_br2:
-                break_at = st.number_input("Break at:", value=5, min_value=0, key="break_at")
-            
-            if st.button("▶️ Run Loop with Break", key="run_break"):
-                st.code(f"for i in range({int(break_range)}):\n    if i == {int(break_at)}:\n        break\n    print(i)", language="python")
-                st.markdown("---")
-                
-                for i in range(int(break_range)):
-                    if i == int(break_at):
-                        col1, col2 = st.columns([1, 3])
-                        with col1:
-                            st.markdown(f"### :red[i = {i}]")
-                        with col2:
-                            st.error(f"🛑 **BREAK!** i == {int(break_at)} → Exit loop")
-                        break
-                    else:
-                        col1, col2, col3 = st.columns([1, 2, 2])
-                        with col1:
-                            st.markdown(f"**i = {i}**")
-                        with col2:
-                            st.markdown(f"Check: `{i} == {int(break_at)}` = False")
-                        with col3:
-                            st.code(f"print({i})", language="python")
-                        st.markdown("---")
-                
-                st.success(f"✅ Loop broke at i = {int(break_at)}")
-        
-        elif "continue" in control_type:
-            st.info("""
-            **`continue`** - Skip to next iteration
-            ```python
-            for i in range(5):
-                if i == 2:
-                    continue  # Skip this iteration
-                print(i)
-            # Prints: 0, 1, 3, 4 (skips 2)
-            ```
-            """)
-            
-            col_co1, col_co2 = st.columns(2)
-            with col_co1:
-                continue_range = st.number_input("Loop from 0 to:", value=10, min_value=1, key="continue_range")
-            with col_co2:
-                skip_at = st.number_input("Skip at:", value=5, min_value=0, key="skip_at")
-            
-            if st.button("▶️ Run Loop with Continue", key="run_continue"):
-                st.code(f"for i in range({int(continue_range)}):\n    if i == {int(skip_at)}:\n        continue  # Skip\n    print(i)", language="python")
-                st.markdown("---")
-                
-                for i in range(int(continue_range)):
-                    if i == int(skip_at):
-                        col1, col2 = st.columns([1, 3])
-                        with col1:
-                            st.markdown(f"### :orange[i = {i}]")
-                        with col2:
-                            st.warning(f"⏭️ **CONTINUE!** i == {int(skip_at)} → Skip to next iteration")
-                        st.markdown("---")
-                        continue
-                    
-                    col1, col2, col3 = st.columns([1, 2, 2])
-                    with col1:
-                        st.markdown(f"**i = {i}**")
-                    with col2:
-                        st.markdown(f"Check: `{i} == {int(skip_at)}` = False")
-                    with col3:
-                        st.code(f"print({i})", language="python")
-                    st.markdown("---")
-                
-                st.success(f"✅ Loop completed, skipped i = {int(skip_at)}")
+        loop_control_panel()
     
     # ============================================
     # TAB 4: NESTED LOOPS
@@ -495,76 +812,24 @@ while index < len(items) and not found:
         ```
         """)
         
-        nested_type = st.radio("Choose example:", 
-                              ["Multiplication Table", "Grid Pattern"],
-                              key="nested_type")
-        
-        if nested_type == "Multiplication Table":
-            st.markdown("#### ✖️ Multiplication Table (Nested Loops)")
-            
-            col_mt1, col_mt2 = st.columns(2)
-            with col_mt1:
-                rows_mult = st.number_input("Numbers (rows):", value=3, min_value=1, max_value=5, key="mult_rows")
-            with col_mt2:
-                cols_mult = st.number_input("Multiply up to (cols):", value=3, min_value=1, max_value=5, key="mult_cols")
-            
-            if st.button("▶️ Generate Table", key="run_mult"):
-                st.code(f"# Nested loops: outer for rows, inner for columns\nfor row in range(1, {int(rows_mult)+1}):\n    for col in range(1, {int(cols_mult)+1}):\n        result = row * col\n        print(f'{{row}} x {{col}} = {{result}}')\n    print('---')  # Separate each row", language="python")
-                st.markdown("---")
-                
-                # Show execution
-                for row in range(1, int(rows_mult)+1):
-                    st.markdown(f"### 🔄 Outer Loop: row = {row}")
-                    
-                    for col in range(1, int(cols_mult)+1):
-                        result = row * col
-                        col1, col2, col3, col4 = st.columns([1, 1, 2, 2])
-                        
-                        with col1:
-                            st.markdown(f"**Row {row}**")
-                        with col2:
-                            st.markdown(f"**Col {col}**")
-                        with col3:
-                            st.markdown(f"`{row} × {col}`")
-                        with col4:
-                            st.markdown(f"### :green[= {result}]")
-                    
-                    st.markdown("---")
-                
-                st.success(f"✅ Nested loops: Outer ran {int(rows_mult)} times, Inner ran {int(cols_mult)} times each = {int(rows_mult) * int(cols_mult)} total iterations!")
-        
-        elif nested_type == "Grid Pattern":
-            st.markdown("#### 🎨 Grid Pattern")
-            
-            col_gp1, col_gp2 = st.columns(2)
-            with col_gp1:
-                rows = st.number_input("Rows:", value=3, min_value=1, max_value=5, key="grid_rows")
-            with col_gp2:
-                cols = st.number_input("Columns:", value=3, min_value=1, max_value=5, key="grid_cols")
-            
-            if st.button("▶️ Generate Grid", key="run_grid"):
-                st.code(f"for row in range({int(rows)}):\n    for col in range({int(cols)}):\n        print(f'({{row}}, {{col}})', end=' ')\n    print()  # New line", language="python")
-                st.markdown("---")
-                
-                for row in range(int(rows)):
-                    cols_ui = st.columns(int(cols))
-                    
-                    for col in range(int(cols)):
-                        with cols_ui[col]:
-                            st.markdown(f"""
-                            <div style='
-                                border: 2px solid #2196F3;
-                                border-radius: 10px;
-                                padding: 20px;
-                                text-align: center;
-                                background-color: rgba(33, 150, 243, 0.1);
-                                margin: 5px;
-                            '>
-                                <div style='font-weight: bold; font-size: 1.2rem;'>({row}, {col})</div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                
-                st.success(f"✅ Generated {int(rows)} × {int(cols)} grid!")
+        nested_loop_panel()
+    
+    # ============================================
+    # TAB 5: YOUR OWN CODE
+    # ============================================
+    with loop_tabs[4]:
+        st.markdown("### ✍️ Trace Your Own Code")
+        st.write("Write a short loop and watch every line Python runs!")
+        
+        st.info("""
+        **How it works:**
+        - Your code runs in a separate, locked-down Python process
+        - Each step shows the line that ran and the variables it changed
+        - Infinite loops are stopped after a few thousand steps
+        - Imports aren't available here - use the built-in functions
+        """)
+        
+        own_code_panel()
     
     # Key takeaways
     st.markdown("---")
@@ -1,5 +1,467 @@
+import platform
+
 import streamlit as st
 
+from visualizations.core import timing, trace_cache
+from visualizations.core.fragments import panel, rerun_panel
+from visualizations.core.safe_math import ResultTooLarge, evaluate, format_number
+
+# Operators timed against each other in the "How Fast?" tab
+SPEED_TESTS = {
+    "➕ x = x + 1 vs x += 1": {
+        'setup': "x = 0",
+        'statements': ["x = x + 1", "x += 1"],
+        'lesson': "For numbers `x += 1` does the same work as `x = x + 1` - it's shorter to write, "
+                  "not faster. (For lists it's different: `+=` extends the list in place.)"
+    },
+    "➗ / vs //": {
+        'setup': "a = 17\nb = 5",
+        'statements': ["a / b", "a // b", "a % b"],
+        'lesson': "`/` always gives a float and `//` keeps ints as ints. Each is a single operation, "
+                  "so pick the one that gives the answer you need."
+    },
+    "💪 ** vs pow() vs math.pow()": {
+        'setup': "import math\na = 7\nb = 3",
+        'statements': ["a ** b", "pow(a, b)", "math.pow(a, b)"],
+        'lesson': "`**` is an operator, so Python doesn't have to look up a function and call it. "
+                  "`math.pow()` also turns both numbers into floats first - it gives `343.0`, not `343`."
+    },
+    "⚖️ Comparisons": {
+        'setup': "a = 7\nb = 3",
+        'statements': ["a < b", "a == b", "0 < a < 10", "0 < a and a < 10"],
+        'lesson': "Comparisons are among the cheapest things Python does. A chained comparison like "
+                  "`0 < a < 10` costs about the same as writing it out with `and`, and reads better."
+    },
+    "🔀 Short-circuit and / or": {
+        'setup': "def check():\n    return sum(range(10)) > 0",
+        'statements': ["False and check()", "True and check()", "True or check()", "False or check()"],
+        'lesson': "When the left side already decides the answer, Python never calls `check()` - "
+                  "that's why two of these cost hardly more than the empty loop."
+    }
+}
+
+@panel
+def arithmetic_calculator():
+    """Try-it panel: arithmetic calculator"""
+    st.markdown("#### 🎮 Try Arithmetic Operations!")
+
+    col_a1, col_a2, col_a3, col_a4 = st.columns([2, 1, 2, 2])
+
+    with col_a1:
+        num1 = st.number_input("First number", value=10, key="arith_num1")
+
+    with col_a2:
+        operator = st.selectbox("Operator", ["+", "-", "*", "/", "//", "%", "**"], key="arith_op")
+
+    with col_a3:
+        num2 = st.number_input("Second number", value=3, key="arith_num2")
+
+    with col_a4:
+        st.write("")  # spacing
+        calc_btn = st.button("🔢 Calculate", use_container_width=True)
+
+    if calc_btn or (num1 is not None and num2 is not None):
+        try:
+            # Size-checked first: 99999 ** 99999 would stall the whole server
+            result = evaluate(num1, operator, num2)
+            if operator == "+":
+                explanation = f"Add {num1} and {num2}"
+            elif operator == "-":
+                explanation = f"Subtract {num2} from {num1}"
+            elif operator == "*":
+                explanation = f"Multiply {num1} by {num2}"
+            elif operator == "/":
+                explanation = f"Divide {num1} by {num2}"
+            elif operator == "//":
+                explanation = f"Divide {num1} by {num2} and drop decimals"
+            elif operator == "%":
+                explanation = f"Remainder when {num1} is divided by {num2}"
+            elif operator == "**":
+                explanation = f"Raise {num1} to the power of {num2}"
+
+            # Display result
+            col_res1, col_res2 = st.columns([1, 2])
+
+            with col_res1:
+                st.markdown("### Result:")
+                st.markdown(f"## :green[{format_number(result)}]")
+
+            with col_res2:
+                st.info(f"""
+                **Operation:** {explanation}
+
+                **Python Code:**
+                ```python
+                result = {num1} {operator} {num2}
+                print(result)  # {format_number(result)}
+                ```
+                """)
+
+            # Special explanations
+            if operator == "//":
+                st.warning(f"""
+                💡 **Floor Division** gives you the whole number part only.
+                - Regular division: `{num1} / {num2}` = {num1 / num2}
+                - Floor division: `{num1} // {num2}` = {format_number(result)}
+                """)
+            elif operator == "%":
+                st.warning(f"""
+                💡 **Modulus (%)** gives you the remainder.
+                - {num1} ÷ {num2} = {num1 // num2} remainder **{result}**
+                - Useful for checking if a number is even/odd!
+                - Example: `10 % 2` = 0 (even), `11 % 2` = 1 (odd)
+                """)
+            elif operator == "**":
+                st.warning(f"""
+                💡 **Exponent (**)** means "to the power of"
+                - `{num1} ** {num2}` = {num1} × {num1} × ... ({num2} times)
+                - Example: `2 ** 3` = 2 × 2 × 2 = 8
+                """)
+
+        except ResultTooLarge as e:
+            st.warning(f"""
+            🐘 **That number is too big to show!** `{num1} {operator} {num2}` would have about **{e.digits:,} digits**.
+
+            - Result: {e.preview}
+            - Python *can* compute it (ints have no size limit), but it would keep the computer busy for a long time
+            """)
+        except ZeroDivisionError:
+            st.error("❌ Cannot divide by zero!")
+        except Exception as e:
+            st.error(f"❌ Error: {str(e)}")
+
+@panel
+def comparison_playground():
+    """Try-it panel: comparison operators"""
+    st.markdown("#### 🎮 Try Comparison Operations!")
+
+    col_c1, col_c2, col_c3, col_c4 = st.columns([2, 1, 2, 2])
+
+    with col_c1:
+        comp_val1 = st.text_input("First value", value="10", key="comp_val1")
+
+    with col_c2:
+        comp_op = st.selectbox("Operator", ["==", "!=", ">", "<", ">=", "<="], key="comp_op")
+
+    with col_c3:
+        comp_val2 = st.text_input("Second value", value="5", key="comp_val2")
+
+    with col_c4:
+        st.write("")  # spacing
+        comp_btn = st.button("⚖️ Compare", use_container_width=True)
+
+    if comp_btn or (comp_val1 and comp_val2):
+        try:
+            # Try to convert to numbers if possible
+            try:
+                v1 = float(comp_val1)
+                v2 = float(comp_val2)
+                val_type = "numbers"
+            except:
+                v1 = comp_val1
+                v2 = comp_val2
+                val_type = "strings"
+
+            # Perform comparison
+            if comp_op == "==":
+                result = v1 == v2
+                explanation = f"Is {v1} equal to {v2}?"
+            elif comp_op == "!=":
+                result = v1 != v2
+                explanation = f"Is {v1} NOT equal to {v2}?"
+            elif comp_op == ">":
+                result = v1 > v2
+                explanation = f"Is {v1} greater than {v2}?"
+            elif comp_op == "<":
+                result = v1 < v2
+                explanation = f"Is {v1} less than {v2}?"
+            elif comp_op == ">=":
+                result = v1 >= v2
+                explanation = f"Is {v1} greater than or equal to {v2}?"
+            elif comp_op == "<=":
+                result = v1 <= v2
+                explanation = f"Is {v1} less than or equal to {v2}?"
+
+            # Display result
+            col_cres1, col_cres2 = st.columns([1, 2])
+
+            with col_cres1:
+                st.markdown("### Result:")
+                if result:
+                    st.markdown(f"## :green[True] ✅")
+                else:
+                    st.markdown(f"## :red[False] ❌")
+
+            with col_cres2:
+                st.info(f"""
+                **Question:** {explanation}
+
+                **Answer:** {result}
+
+                **Python Code:**
+                ```python
+                result = {comp_val1} {comp_op} {comp_val2}
+                print(result)  # {result}
+                ```
+
+                **Type:** Comparing {val_type}
+                """)
+
+            # Show usage example
+            st.success(f"""
+            **💡 Use in code:**
+            ```python
+            if {comp_val1} {comp_op} {comp_val2}:
+                print("Condition is True!")
+            else:
+                print("Condition is False!")
+            ```
+            """)
+
+        except Exception as e:
+            st.error(f"❌ Error: {str(e)}")
+
+@panel
+def and_operator_panel():
+    """Try-it panel: the and operator"""
+    st.markdown("#### 🎮 AND Operator")
+    st.write("Both conditions must be True")
+
+    col_and1, col_and2, col_and3 = st.columns(3)
+
+    with col_and1:
+        and_val1 = st.selectbox("First value", [True, False], key="and_val1")
+
+    with col_and2:
+        st.markdown("### and")
+
+    with col_and3:
+        and_val2 = st.selectbox("Second value", [True, False], key="and_val2")
+
+    and_result = and_val1 and and_val2
+
+    col_and_res1, col_and_res2 = st.columns([1, 2])
+
+    with col_and_res1:
+        st.markdown("### Result:")
+        if and_result:
+            st.markdown(f"## :green[{and_result}] ✅")
+        else:
+            st.markdown(f"## :red[{and_result}] ❌")
+
+    with col_and_res2:
+        st.info(f"""
+        **Truth Table for AND:**
+        - `True and True` = `True` ✅
+        - `True and False` = `False` ❌
+        - `False and True` = `False` ❌
+        - `False and False` = `False` ❌
+
+        **Only True if BOTH are True!**
+        """)
+
+    st.code(f"""
+# Example: Can you go to the party?
+age = 16
+has_permission = {and_val1}
+can_go = age >= 13 and has_permission
+print(can_go)  # {and_val1 and True}
+""", language="python")
+
+@panel
+def or_operator_panel():
+    """Try-it panel: the or operator"""
+    st.markdown("#### 🎮 OR Operator")
+    st.write("At least one condition must be True")
+
+    col_or1, col_or2, col_or3 = st.columns(3)
+
+    with col_or1:
+        or_val1 = st.selectbox("First value", [True, False], key="or_val1")
+
+    with col_or2:
+        st.markdown("### or")
+
+    with col_or3:
+        or_val2 = st.selectbox("Second value", [True, False], key="or_val2")
+
+    or_result = or_val1 or or_val2
+
+    col_or_res1, col_or_res2 = st.columns([1, 2])
+
+    with col_or_res1:
+        st.markdown("### Result:")
+        if or_result:
+            st.markdown(f"## :green[{or_result}] ✅")
+        else:
+            st.markdown(f"## :red[{or_result}] ❌")
+
+    with col_or_res2:
+        st.info(f"""
+        **Truth Table for OR:**
+        - `True or True` = `True` ✅
+        - `True or False` = `True` ✅
+        - `False or True` = `True` ✅
+        - `False or False` = `False` ❌
+
+        **True if AT LEAST ONE is True!**
+        """)
+
+    st.code(f"""
+# Example: Do you need an umbrella?
+is_raining = {or_val1}
+is_snowing = {or_val2}
+need_umbrella = is_raining or is_snowing
+print(need_umbrella)  # {or_result}
+""", language="python")
+
+@panel
+def not_operator_panel():
+    """Try-it panel: the not operator"""
+    st.markdown("#### 🎮 NOT Operator")
+    st.write("Flips True to False and False to True")
+
+    col_not1, col_not2 = st.columns(2)
+
+    with col_not1:
+        not_val = st.selectbox("Value", [True, False], key="not_val")
+
+    with col_not2:
+        not_result = not not_val
+        st.markdown("### Result:")
+        if not_result:
+            st.markdown(f"## :green[not {not_val} = {not_result}] ✅")
+        else:
+            st.markdown(f"## :red[not {not_val} = {not_result}] ❌")
+
+    st.info("""
+    **NOT simply flips the value:**
+    - `not True` = `False`
+    - `not False` = `True`
+    """)
+
+    st.code(f"""
+# Example: Is the door closed?
+is_open = {not_val}
+is_closed = not is_open
+print(is_closed)  # {not not_val}
+""", language="python")
+
+@panel
+def assignment_playground():
+    """Try-it panel: assignment operators on a running value"""
+    st.markdown("#### 🎮 Try Assignment Operators!")
+
+    # Initialize session state
+    if 'assign_var' not in st.session_state:
+        st.session_state.assign_var = 10
+
+    col_assign1, col_assign2 = st.columns(2)
+
+    with col_assign1:
+        st.markdown(f"### Current Value: :green[{format_number(st.session_state.assign_var)}]")
+
+    with col_assign2:
+        reset_btn = st.button("🔄 Reset to 10")
+        if reset_btn:
+            st.session_state.assign_var = 10
+            rerun_panel()
+
+    st.markdown("---")
+
+    col_op1, col_op2, col_op3 = st.columns([1, 1, 1])
+
+    with col_op1:
+        assign_op = st.selectbox("Choose operator", ["=", "+=", "-=", "*=", "/=", "//=", "%=", "**="], key="assign_op")
+
+    with col_op2:
+        assign_val = st.number_input("Value", value=3, key="assign_val")
+
+    with col_op3:
+        st.write("")  # spacing
+        apply_btn = st.button("✅ Apply", use_container_width=True)
+
+    if apply_btn:
+        old_value = st.session_state.assign_var
+
+        try:
+            if assign_op == "=":
+                st.session_state.assign_var = assign_val
+                explanation = f"Set x to {assign_val}"
+            else:
+                # x op= value is x = x op value, size-checked so **= can't run away
+                st.session_state.assign_var = evaluate(old_value, assign_op[:-1], assign_val)
+                explanation = {
+                    "+=": f"Add {assign_val} to x",
+                    "-=": f"Subtract {assign_val} from x",
+                    "*=": f"Multiply x by {assign_val}",
+                    "/=": f"Divide x by {assign_val}",
+                    "//=": f"Floor divide x by {assign_val}",
+                    "%=": f"x modulus {assign_val}",
+                    "**=": f"Raise x to power {assign_val}"
+                }[assign_op]
+
+            st.success(f"""
+            ✅ **Operation:** {explanation}
+
+            **Before:** x = {format_number(old_value)}
+
+            **Code:** `x {assign_op} {assign_val}`
+
+            **After:** x = {format_number(st.session_state.assign_var)}
+            """)
+
+            rerun_panel()
+
+        except ResultTooLarge as e:
+            st.warning(f"""
+            🐘 **x stays {format_number(old_value)}** - `x {assign_op} {assign_val}` would give a number with about **{e.digits:,} digits**
+            ({e.preview}). Try a smaller value or reset x.
+            """)
+        except ZeroDivisionError:
+            st.error("❌ Cannot divide by zero!")
+        except Exception as e:
+            st.error(f"❌ Error: {str(e)}")
+
+@panel
+def speed_lab_panel():
+    """Try-it panel: time operators against each other"""
+    test_name = st.selectbox("Compare:", list(SPEED_TESTS), key="speed_test")
+    test = SPEED_TESTS[test_name]
+    st.code(test['setup'], language="python")
+
+    if not st.button("⏱️ Time It", key="speed_btn"):
+        return
+
+    with st.spinner("Timing... (the first time on this server takes about a second)"):
+        status, results = trace_cache.measure(test['setup'], test['statements'])
+    if status == "busy":
+        st.warning("⏳ Every code runner was busy - try again in a moment.")
+        return
+    if status == "killed":
+        st.error("⛔ Timing went over the code runner's time or memory limit, so it was stopped.")
+        return
+
+    # The empty loop is part of every figure - shown so it can be read off each one
+    (_, loop, loop_spread, loop_loops), rows = results[0], results[1:]
+    fastest = min(mean for _, mean, _, _ in rows)
+    table = ["| Code | ns per operation | ± (95%) | Without the loop | vs fastest | Loops |",
+             "|------|------------------|---------|------------------|------------|-------|",
+             f"| `pass` (the timing loop itself) | {loop:,.1f} | ± {loop_spread:.1f} | - | - | {loop_loops:,} |"]
+    for statement, mean, spread, loops in rows:
+        table.append(f"| `{statement}` | {mean:,.1f} | ± {spread:.1f} | {max(mean - loop, 0):,.1f} | "
+                     f"{mean / fastest:.1f}× | {loops:,} |")
+    st.markdown("\n".join(table))
+    st.caption(f"Python {platform.python_version()} - each line ran \"Loops\" times in a row, "
+               f"{timing.REPEAT} times over. 1 ns is a billionth of a second.")
+
+    slow, fast = max(rows, key=lambda row: row[1]), min(rows, key=lambda row: row[1])
+    if slow[1] - slow[2] <= fast[1] + fast[2]:
+        st.info("🤝 The error bars overlap - on this server these are too close to call.")
+    else:
+        st.success(f"🏁 `{fast[0]}` took about {fast[1] / slow[1]:.0%} of the time of `{slow[0]}`.")
+    st.info(f"💡 {test['lesson']}")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">➕ Python Operators Playground</h2>', unsafe_allow_html=True)
     st.write("Learn how to perform operations on values in Python!")
@@ -19,7 +481,7 @@ def show():
         """)
     
     # Create tabs for different operator types
-    op_tabs = st.tabs(["🔢 Arithmetic", "⚖️ Comparison", "🔀 Logical", "🎯 Assignment"])
+    op_tabs = st.tabs(["🔢 Arithmetic", "⚖️ Comparison", "🔀 Logical", "🎯 Assignment", "⏱️ How Fast?"])
     
     # ============================================
     # TAB 1: ARITHMETIC OPERATORS
@@ -52,90 +514,7 @@ def show():
             """)
         
         st.markdown("---")
-        st.markdown("#### 🎮 Try Arithmetic Operations!")
-        
-        col_a1, col_a2, col_a3, col_a4 = st.columns([2, 1, 2, 2])
-        
-        with col_a1:
-            num1 = st.number_input("First number", value=10, key="arith_num1")
-        
-        with col_a2:
-            operator = st.selectbox("Operator", ["+", "-", "*", "/", "//", "%", "**"], key="arith_op")
-        
-        with col_a3:
-            num2 = st.number_input("Second number", value=3, key="arith_num2")
-        
-        with col_a4:
-            st.write("")  # spacing
-            calc_btn = st.button("🔢 Calculate", use_container_width=True)
-        
-        if calc_btn or (num1 is not None and num2 is not None):
-            try:
-                if operator == "+":
-                    result = num1 + num2
-                    explanation = f"Add {num1} and {num2}"
-                elif operator == "-":
-                    result = num1 - num2
-                    explanation = f"Subtract {num2} from {num1}"
-                elif operator == "*":
-                    result = num1 * num2
-                    explanation = f"Multiply {num1} by {num2}"
-                elif operator == "/":
-                    result = num1 / num2
-                    explanation = f"Divide {num1} by {num2}"
-                elif operator == "//":
-                    result = num1 // num2
-                    explanation = f"Divide {num1} by {num2} and drop decimals"
-                elif operator == "%":
-                    result = num1 % num2
-                    explanation = f"Remainder when {num1} is divided by {num2}"
-                elif operator == "**":
-                    result = num1 ** num2
-                    explanation = f"Raise {num1} to the power of {num2}"
-                
-                # Display result
-                col_res1, col_res2 = st.columns([1, 2])
-                
-                with col_res1:
-                    st.markdown("### Result:")
-                    st.markdown(f"## :green[{result}]")
-                
-                with col_res2:
-                    st.info(f"""
-                    **Operation:** {explanation}
-                    
-                    **Python Code:**
-                    ```python
-                    result = {num1} {operator} {num2}
-                    print(result)  # {result}
-                    ```
-                    """)
-                
-                # Special explanations
-                if operator == "//":
-                    st.warning(f"""
-                    💡 **Floor Division** gives you the whole number part only.
-                    - Regular division: `{num1} / {num2}` = {num1 / num2}
-                    - Floor division: `{num1} // {num2}` = {result}
-                    """)
-                elif operator == "%":
-                    st.warning(f"""
-                    💡 **Modulus (%)** gives you the remainder.
-                    - {num1} ÷ {num2} = {num1 // num2} remainder **{result}**
-                    - Useful for checking if a number is even/odd!
-                    - Example: `10 % 2` = 0 (even), `11 % 2` = 1 (odd)
-                    """)
-                elif operator == "**":
-                    st.warning(f"""
-                    💡 **Exponent (**)** means "to the power of"
-                    - `{num1} ** {num2}` = {num1} × {num1} × ... ({num2} times)
-                    - Example: `2 ** 3` = 2 × 2 × 2 = 8
-                    """)
-                
-            except ZeroDivisionError:
-                st.error("❌ Cannot divide by zero!")
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+        arithmetic_calculator()
         
         # Order of operations
         st.markdown("---")
@@ -189,93 +568,7 @@ def show():
         st.warning("⚠️ **Common Mistake:** Don't confuse `=` (assignment) with `==` (comparison)!")
         
         st.markdown("---")
-        st.markdown("#### 🎮 Try Comparison Operations!")
-        
-        col_c1, col_c2, col_c3, col_c4 = st.columns([2, 1, 2, 2])
-        
-        with col_c1:
-            comp_val1 = st.text_input("First value", value="10", key="comp_val1")
-        
-        with col_c2:
-            comp_op = st.selectbox("Operator", ["==", "!=", ">", "<", ">=", "<="], key="comp_op")
-        
-        with col_c3:
-            comp_val2 = st.text_input("Second value", value="5", key="comp_val2")
-        
-        with col_c4:
-            st.write("")  # spacing
-            comp_btn = st.button("⚖️ Compare", use_container_width=True)
-        
-        if comp_btn or (comp_val1 and comp_val2):
-            try:
-                # Try to convert to numbers if possible
-                try:
-                    v1 = float(comp_val1)
-                    v2 = float(comp_val2)
-                    val_type = "numbers"
-                except:
-                    v1 = comp_val1
-                    v2 = comp_val2
-                    val_type = "strings"
-                
-                # Perform comparison
-                if comp_op == "==":
-                    result = v1 == v2
-                    explanation = f"Is {v1} equal to {v2}?"
-                elif comp_op == "!=":
-                    result = v1 != v2
-                    explanation = f"Is {v1} NOT equal to {v2}?"
-                elif comp_op == ">":
-                    result = v1 > v2
-                    explanation = f"Is {v1} greater than {v2}?"
-                elif comp_op == "<":
-                    result = v1 < v2
-                    explanation = f"Is {v1} less than {v2}?"
-                elif comp_op == ">=":
-                    result = v1 >= v2
-                    explanation = f"Is {v1} greater than or equal to {v2}?"
-                elif comp_op == "<=":
-                    result = v1 <= v2
-                    explanation = f"Is {v1} less than or equal to {v2}?"
-                
-                # Display result
-                col_cres1, col_cres2 = st.columns([1, 2])
-                
-                with col_cres1:
-                    st.markdown("### Result:")
-                    if result:
-                        st.markdown(f"## :green[True] ✅")
-                    else:
-                        st.markdown(f"## :red[False] ❌")
-                
-                with col_cres2:
-                    st.info(f"""
-                    **Question:** {explanation}
-                    
-                    **Answer:** {result}
-                    
-                    **Python Code:**
-                    ```python
-                    result = {comp_val1} {comp_op} {comp_val2}
-                    print(result)  # {result}
-                    ```
-                    
-                    **Type:** Comparing {val_type}
-                    """)
-                
-                # Show usage example
-                st.success(f"""
-                **💡 Use in code:**
-                ```python
-                if {comp_val1} {comp_op} {comp_val2}:
-                    print("Condition is True!")
-                else:
-                    print("Condition is False!")
-                ```
-                """)
-                
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+        comparison_playground()
         
         # String comparison
         st.markdown("---")
@@ -316,124 +609,13 @@ def show():
         """)
         
         st.markdown("---")
-        st.markdown("#### 🎮 AND Operator")
-        st.write("Both conditions must be True")
-        
-        col_and1, col_and2, col_and3 = st.columns(3)
-        
-        with col_and1:
-            and_val1 = st.selectbox("First value", [True, False], key="and_val1")
-        
-        with col_and2:
-            st.markdown("### and")
-        
-        with col_and3:
-            and_val2 = st.selectbox("Second value", [True, False], key="and_val2")
-        
-        and_result = and_val1 and and_val2
-        
-        col_and_res1, col_and_res2 = st.columns([1, 2])
-        
-        with col_and_res1:
-            st.markdown("### Result:")
-            if and_result:
-                st.markdown(f"## :green[{and_result}] ✅")
-            else:
-                st.markdown(f"## :red[{and_result}] ❌")
-        
-        with col_and_res2:
-            st.info(f"""
-            **Truth Table for AND:**
-            - `True and True` = `True` ✅
-            - `True and False` = `False` ❌
-            - `False and True` = `False` ❌
-            - `False and False` = `False` ❌
-            
-            **Only True if BOTH are True!**
-            """)
-        
-        st.code(f"""
-# Example: Can you go to the party?
-age = 16
-has_permission = {and_val1}
-can_go = age >= 13 and has_permission
-print(can_go)  # {and_val1 and True}
-""", language="python")
+        and_operator_panel()
         
         st.markdown("---")
-        st.markdown("#### 🎮 OR Operator")
-        st.write("At least one condition must be True")
-        
-        col_or1, col_or2, col_or3 = st.columns(3)
-        
-        with col_or1:
-            or_val1 = st.selectbox("First value", [True, False], key="or_val1")
-        
-        with col_or2:
-            st.markdown("### or")
-        
-        with col_or3:
-            or_val2 = st.selectbox("Second value", [True, False], key="or_val2")
-        
-        or_result = or_val1 or or_val2
-        
-        col_or_res1, col_or_res2 = st.columns([1, 2])
-        
-        with col_or_res1:
-            st.markdown("### Result:")
-            if or_result:
-                st.markdown(f"## :green[{or_result}] ✅")
-            else:
-                st.markdown(f"## :red[{or_result}] ❌")
-        
-        with col_or_res2:
-            st.info(f"""
-            **Truth Table for OR:**
-            - `True or True` = `True` ✅
-            - `True or False` = `True` ✅
-            - `False or True` = `True` ✅
-            - `False or False` = `False` ❌
-            
-            **True if AT LEAST ONE is True!**
-            """)
-        
-        st.code(f"""
-# Example: Do you need an umbrella?
-is_raining = {or_val1}
-is_snowing = {or_val2}
-need_umbrella = is_raining or is_snowing
-print(need_umbrella)  # {or_result}
-""", language="python")
+        or_operator_panel()
         
         st.markdown("---")
-        st.markdown("#### 🎮 NOT Operator")
-        st.write("Flips True to False and False to True")
-        
-        col_not1, col_not2 = st.columns(2)
-        
-        with col_not1:
-            not_val = st.selectbox("Value", [True, False], key="not_val")
-        
-        with col_not2:
-            not_result = not not_val
-            st.markdown("### Result:")
-            if not_result:
-                st.markdown(f"## :green[not {not_val} = {not_result}] ✅")
-            else:
-                st.markdown(f"## :red[not {not_val} = {not_result}] ❌")
-        
-        st.info("""
-        **NOT simply flips the value:**
-        - `not True` = `False`
-        - `not False` = `True`
-        """)
-        
-        st.code(f"""
-# Example: Is the door closed?
-is_open = {not_val}
-is_closed = not is_open
-print(is_closed)  # {not not_val}
-""", language="python")
+        not_operator_panel()
         
         # Combined example
         st.markdown("---")
@@ -483,82 +665,7 @@ print(can_ride)  # True
         """)
         
         st.markdown("---")
-        st.markdown("#### 🎮 Try Assignment Operators!")
-        
-        # Initialize session state
-        if 'assign_var' not in st.session_state:
-            st.session_state.assign_var = 10
-        
-        col_assign1, col_assign2 = st.columns(2)
-        
-        with col_assign1:
-            st.markdown(f"### Current Value: :green[{st.session_state.assign_var}]")
-        
-        with col_assign2:
-            reset_btn = st.button("🔄 Reset to 10")
-            if reset_btn:
-                st.session_state.assign_var = 10
-                st.rerun()
-        
-        st.markdown("---")
-        
-        col_op1, col_op2, col_op3 = st.columns([1, 1, 1])
-        
-        with col_op1:
-            assign_op = st.selectbox("Choose operator", ["=", "+=", "-=", "*=", "/=", "//=", "%=", "**="], key="assign_op")
-        
-        with col_op2:
-            assign_val = st.number_input("Value", value=3, key="assign_val")
-        
-        with col_op3:
-            st.write("")  # spacing
-            apply_btn = st.button("✅ Apply", use_container_width=True)
-        
-        if apply_btn:
-            old_value = st.session_state.assign_var
-            
-            try:
-                if assign_op == "=":
-                    st.session_state.assign_var = assign_val
-                    explanation = f"Set x to {assign_val}"
-                elif assign_op == "+=":
-                    st.session_state.assign_var += assign_val
-                    explanation = f"Add {assign_val} to x"
-                elif assign_op == "-=":
-                    st.session_state.assign_var -= assign_val
-                    explanation = f"Subtract {assign_val} from x"
-                elif assign_op == "*=":
-                    st.session_state.assign_var *= assign_val
-                    explanation = f"Multiply x by {assign_val}"
-                elif assign_op == "/=":
-                    st.session_state.assign_var /= assign_val
-                    explanation = f"Divide x by {assign_val}"
-                elif assign_op == "//=":
-                    st.session_state.assign_var //= assign_val
-                    explanation = f"Floor divide x by {assign_val}"
-                elif assign_op == "%=":
-                    st.session_state.assign_var %= assign_val
-                    explanation = f"x modulus {assign_val}"
-                elif assign_op == "**=":
-                    st.session_state.assign_var **= assign_val
-                    explanation = f"Raise x to power {assign_val}"
-                
-                st.success(f"""
-                ✅ **Operation:** {explanation}
-                
-                **Before:** x = {old_value}
-                
-                **Code:** `x {assign_op} {assign_val}`
-                
-                **After:** x = {st.session_state.assign_var}
-                """)
-                
-                st.rerun()
-                
-            except ZeroDivisionError:
-                st.error("❌ Cannot divide by zero!")
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+        assignment_playground()
         
         # Show examples
         st.markdown("---")
@@ -600,6 +707,22 @@ print(can_ride)  # True
             ```
             """)
     
+    # ============================================
+    # TAB 5: HOW FAST?
+    # ============================================
+    with op_tabs[4]:
+        st.markdown("### ⏱️ How Fast Is Each Operator?")
+        st.write("Time operators against each other with Python's own `timeit` module!")
+
+        st.info(f"""
+        **How it's measured:**
+        - Each line runs up to **{timing.NUMBER:,} times** in a row (slow ones fewer), and that is repeated **{timing.REPEAT} times**
+        - Times are in **nanoseconds** (ns) per operation - billionths of a second!
+        - **± (95%)** is the error bar: if two error bars overlap, neither is really faster
+        """)
+
+        speed_lab_panel()
+
     # Final tips
     st.markdown("---")
     st.markdown("### 🎯 Key Takeaways")
@@ -1,5 +1,121 @@
 import streamlit as st
 
+from visualizations.core.fragments import panel
+
+@panel
+def print_panel():
+    """Try-it panel: print your own text"""
+    st.markdown("#### 🎨 Try Print Yourself!")
+
+    print_input = st.text_area("What do you want to print?", 
+                               value='Hello, World!',
+                               height=100,
+                               key="print_test")
+
+    col_btn1, col_btn2 = st.columns([1, 4])
+    with col_btn1:
+        print_btn = st.button("▶️ Run", use_container_width=True)
+
+    if print_btn or print_input:
+        st.markdown("**Output:**")
+        st.success(f"```\n{print_input}\n```")
+        st.code(f'print("{print_input}")', language="python")
+
+@panel
+def input_panel():
+    """Try-it panel: simulate input()"""
+    st.markdown("#### 🎮 Try Input Yourself!")
+
+    st.write("Simulate what input() does:")
+
+    col_input1, col_input2 = st.columns([3, 2])
+
+    with col_input1:
+        user_prompt = st.text_input("Your question/prompt:", 
+                                   value="What is your name?",
+                                   key="input_prompt")
+        user_response = st.text_input(f"{user_prompt} ", 
+                                     value="",
+                                     key="input_response",
+                                     placeholder="Type your answer here...")
+
+    with col_input2:
+        st.markdown("**Python Code:**")
+        st.code(f"""
+name = input("{user_prompt} ")
+print("You typed:", name)
+""", language="python")
+
+    if user_response:
+        st.success(f"**You typed:** {user_response}")
+        st.info(f"💾 This would be stored in the variable!")
+
+@panel
+def input_conversion_panel():
+    """Try-it panel: convert input text to a number"""
+    st.markdown("#### 🔄 Interactive Input & Conversion")
+
+    col_demo1, col_demo2 = st.columns(2)
+
+    with col_demo1:
+        demo_input = st.text_input("Enter a number:", value="15", key="demo_num")
+        convert_choice = st.radio("Convert to:", ["Keep as string", "Convert to int", "Convert to float"], key="convert_radio")
+
+    with col_demo2:
+        st.markdown("**Result:**")
+        try:
+            if convert_choice == "Keep as string":
+                result = demo_input
+                st.code(f'value = "{result}"\ntype: {type(result).__name__}')
+                st.info("✅ This is text. Good for names, not math!")
+            elif convert_choice == "Convert to int":
+                result = int(demo_input)
+                st.code(f'value = {result}\ntype: {type(result).__name__}')
+                st.success(f"✅ Now you can do math: {result} + 5 = {result + 5}")
+            elif convert_choice == "Convert to float":
+                result = float(demo_input)
+                st.code(f'value = {result}\ntype: {type(result).__name__}')
+                st.success(f"✅ Decimal number: {result} / 2 = {result / 2}")
+        except ValueError:
+            st.error("❌ Cannot convert to number!")
+
+@panel
+def greeting_example_panel():
+    """Try-it panel: personal greeting"""
+    st.markdown("**Try it:**")
+    ex1_name = st.text_input("What's your name? ", key="ex1_name")
+    if ex1_name:
+        st.text(f"Hello, {ex1_name}")
+        st.text("Welcome to Python!")
+
+@panel
+def age_example_panel():
+    """Try-it panel: age calculator"""
+    st.markdown("**Try it:**")
+    ex2_age = st.text_input("How old are you? ", key="ex2_age", value="")
+    if ex2_age:
+        try:
+            age_num = int(ex2_age)
+            next_year = age_num + 1
+            st.text(f"Next year you'll be {next_year}")
+        except:
+            st.error("Please enter a number!")
+
+@panel
+def all_about_you_panel():
+    """Try-it panel: several inputs together"""
+    st.markdown("**Try it:**")
+    ex3_name = st.text_input("Name: ", key="ex3_name")
+    ex3_age = st.text_input("Age: ", key="ex3_age")
+    ex3_color = st.text_input("Favorite color: ", key="ex3_color")
+
+    if ex3_name and ex3_age and ex3_color:
+        st.text("")
+        st.text("=== All About You ===")
+        st.text(f"Name: {ex3_name}")
+        st.text(f"Age: {ex3_age} years old")
+        st.text(f"Favorite color: {ex3_color}")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">💬 Print & Input - Talk to Your Program!</h2>', unsafe_allow_html=True)
     st.write("Learn how to display messages and get user input in Python!")
@@ -62,21 +178,7 @@ Alice
 """)
         
         st.markdown("---")
-        st.markdown("#### 🎨 Try Print Yourself!")
-        
-        print_input = st.text_area("What do you want to print?", 
-                                   value='Hello, World!',
-                                   height=100,
-                                   key="print_test")
-        
-        col_btn1, col_btn2 = st.columns([1, 4])
-        with col_btn1:
-            print_btn = st.button("▶️ Run", use_container_width=True)
-        
-        if print_btn or print_input:
-            st.markdown("**Output:**")
-            st.success(f"```\n{print_input}\n```")
-            st.code(f'print("{print_input}")', language="python")
+        print_panel()
         
         # Print multiple things
         st.markdown("---")
@@ -175,31 +277,7 @@ print("Hello,", name)
 """)
         
         st.markdown("---")
-        st.markdown("#### 🎮 Try Input Yourself!")
-        
-        st.write("Simulate what input() does:")
-        
-        col_input1, col_input2 = st.columns([3, 2])
-        
-        with col_input1:
-            user_prompt = st.text_input("Your question/prompt:", 
-                                       value="What is your name?",
-                                       key="input_prompt")
-            user_response = st.text_input(f"{user_prompt} ", 
-                                         value="",
-                                         key="input_response",
-                                         placeholder="Type your answer here...")
-        
-        with col_input2:
-            st.markdown("**Python Code:**")
-            st.code(f"""
-name = input("{user_prompt} ")
-print("You typed:", name)
-""", language="python")
-        
-        if user_response:
-            st.success(f"**You typed:** {user_response}")
-            st.info(f"💾 This would be stored in the variable!")
+        input_panel()
         
         # Important note about input
         st.markdown("---")
@@ -240,31 +318,7 @@ next_year = age + 1
         
         # Interactive conversion demo
         st.markdown("---")
-        st.markdown("#### 🔄 Interactive Input & Conversion")
-        
-        col_demo1, col_demo2 = st.columns(2)
-        
-        with col_demo1:
-            demo_input = st.text_input("Enter a number:", value="15", key="demo_num")
-            convert_choice = st.radio("Convert to:", ["Keep as string", "Convert to int", "Convert to float"], key="convert_radio")
-        
-        with col_demo2:
-            st.markdown("**Result:**")
-            try:
-                if convert_choice == "Keep as string":
-                    result = demo_input
-                    st.code(f'value = "{result}"\ntype: {type(result).__name__}')
-                    st.info("✅ This is text. Good for names, not math!")
-                elif convert_choice == "Convert to int":
-                    result = int(demo_input)
-                    st.code(f'value = {result}\ntype: {type(result).__name__}')
-                    st.success(f"✅ Now you can do math: {result} + 5 = {result + 5}")
-                elif convert_choice == "Convert to float":
-                    result = float(demo_input)
-                    st.code(f'value = {result}\ntype: {type(result).__name__}')
-                    st.success(f"✅ Decimal number: {result} / 2 = {result / 2}")
-            except ValueError:
-                st.error("❌ Cannot convert to number!")
+        input_conversion_panel()
     
     # ============================================
     # TAB 3: USING BOTH TOGETHER
@@ -289,11 +343,7 @@ print("Welcome to Python!")
 """, language="python")
         
         with col_ex1_2:
-            st.markdown("**Try it:**")
-            ex1_name = st.text_input("What's your name? ", key="ex1_name")
-            if ex1_name:
-                st.text(f"Hello, {ex1_name}")
-                st.text("Welcome to Python!")
+            greeting_example_panel()
         
         # Example 2: Age calculator
         st.markdown("---")
@@ -315,15 +365,7 @@ print("Next year you'll be", next_year)
 """, language="python")
         
         with col_ex2_2:
-            st.markdown("**Try it:**")
-            ex2_age = st.text_input("How old are you? ", key="ex2_age", value="")
-            if ex2_age:
-                try:
-                    age_num = int(ex2_age)
-                    next_year = age_num + 1
-                    st.text(f"Next year you'll be {next_year}")
-                except:
-                    st.error("Please enter a number!")
+            age_example_panel()
         
         # Example 3: Multiple inputs
         st.markdown("---")
@@ -347,17 +389,7 @@ print("Favorite color:", color)
 """, language="python")
         
         with col_ex3_2:
-            st.markdown("**Try it:**")
-            ex3_name = st.text_input("Name: ", key="ex3_name")
-            ex3_age = st.text_input("Age: ", key="ex3_age")
-            ex3_color = st.text_input("Favorite color: ", key="ex3_color")
-            
-            if ex3_name and ex3_age and ex3_color:
-                st.text("")
-                st.text("=== All About You ===")
-                st.text(f"Name: {ex3_name}")
-                st.text(f"Age: {ex3_age} years old")
-                st.text(f"Favorite color: {ex3_color}")
+            all_about_you_panel()
     
     # Key takeaways
     st.markdown("---")
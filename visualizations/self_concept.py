@@ -6,6 +6,59 @@ Shows how 'self' refers to the specific instance in class methods
 import streamlit as st
 import time
 
+from visualizations.core.session_limits import LRU, manage, touch
+from visualizations.core.timeline import Timeline, scrubber
+
+# Per-student session state kept in check by the session manager
+manage('accounts', cap=100, evict=LRU)
+manage('execution_steps', cap=200)
+manage('executing_method')
+manage('account_counter')
+
+def record_step(call, acc_id, before, after):
+    """Add a call to the history; before is None when the call created the account"""
+    st.session_state.execution_steps.append({
+        'call': call,
+        'account': acc_id,
+        'before': before,
+        'after': after
+    })
+    # Show the newest call when the history is drawn
+    st.session_state.call_history_step = len(st.session_state.execution_steps)
+
+def show_call_history():
+    """Scrub through every account created and method called, with all balances after each"""
+    steps = st.session_state.execution_steps
+    if not steps:
+        return
+
+    # Work back from today's balances to the balances before the oldest call still kept
+    start = {acc_id: data['balance'] for acc_id, data in st.session_state.accounts.items()}
+    for step in reversed(steps):
+        if step['before'] is None:
+            start.pop(step['account'], None)
+        else:
+            start[step['account']] = step['before']
+    timeline = Timeline(start)
+    for step in steps:
+        timeline.append({step['account']: step['after']}, label=step['call'])
+
+    st.markdown("---")
+    st.markdown("### 📜 Call History")
+    st.write("Slide through the calls: each one changes only the account that was `self`.")
+
+    index = scrubber("call_history_step", len(timeline), "Call")
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.code(timeline.labels[index], language="python")
+        st.caption(f"Call {index + 1} of {len(timeline)}")
+    with col2:
+        changed = timeline.changed(index)
+        st.dataframe([
+            {'account': acc_id, 'balance': f"${balance}", 'self?': "👉 self" if acc_id in changed else ""}
+            for acc_id, balance in timeline.state(index).items()
+        ], hide_index=True, use_container_width=True)
+
 def show_self_concept_visualization():
     """Main function to display the self concept visualization"""
     
@@ -136,13 +189,16 @@ class Account:
             create_btn = st.form_submit_button("🎨 Create Account", use_container_width=True)
         
         if create_btn and acc_name:
-            acc_id = f"ac{len(st.session_state.accounts) + 1}"
+            # Numbered by a counter - with old accounts evicted, len() + 1 could reuse a name
+            st.session_state.account_counter = st.session_state.get('account_counter', 0) + 1
+            acc_id = f"ac{st.session_state.account_counter}"
             st.session_state.accounts[acc_id] = {
                 'var_name': acc_id,
                 'accNumber': acc_num,
                 'name': acc_name,
                 'balance': 0
             }
+            record_step(f'{acc_id} = Account({acc_num}, "{acc_name}")', acc_id, None, 0)
             st.success(f"✅ Created {acc_id}")
             st.rerun()
         
@@ -163,6 +219,8 @@ class Account:
                 execute_btn = st.form_submit_button("▶️ Execute Method", use_container_width=True)
             
             if execute_btn and selected_acc:
+                touch(st.session_state.accounts, selected_acc)
+                
                 # Prepare execution visualization
                 st.session_state.executing_method = {
                     'account': selected_acc,
@@ -172,6 +230,7 @@ class Account:
                 }
                 
                 # Execute the actual operation
+                old_balance = st.session_state.accounts[selected_acc]['balance']
                 if method == "deposit":
                     st.session_state.accounts[selected_acc]['balance'] += amount
                     result = st.session_state.accounts[selected_acc]['balance']
@@ -183,6 +242,8 @@ class Account:
                         result = "Insufficient funds"
                 
                 st.session_state.executing_method['result'] = result
+                record_step(f"{selected_acc}.{method}({amount})", selected_acc, old_balance,
+                            st.session_state.accounts[selected_acc]['balance'])
                 st.success(f"✅ Method executed!")
                 st.rerun()
             
@@ -192,7 +253,9 @@ class Account:
             
             if st.button("🗑️ Clear All", use_container_width=True):
                 st.session_state.accounts = {}
+                st.session_state.account_counter = 0
                 st.session_state.executing_method = None
+                st.session_state.execution_steps = []
                 st.rerun()
     
     with col2:
@@ -234,6 +297,8 @@ class Account:
                     
                     st.divider()
     
+    show_call_history()
+    
     # Method execution visualization
     if st.session_state.executing_method:
         st.markdown("---")
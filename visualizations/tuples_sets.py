@@ -1,5 +1,271 @@
 import streamlit as st
 
+from visualizations.core.cards import bubble_card, card_row, item_card
+from visualizations.core.fragments import panel
+from visualizations.core.value_parser import parse_items
+
+# The fruits set the set-operation and membership panels both work on
+DEMO_SET = {"apple", "banana", "orange"}
+
+@panel
+def try_tuple_panel():
+    """Try-it panel: create a tuple"""
+    tuple_input = st.text_input("Enter tuple items (comma-separated):", 
+                                value="10, 20, 30",
+                                key="tuple_input")
+
+    if st.button("🎯 Create Tuple", key="create_tuple_btn"):
+        try:
+            # Each item is read as a Python literal: 10 is an int, hi and 'hi' are str
+            my_tuple = tuple(parse_items(tuple_input))
+
+            st.code(f"my_tuple = {my_tuple}", language="python")
+
+            # Visual representation
+            st.markdown("#### 📊 Tuple Structure:")
+            card_row([item_card(f"Index: {i}", item, "#9C27B0") for i, item in enumerate(my_tuple)])
+
+            st.markdown("---")
+
+            col_info1, col_info2, col_info3 = st.columns(3)
+            with col_info1:
+                st.metric("Length", len(my_tuple))
+            with col_info2:
+                st.metric("Type", "tuple")
+            with col_info3:
+                st.metric("Mutable", "No ❌")
+
+        except Exception as e:
+            st.error(f"Error: {str(e)}")
+
+@panel
+def tuple_operations_panel():
+    """Try-it panel: what tuples can and cannot do"""
+    demo_tuple = (10, 20, 30, 40, 50)
+    st.code(f"numbers = {demo_tuple}", language="python")
+
+    col_op1, col_op2 = st.columns(2)
+
+    with col_op1:
+        st.markdown("**✅ What You CAN Do:**")
+
+        if st.button("Access by index", key="tuple_access_btn"):
+            st.code(f"numbers[0] = {demo_tuple[0]}\nnumbers[-1] = {demo_tuple[-1]}", language="python")
+
+        if st.button("Slice", key="tuple_slice_btn"):
+            st.code(f"numbers[1:3] = {demo_tuple[1:3]}", language="python")
+
+        if st.button("Count occurrences", key="tuple_count_btn"):
+            st.code(f"numbers.count(20) = {demo_tuple.count(20)}", language="python")
+
+        if st.button("Find index", key="tuple_index_btn"):
+            st.code(f"numbers.index(30) = {demo_tuple.index(30)}", language="python")
+
+        if st.button("Check membership", key="tuple_in_btn"):
+            st.code(f"20 in numbers = {20 in demo_tuple}", language="python")
+
+    with col_op2:
+        st.markdown("**❌ What You CANNOT Do:**")
+
+        st.error("""
+        ```python
+        numbers[0] = 99
+        # ❌ Error: tuples are immutable!
+
+        numbers.append(60)
+        # ❌ Error: no append method!
+
+        numbers.remove(20)
+        # ❌ Error: no remove method!
+
+        del numbers[0]
+        # ❌ Error: cannot delete items!
+        ```
+        """)
+
+@panel
+def packing_panel():
+    """Try-it panel: tuple packing and unpacking"""
+
+    col_unpack1, col_unpack2, col_unpack3 = st.columns(3)
+
+    with col_unpack1:
+        unpack_x = st.number_input("X:", value=100, key="unpack_x")
+    with col_unpack2:
+        unpack_y = st.number_input("Y:", value=200, key="unpack_y")
+    with col_unpack3:
+        unpack_z = st.number_input("Z:", value=300, key="unpack_z")
+
+    if st.button("📦 Pack & Unpack", key="pack_unpack_btn"):
+        point = (unpack_x, unpack_y, unpack_z)
+        st.code(f"""# Packing
+point = {unpack_x}, {unpack_y}, {unpack_z}
+print(point)  # {point}
+
+# Unpacking
+x, y, z = point
+print(f"X={{x}}, Y={{y}}, Z={{z}}")
+# X={unpack_x}, Y={unpack_y}, Z={unpack_z}""", language="python")
+
+        st.success(f"✅ Packed: {point}")
+        st.info(f"✅ Unpacked: X={unpack_x}, Y={unpack_y}, Z={unpack_z}")
+
+@panel
+def try_set_panel():
+    """Try-it panel: create a set and see duplicates removed"""
+    set_input = st.text_input("Enter items (comma-separated, duplicates OK):", 
+                              value="apple, banana, apple, orange, banana, apple",
+                              key="set_input")
+
+    if st.button("🎨 Create Set", key="create_set_btn"):
+        try:
+            items = [item.strip() for item in set_input.split(",")]
+            my_set = set(items)
+
+            st.markdown("#### 📊 Before (List with duplicates):")
+            st.code(f"items = {items}", language="python")
+            st.info(f"Count: {len(items)} items (including duplicates)")
+
+            st.markdown("#### ✨ After (Set with unique items only):")
+            st.code(f"my_set = set(items)\n# {my_set}", language="python")
+            st.success(f"Count: {len(my_set)} unique items")
+
+            # Visual representation
+            st.markdown("#### 🎨 Set Contents:")
+            card_row([bubble_card(item, "#FF5722") for item in list(my_set)[:6]])  # Show first 6 items
+
+            if len(my_set) > 6:
+                st.caption(f"... and {len(my_set) - 6} more items")
+
+        except Exception as e:
+            st.error(f"Error: {str(e)}")
+
+@panel
+def set_operations_panel():
+    """Try-it panel: add and remove set items"""
+    st.code(f"fruits = {DEMO_SET}", language="python")
+
+    col_setop1, col_setop2 = st.columns(2)
+
+    with col_setop1:
+        st.markdown("**➕ Adding Items:**")
+
+        add_item = st.text_input("Item to add:", value="mango", key="set_add_item")
+        if st.button("Add", key="set_add_btn"):
+            new_set = DEMO_SET.copy()
+            new_set.add(add_item)
+            st.code(f"fruits.add('{add_item}')\nprint(fruits)  # {new_set}", language="python")
+            st.success(f"✅ Added! New set: {new_set}")
+
+    with col_setop2:
+        st.markdown("**❌ Removing Items:**")
+
+        remove_item = st.selectbox("Item to remove:", list(DEMO_SET), key="set_remove_item")
+        if st.button("Remove", key="set_remove_btn"):
+            new_set = DEMO_SET.copy()
+            new_set.remove(remove_item)
+            st.code(f"fruits.remove('{remove_item}')\nprint(fruits)  # {new_set}", language="python")
+            st.success(f"✅ Removed! New set: {new_set}")
+
+@panel
+def membership_panel():
+    """Try-it panel: set membership"""
+    check_item = st.text_input("Check if item exists:", value="banana", key="set_check")
+    if st.button("🔍 Check", key="set_check_btn"):
+        exists = check_item in DEMO_SET
+        st.code(f"'{check_item}' in fruits  # {exists}", language="python")
+        if exists:
+            st.success(f"✅ '{check_item}' IS in the set!")
+        else:
+            st.error(f"❌ '{check_item}' is NOT in the set!")
+
+@panel
+def set_math_panel():
+    """Try-it panel: set math operations"""
+    set1_input = st.text_input("Set 1 (comma-separated):", value="1, 2, 3, 4", key="set1_math")
+    set2_input = st.text_input("Set 2 (comma-separated):", value="3, 4, 5, 6", key="set2_math")
+
+    if st.button("🧮 Calculate Set Operations", key="set_math_btn"):
+        try:
+            set1 = set([item.strip() for item in set1_input.split(",")])
+            set2 = set([item.strip() for item in set2_input.split(",")])
+
+            st.code(f"set1 = {set1}\nset2 = {set2}", language="python")
+
+            col_math1, col_math2 = st.columns(2)
+
+            with col_math1:
+                # Union
+                union = set1 | set2
+                st.markdown("**🔗 Union (|)** - All items from both")
+                st.code(f"set1 | set2 = {union}", language="python")
+                st.success(f"Result: {union}")
+
+                st.markdown("")
+
+                # Difference
+                diff = set1 - set2
+                st.markdown("**➖ Difference (-)** - In set1 but not set2")
+                st.code(f"set1 - set2 = {diff}", language="python")
+                st.info(f"Result: {diff}")
+
+            with col_math2:
+                # Intersection
+                inter = set1 & set2
+                st.markdown("**🎯 Intersection (&)** - Common items")
+                st.code(f"set1 & set2 = {inter}", language="python")
+                st.warning(f"Result: {inter}")
+
+                st.markdown("")
+
+                # Symmetric Difference
+                sym_diff = set1 ^ set2
+                st.markdown("**⚡ Symmetric Diff (^)** - In either but not both")
+                st.code(f"set1 ^ set2 = {sym_diff}", language="python")
+                st.error(f"Result: {sym_diff}")
+
+        except Exception as e:
+            st.error(f"Error: {str(e)}")
+
+@panel
+def collection_comparison_panel():
+    """Try-it panel: list vs tuple vs set"""
+    comp_input = st.text_input("Enter items (with duplicates):", 
+                               value="apple, banana, apple, cherry, banana",
+                               key="comp_input")
+
+    if st.button("🔄 Convert to All Three", key="convert_all_btn"):
+        items = [item.strip() for item in comp_input.split(",")]
+
+        col_comp1, col_comp2, col_comp3 = st.columns(3)
+
+        with col_comp1:
+            st.markdown("### 📚 List")
+            my_list = items
+            st.code(f"list = {my_list}", language="python")
+            st.info(f"Length: {len(my_list)}")
+            st.info(f"Ordered: ✅")
+            st.info(f"Mutable: ✅")
+            st.info(f"Duplicates: ✅")
+
+        with col_comp2:
+            st.markdown("### 🎯 Tuple")
+            my_tuple = tuple(items)
+            st.code(f"tuple = {my_tuple}", language="python")
+            st.warning(f"Length: {len(my_tuple)}")
+            st.warning(f"Ordered: ✅")
+            st.warning(f"Mutable: ❌")
+            st.warning(f"Duplicates: ✅")
+
+        with col_comp3:
+            st.markdown("### 🎨 Set")
+            my_set = set(items)
+            st.code(f"set = {my_set}", language="python")
+            st.success(f"Length: {len(my_set)}")
+            st.success(f"Ordered: ❌")
+            st.success(f"Mutable: ✅")
+            st.success(f"Duplicates: ❌")
+
 def show():
     st.markdown('<h2 style="color: #2196F3;">🎁 Tuples & Sets Explorer</h2>', unsafe_allow_html=True)
     st.write("Learn about two more important collection types in Python!")
@@ -76,105 +342,12 @@ mixed = (1, "hello", True)""", language="python")
         st.markdown("---")
         st.markdown("#### 🔍 Try Tuples")
         
-        tuple_input = st.text_input("Enter tuple items (comma-separated):", 
-                                    value="10, 20, 30",
-                                    key="tuple_input")
-        
-        if st.button("🎯 Create Tuple", key="create_tuple_btn"):
-            try:
-                # Parse input
-                items = [item.strip() for item in tuple_input.split(",")]
-                # Try to convert to numbers where possible
-                parsed_items = []
-                for item in items:
-                    try:
-                        if '.' in item:
-                            parsed_items.append(float(item))
-                        else:
-                            parsed_items.append(int(item))
-                    except:
-                        parsed_items.append(item)
-                
-                my_tuple = tuple(parsed_items)
-                
-                st.code(f"my_tuple = {my_tuple}", language="python")
-                
-                # Visual representation
-                st.markdown("#### 📊 Tuple Structure:")
-                cols = st.columns(len(my_tuple))
-                for i, item in enumerate(my_tuple):
-                    with cols[i]:
-                        st.markdown(f"""
-                        <div style='
-                            border: 2px solid #9C27B0;
-                            border-radius: 10px;
-                            padding: 15px;
-                            text-align: center;
-                            background-color: rgba(156, 39, 176, 0.1);
-                        '>
-                            <div style='font-size: 0.8rem; color: #666;'>Index: {i}</div>
-                            <div style='font-size: 1.3rem; font-weight: bold; color: #9C27B0;'>{item}</div>
-                            <div style='font-size: 0.7rem; color: #999;'>({type(item).__name__})</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                st.markdown("---")
-                
-                col_info1, col_info2, col_info3 = st.columns(3)
-                with col_info1:
-                    st.metric("Length", len(my_tuple))
-                with col_info2:
-                    st.metric("Type", "tuple")
-                with col_info3:
-                    st.metric("Mutable", "No ❌")
-                
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
+        try_tuple_panel()
         
         st.markdown("---")
         st.markdown("#### 📖 Tuple Operations")
         
-        demo_tuple = (10, 20, 30, 40, 50)
-        st.code(f"numbers = {demo_tuple}", language="python")
-        
-        col_op1, col_op2 = st.columns(2)
-        
-        with col_op1:
-            st.markdown("**✅ What You CAN Do:**")
-            
-            if st.button("Access by index", key="tuple_access_btn"):
-                st.code(f"numbers[0] = {demo_tuple[0]}\nnumbers[-1] = {demo_tuple[-1]}", language="python")
-            
-            if st.button("Slice", key="tuple_slice_btn"):
-                st.code(f"numbers[1:3] = {demo_tuple[1:3]}", language="python")
-            
-            if st.button("Count occurrences", key="tuple_count_btn"):
-                st.code(f"numbers.count(20) = {demo_tuple.count(20)}", language="python")
-            
-            if st.button("Find index", key="tuple_index_btn"):
-                st.code(f"numbers.index(30) = {demo_tuple.index(30)}", language="python")
-            
-            if st.button("Check membership", key="tuple_in_btn"):
-                st.code(f"20 in numbers = {20 in demo_tuple}", language="python")
-        
-        with col_op2:
-            st.markdown("**❌ What You CANNOT Do:**")
-            
-            st.error("""
-            ```python
-            numbers[0] = 99
-            # ❌ Error: tuples are immutable!
-            
-            numbers.append(60)
-            # ❌ Error: no append method!
-            
-            numbers.remove(20)
-            # ❌ Error: no remove method!
-            
-            del numbers[0]
-            # ❌ Error: cannot delete items!
-            ```
-            """)
+        tuple_operations_panel()
         
         st.markdown("---")
         st.markdown("#### 🔄 Tuple Packing & Unpacking")
@@ -191,29 +364,7 @@ mixed = (1, "hello", True)""", language="python")
         # x=10, y=20, z=30
         ```
         """)
-        
-        col_unpack1, col_unpack2, col_unpack3 = st.columns(3)
-        
-        with col_unpack1:
-            unpack_x = st.number_input("X:", value=100, key="unpack_x")
-        with col_unpack2:
-            unpack_y = st.number_input("Y:", value=200, key="unpack_y")
-        with col_unpack3:
-            unpack_z = st.number_input("Z:", value=300, key="unpack_z")
-        
-        if st.button("📦 Pack & Unpack", key="pack_unpack_btn"):
-            point = (unpack_x, unpack_y, unpack_z)
-            st.code(f"""# Packing
-point = {unpack_x}, {unpack_y}, {unpack_z}
-print(point)  # {point}
-
-# Unpacking
-x, y, z = point
-print(f"X={{x}}, Y={{y}}, Z={{z}}")
-# X={unpack_x}, Y={unpack_y}, Z={unpack_z}""", language="python")
-            
-            st.success(f"✅ Packed: {point}")
-            st.info(f"✅ Unpacked: X={unpack_x}, Y={unpack_y}, Z={unpack_z}")
+        packing_panel()
         
         st.markdown("---")
         st.markdown("#### 🎯 Real-World Examples")
@@ -318,90 +469,17 @@ print(my_set)  # {1, 2, 3}""", language="python")
         st.markdown("---")
         st.markdown("#### 🔍 Try Sets - See Duplicates Removed!")
         
-        set_input = st.text_input("Enter items (comma-separated, duplicates OK):", 
-                                  value="apple, banana, apple, orange, banana, apple",
-                                  key="set_input")
-        
-        if st.button("🎨 Create Set", key="create_set_btn"):
-            try:
-                items = [item.strip() for item in set_input.split(",")]
-                my_set = set(items)
-                
-                st.markdown("#### 📊 Before (List with duplicates):")
-                st.code(f"items = {items}", language="python")
-                st.info(f"Count: {len(items)} items (including duplicates)")
-                
-                st.markdown("#### ✨ After (Set with unique items only):")
-                st.code(f"my_set = set(items)\n# {my_set}", language="python")
-                st.success(f"Count: {len(my_set)} unique items")
-                
-                # Visual representation
-                st.markdown("#### 🎨 Set Contents:")
-                cols = st.columns(min(len(my_set), 6))  # Max 6 columns
-                for i, item in enumerate(my_set):
-                    if i < 6:  # Show first 6 items
-                        with cols[i]:
-                            st.markdown(f"""
-                            <div style='
-                                border: 2px solid #FF5722;
-                                border-radius: 50%;
-                                padding: 20px;
-                                text-align: center;
-                                background-color: rgba(255, 87, 34, 0.1);
-                                min-height: 80px;
-                                display: flex;
-                                align-items: center;
-                                justify-content: center;
-                            '>
-                                <div style='font-size: 1.1rem; font-weight: bold; color: #FF5722;'>{item}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                
-                if len(my_set) > 6:
-                    st.caption(f"... and {len(my_set) - 6} more items")
-                
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
+        try_set_panel()
         
         st.markdown("---")
         st.markdown("#### 🔧 Set Operations")
         
-        demo_set = {"apple", "banana", "orange"}
-        st.code(f"fruits = {demo_set}", language="python")
-        
-        col_setop1, col_setop2 = st.columns(2)
-        
-        with col_setop1:
-            st.markdown("**➕ Adding Items:**")
-            
-            add_item = st.text_input("Item to add:", value="mango", key="set_add_item")
-            if st.button("Add", key="set_add_btn"):
-                new_set = demo_set.copy()
-                new_set.add(add_item)
-                st.code(f"fruits.add('{add_item}')\nprint(fruits)  # {new_set}", language="python")
-                st.success(f"✅ Added! New set: {new_set}")
-        
-        with col_setop2:
-            st.markdown("**❌ Removing Items:**")
-            
-            remove_item = st.selectbox("Item to remove:", list(demo_set), key="set_remove_item")
-            if st.button("Remove", key="set_remove_btn"):
-                new_set = demo_set.copy()
-                new_set.remove(remove_item)
-                st.code(f"fruits.remove('{remove_item}')\nprint(fruits)  # {new_set}", language="python")
-                st.success(f"✅ Removed! New set: {new_set}")
+        set_operations_panel()
         
         st.markdown("---")
         st.markdown("#### 🔍 Membership Testing (Very Fast!)")
         
-        check_item = st.text_input("Check if item exists:", value="banana", key="set_check")
-        if st.button("🔍 Check", key="set_check_btn"):
-            exists = check_item in demo_set
-            st.code(f"'{check_item}' in fruits  # {exists}", language="python")
-            if exists:
-                st.success(f"✅ '{check_item}' IS in the set!")
-            else:
-                st.error(f"❌ '{check_item}' is NOT in the set!")
+        membership_panel()
         
         st.markdown("---")
         st.markdown("#### 🎯 Set Math Operations")
@@ -414,50 +492,7 @@ print(my_set)  # {1, 2, 3}""", language="python")
         - **Symmetric Difference (`^`):** Items in either but not both
         """)
         
-        set1_input = st.text_input("Set 1 (comma-separated):", value="1, 2, 3, 4", key="set1_math")
-        set2_input = st.text_input("Set 2 (comma-separated):", value="3, 4, 5, 6", key="set2_math")
-        
-        if st.button("🧮 Calculate Set Operations", key="set_math_btn"):
-            try:
-                set1 = set([item.strip() for item in set1_input.split(",")])
-                set2 = set([item.strip() for item in set2_input.split(",")])
-                
-                st.code(f"set1 = {set1}\nset2 = {set2}", language="python")
-                
-                col_math1, col_math2 = st.columns(2)
-                
-                with col_math1:
-                    # Union
-                    union = set1 | set2
-                    st.markdown("**🔗 Union (|)** - All items from both")
-                    st.code(f"set1 | set2 = {union}", language="python")
-                    st.success(f"Result: {union}")
-                    
-                    st.markdown("")
-                    
-                    # Difference
-                    diff = set1 - set2
-                    st.markdown("**➖ Difference (-)** - In set1 but not set2")
-                    st.code(f"set1 - set2 = {diff}", language="python")
-                    st.info(f"Result: {diff}")
-                
-                with col_math2:
-                    # Intersection
-                    inter = set1 & set2
-                    st.markdown("**🎯 Intersection (&)** - Common items")
-                    st.code(f"set1 & set2 = {inter}", language="python")
-                    st.warning(f"Result: {inter}")
-                    
-                    st.markdown("")
-                    
-                    # Symmetric Difference
-                    sym_diff = set1 ^ set2
-                    st.markdown("**⚡ Symmetric Diff (^)** - In either but not both")
-                    st.code(f"set1 ^ set2 = {sym_diff}", language="python")
-                    st.error(f"Result: {sym_diff}")
-                
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
+        set_math_panel()
         
         st.markdown("---")
         st.markdown("#### 💡 Real-World Set Examples")
@@ -579,41 +614,7 @@ print(f"Only in Class B: {only_b}")
         st.markdown("---")
         st.markdown("#### 🧪 Interactive Comparison")
         
-        comp_input = st.text_input("Enter items (with duplicates):", 
-                                   value="apple, banana, apple, cherry, banana",
-                                   key="comp_input")
-        
-        if st.button("🔄 Convert to All Three", key="convert_all_btn"):
-            items = [item.strip() for item in comp_input.split(",")]
-            
-            col_comp1, col_comp2, col_comp3 = st.columns(3)
-            
-            with col_comp1:
-                st.markdown("### 📚 List")
-                my_list = items
-                st.code(f"list = {my_list}", language="python")
-                st.info(f"Length: {len(my_list)}")
-                st.info(f"Ordered: ✅")
-                st.info(f"Mutable: ✅")
-                st.info(f"Duplicates: ✅")
-            
-            with col_comp2:
-                st.markdown("### 🎯 Tuple")
-                my_tuple = tuple(items)
-                st.code(f"tuple = {my_tuple}", language="python")
-                st.warning(f"Length: {len(my_tuple)}")
-                st.warning(f"Ordered: ✅")
-                st.warning(f"Mutable: ❌")
-                st.warning(f"Duplicates: ✅")
-            
-            with col_comp3:
-                st.markdown("### 🎨 Set")
-                my_set = set(items)
-                st.code(f"set = {my_set}", language="python")
-                st.success(f"Length: {len(my_set)}")
-                st.success(f"Ordered: ❌")
-                st.success(f"Mutable: ✅")
-                st.success(f"Duplicates: ❌")
+        collection_comparison_panel()
     
     # Key takeaways
     st.markdown("---")
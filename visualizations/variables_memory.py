@@ -4,11 +4,120 @@ Shows how variables are stored in memory with visual representation
 """
 
 import streamlit as st
-import random
+import sys
 
-def generate_memory_address():
-    """Generate a fake memory address for visualization"""
-    return f"0x{random.randint(0x1000, 0xFFFF):04X}"
+from visualizations.core.cards import DEFAULT_COLOR, TYPE_COLORS, card, memory_card
+from visualizations.core.memory_model import DIAGRAM_LIMIT, MemoryModel
+from visualizations.core.session_limits import LRU, cache, manage
+from visualizations.core.sizing import deep_getsizeof, format_bytes
+from visualizations.core.value_parser import ValueTooLarge, parse
+
+def save_variable(var_name, var_value):
+    """Assign or update a variable, bumping its version only if its card would change"""
+    memory = st.session_state.memory
+    old = st.session_state.variables.get(var_name)
+
+    if var_value in memory and var_value != var_name:
+        # b = a: bind the name to a's object - no copy is made
+        source = st.session_state.variables[var_value]
+        memory.alias(var_name, var_value)
+        var_type, display_value, alias_of = source['type'], source['display_value'], var_value
+    else:
+        value_to_store, var_type = parse(var_value)
+        if old and not old['alias_of'] and old['type'] == var_type and old['display_value'] == var_value:
+            return
+        memory.bind(var_name, value_to_store)
+        display_value, alias_of = var_value, None
+
+    st.session_state.variables[var_name] = {
+        'type': var_type,
+        'display_value': display_value,
+        'alias_of': alias_of,
+        'version': old['version'] + 1 if old else 1
+    }
+
+def delete_variable(var_name):
+    """Delete button callback - runs before the rerun, so no st.rerun() is needed"""
+    st.session_state.variables.pop(var_name, None)
+    st.session_state.memory.unbind(var_name)
+    st.session_state.memory_cards.pop(var_name, None)
+    st.session_state.variable_sizes.pop(var_name, None)
+
+# Per-student session state kept in check by the session manager. The delete
+# callback runs before start_run(), so these stay unpacked while idle
+manage('variables', cap=500, evict=LRU, on_evict=delete_variable, compact=False)
+manage('memory', compact=False)
+cache('memory_cards')
+cache('variable_sizes')
+
+def variable_card(var_name):
+    """Memory card HTML for a variable, rebuilt only when it or its sharing changes"""
+    var_data = st.session_state.variables[var_name]
+    memory = st.session_state.memory
+    shared = tuple(memory.shared_with(var_name))
+    cached = st.session_state.memory_cards.get(var_name)
+    if cached and cached[0] == (var_data['version'], shared):
+        return cached[1]
+
+    # Choose color based on type
+    color = TYPE_COLORS.get(var_data['type'], DEFAULT_COLOR)
+    html = memory_card(var_name, var_data['display_value'], var_data['type'], color,
+                       memory.address(var_name), shared)
+    st.session_state.memory_cards[var_name] = ((var_data['version'], shared), html)
+    return html
+
+def variable_size(var_name):
+    """(getsizeof, deep size) of a variable's object, recomputed only when its version changes"""
+    version = st.session_state.variables[var_name]['version']
+    cached = st.session_state.variable_sizes.get(var_name)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    obj = st.session_state.memory.value(var_name)
+    sizes = (sys.getsizeof(obj), deep_getsizeof(obj))
+    st.session_state.variable_sizes[var_name] = (version, sizes)
+    return sizes
+
+def workspace_size():
+    """(all objects, this tab's session state) in bytes, recomputed only when a variable changes"""
+    key = tuple((name, data['version']) for name, data in st.session_state.variables.items())
+    cached = st.session_state.get('workspace_size')
+    if cached and cached[0] == key:
+        return cached[1]
+
+    # One seen set, so an object shared by several names is only counted once
+    seen = set()
+    objects = sum(deep_getsizeof(obj, seen) for obj in st.session_state.memory.objects.values())
+    footprint = deep_getsizeof([st.session_state.variables, st.session_state.memory,
+                                st.session_state.memory_cards, st.session_state.variable_sizes])
+    st.session_state.workspace_size = (key, (objects, footprint))
+    return objects, footprint
+
+def show_memory_cost():
+    """Table of what each variable really costs, plus workspace totals"""
+    st.markdown("#### 📏 Memory Cost")
+    rows = []
+    for var_name, var_data in st.session_state.variables.items():
+        shallow, deep = variable_size(var_name)
+        rows.append({
+            'name': var_name,
+            'type': var_data['type'],
+            'getsizeof': shallow,
+            'with contents': deep,
+            'shares object with': ", ".join(st.session_state.memory.shared_with(var_name))
+        })
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+
+    objects, footprint = workspace_size()
+    col_size1, col_size2 = st.columns(2)
+    with col_size1:
+        st.metric("All your objects", format_bytes(objects),
+                  help="Shared objects are counted once")
+    with col_size2:
+        st.metric("This tab's session data", format_bytes(footprint),
+                  help="Everything the server keeps for this tab: objects, cards and bookkeeping")
+    st.caption("💡 Even a small int takes 28 bytes: every Python object carries a type "
+               "pointer and a reference count along with its value.")
 
 def show_variables_visualization():
     """Main function to display the variables & memory visualization"""
@@ -19,7 +128,13 @@ def show_variables_visualization():
     # Initialize session state for variables
     if 'variables' not in st.session_state:
         st.session_state.variables = {}
-        st.session_state.memory_addresses = {}
+        st.session_state.memory = MemoryModel()
+    if 'memory_cards' not in st.session_state:
+        # name -> ((version, names sharing its object), card HTML)
+        st.session_state.memory_cards = {}
+    if 'variable_sizes' not in st.session_state:
+        # name -> (version, (getsizeof, deep size))
+        st.session_state.variable_sizes = {}
     
     # Create two columns: input form and visualization
     col1, col2 = st.columns([1, 2])
@@ -46,44 +161,21 @@ def show_variables_visualization():
             with col_btn2:
                 clear_btn = st.form_submit_button("🗑️ Clear All", use_container_width=True)
         
-        # Handle form submission
+        # Handle form submission - the memory view below is drawn after this,
+        # so it already shows the change without a second run
         if submit_btn and var_name:
-            # Determine the type and store the variable
-            value_to_store = var_value
-            var_type = "str"
-            
-            # Try to parse the value
-            if var_value.lower() in ['true', 'false']:
-                value_to_store = var_value.lower() == 'true'
-                var_type = "bool"
-            elif var_value.isdigit() or (var_value.startswith('-') and var_value[1:].isdigit()):
-                value_to_store = int(var_value)
-                var_type = "int"
-            elif var_value.replace('.', '', 1).isdigit():
-                value_to_store = float(var_value)
-                var_type = "float"
-            elif var_value.startswith("'") or var_value.startswith('"'):
-                value_to_store = var_value.strip("'\"")
-                var_type = "str"
-            
-            # Assign or update variable
-            if var_name not in st.session_state.memory_addresses:
-                # New variable - assign new memory address
-                st.session_state.memory_addresses[var_name] = generate_memory_address()
-            
-            st.session_state.variables[var_name] = {
-                'value': value_to_store,
-                'type': var_type,
-                'display_value': var_value
-            }
-            st.success(f"✅ Variable '{var_name}' saved!")
-            st.rerun()
+            try:
+                save_variable(var_name, var_value)
+                st.success(f"✅ Variable '{var_name}' saved!")
+            except ValueTooLarge as error:
+                st.error(f"❌ {error}")
         
         if clear_btn:
             st.session_state.variables = {}
-            st.session_state.memory_addresses = {}
+            st.session_state.memory.clear()
+            st.session_state.memory_cards = {}
+            st.session_state.variable_sizes = {}
             st.success("🗑️ All variables cleared!")
-            st.rerun()
         
         # Show variable count
         if st.session_state.variables:
@@ -105,66 +197,20 @@ def show_variables_visualization():
             # Display variables as memory boxes
             st.write("#### Computer Memory")
             
-            for var_name, var_data in st.session_state.variables.items():
-                memory_addr = st.session_state.memory_addresses[var_name]
-                value = var_data['value']
-                var_type = var_data['type']
-                display_value = var_data['display_value']
-                
-                # Choose color based on type
-                type_colors = {
-                    'int': '#4CAF50',
-                    'float': '#2196F3',
-                    'str': '#FF9800',
-                    'bool': '#9C27B0'
-                }
-                color = type_colors.get(var_type, '#757575')
-                
-                # Create a beautiful card for each variable
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, {color}22 0%, {color}44 100%);
-                    border-left: 5px solid {color};
-                    padding: 1.5rem;
-                    border-radius: 10px;
-                    margin: 1rem 0;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                ">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <div style="flex: 1;">
-                            <div style="font-size: 0.9rem; color: #666; margin-bottom: 0.5rem;">
-                                📍 Memory: <code>{memory_addr}</code>
-                            </div>
-                            <div style="font-size: 1.5rem; font-weight: bold; color: {color}; margin-bottom: 0.5rem;">
-                                {var_name}
-                            </div>
-                            <div style="font-size: 1.8rem; font-weight: bold; color: #333;">
-                                = {display_value}
-                            </div>
-                        </div>
-                        <div style="text-align: right;">
-                            <div style="
-                                background: {color};
-                                color: white;
-                                padding: 0.5rem 1rem;
-                                border-radius: 20px;
-                                font-size: 0.9rem;
-                                font-weight: bold;
-                            ">
-                                {var_type}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Add delete button
-                col_del1, col_del2, col_del3 = st.columns([1, 1, 3])
-                with col_del1:
-                    if st.button(f"🗑️ Delete", key=f"del_{var_name}"):
-                        del st.session_state.variables[var_name]
-                        del st.session_state.memory_addresses[var_name]
-                        st.rerun()
+            # Unchanged cards come out identical, so the browser keeps them as they are
+            for var_name in st.session_state.variables:
+                card(variable_card(var_name))
+                st.button("🗑️ Delete", key=f"del_{var_name}", on_click=delete_variable, args=(var_name,))
+            
+            # Arrows from names to the objects they refer to
+            st.markdown("#### 🔗 Names → Objects")
+            if len(st.session_state.memory) <= DIAGRAM_LIMIT:
+                st.graphviz_chart(st.session_state.memory.to_dot())
+            else:
+                st.caption(f"The diagram is hidden above {DIAGRAM_LIMIT} variables - "
+                           "the cards show which names share an object.")
+            
+            show_memory_cost()
             
             # Show Python code equivalent
             st.markdown("---")
@@ -172,7 +218,10 @@ def show_variables_visualization():
             code_lines = []
             for var_name, var_data in st.session_state.variables.items():
                 display_value = var_data['display_value']
-                if var_data['type'] == 'str' and not (display_value.startswith("'") or display_value.startswith('"')):
+                # Only still an alias if the other name hasn't been rebound since
+                if var_data['alias_of'] in st.session_state.memory.shared_with(var_name):
+                    code_lines.append(f"{var_name} = {var_data['alias_of']}")
+                elif var_data['type'] == 'str' and not (display_value.startswith("'") or display_value.startswith('"')):
                     code_lines.append(f"{var_name} = '{display_value}'")
                 else:
                     code_lines.append(f"{var_name} = {display_value}")
@@ -194,7 +243,8 @@ def show_variables_visualization():
         **What is memory?**
         - Your computer has memory (RAM) where it stores information
         - Each storage location has an **address** (like a house address)
-        - Addresses are in hexadecimal format (like `0x1A4F`)
+        - Addresses are in hexadecimal format (like `0x7f3a2c1b4e10`)
+        - The addresses shown here are real: they come from Python's `id()`
         
         **What happens when you create a variable?**
         1. Python finds empty space in memory
@@ -212,6 +262,8 @@ def show_variables_visualization():
         - Create a variable called `balance` with value `100`
         - Create another called `deposit` with value `50`
         - See how each gets its own memory location!
-        - Change `balance` to `150` - see how the address stays the same but value changes!
+        - Create `saved` with value `balance` - both names now point to the **same** object!
+        - Change `balance` to `150` - numbers can't change, so `balance` moves to a new object while `saved` keeps the old one
+        - Give two variables the value `10`: Python keeps one shared object for small numbers like this
         """)
 